@@ -0,0 +1,42 @@
+"""
+Benchmarks BlockAllocator against TreeBlockAllocator.
+
+Each workload allocates many small blocks, frees every other one to
+fragment the heap, then allocates blocks too large for the holes.
+
+Run with::
+
+    python benchmarks/benchmark_block_allocator.py
+
+"""
+import time
+import supriya.realtime
+
+
+def run_workload(allocator_class, block_count):
+    allocator = allocator_class(heap_maximum=block_count * 8)
+    start_time = time.time()
+    block_ids = [allocator.allocate(2) for _ in range(block_count)]
+    for block_id in block_ids[::2]:
+        allocator.free(block_id)
+    for _ in range(block_count // 4):
+        allocator.allocate(4)
+    for block_id in block_ids[1::2]:
+        allocator.free(block_id)
+    return time.time() - start_time
+
+
+def main():
+    for block_count in (250, 1000, 4000):
+        print('{} blocks'.format(block_count))
+        for allocator_class in (
+            supriya.realtime.BlockAllocator,
+            supriya.realtime.TreeBlockAllocator,
+            ):
+            seconds = run_workload(allocator_class, block_count)
+            print('    {:<20} {:>8.3f} s'.format(
+                allocator_class.__name__, seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmarks Clock scheduling jitter at dense event rates.
+
+Schedules many procedures with short constant deltas, then reports how
+late, on average and at worst, the clock called them, and how many threads
+were alive while it ran.
+
+Run with::
+
+    python benchmarks/benchmark_clock.py
+
+"""
+import threading
+import time
+import supriya.patterns
+
+
+class Procedure:
+
+    def __init__(self, delta, count):
+        self.count = count
+        self.delta = delta
+
+    def __call__(self, execution_time, scheduled_time):
+        self.count -= 1
+        if self.count:
+            return self.delta
+
+
+def main():
+    for procedure_count, delta in ((1, 0.001), (16, 0.005), (64, 0.01)):
+        clock = supriya.patterns.Clock()
+        duration = 1.
+        for _ in range(procedure_count):
+            clock.schedule(Procedure(delta, int(duration / delta)), delta)
+        thread_count = threading.active_count()
+        time.sleep(duration + 0.1)
+        print(
+            '{:>3} procedures every {:>5.3f}s: {:>6} calls, '
+            'mean lateness {:.6f}s, maximum lateness {:.6f}s, '
+            '{} threads'.format(
+                procedure_count,
+                delta,
+                clock.event_count,
+                clock.mean_lateness,
+                clock.maximum_lateness,
+                thread_count,
+                ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmarks the compiled OSC codec against the generic, per-value codec.
+
+Run with::
+
+    python benchmarks/benchmark_osc_codec.py
+
+"""
+import timeit
+import supriya.osc
+
+
+def make_messages():
+    return {
+        'meter reply': supriya.osc.OscMessage(
+            '/levels/postfader', 1000, 1, *([0.5, 0.25] * 8)),
+        'node set': supriya.osc.OscMessage(
+            '/n_set', 1000, 'amplitude', 0.5, 'frequency', 440.0),
+        'status reply': supriya.osc.OscMessage(
+            '/status.reply', 1, 0, 0, 2, 4, 0.125, 0.25, 44100.0, 44100.0),
+        }
+
+
+def benchmark(label, statement, number):
+    seconds = min(timeit.repeat(statement, number=number, repeat=5))
+    print('    {:<24} {:>8.2f} us'.format(label, seconds / number * 1e6))
+    return seconds
+
+
+def main(number=10000):
+    OscMessage = supriya.osc.OscMessage
+    for name, message in sorted(make_messages().items()):
+        datagram = message.to_datagram()
+        view = memoryview(bytearray(datagram))
+        print('{} ({} bytes)'.format(name, len(datagram)))
+        generic = benchmark(
+            'decode (generic)',
+            lambda: OscMessage._from_datagram_generic(datagram),
+            number,
+            )
+        compiled = benchmark(
+            'decode (compiled)',
+            lambda: OscMessage.from_datagram(view),
+            number,
+            )
+        print('    {:<24} {:>8.2f}x'.format('decode speedup', generic / compiled))
+        generic = benchmark(
+            'encode (generic)',
+            message._to_datagram_generic,
+            number,
+            )
+        compiled = benchmark(
+            'encode (compiled)',
+            message.to_datagram,
+            number,
+            )
+        print('    {:<24} {:>8.2f}x'.format('encode speedup', generic / compiled))
+    bundle = supriya.osc.OscBundle(
+        contents=[make_messages()['meter reply']] * 32,
+        )
+    datagram = bundle.to_datagram()
+    print('bundle of 32 meter replies ({} bytes)'.format(len(datagram)))
+    benchmark(
+        'decode',
+        lambda: supriya.osc.OscBundle.from_datagram(datagram),
+        number // 10,
+        )
+    benchmark('encode', bundle.to_datagram, number // 10)
+
+
+if __name__ == '__main__':
+    main()
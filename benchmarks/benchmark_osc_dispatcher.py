@@ -0,0 +1,52 @@
+"""
+Benchmarks OscDispatcher dispatch cost as registered callbacks grow.
+
+Run with::
+
+    python benchmarks/benchmark_osc_dispatcher.py
+
+"""
+import timeit
+import supriya.osc
+
+
+def make_dispatcher(callback_count):
+    dispatcher = supriya.osc.OscDispatcher()
+    for i in range(callback_count):
+        dispatcher.register_callback(supriya.osc.OscCallback(
+            address_pattern='/levels/{}'.format(i),
+            procedure=lambda message: None,
+            ))
+        dispatcher.register_callback(supriya.osc.OscCallback(
+            address_pattern='/tr',
+            argument_template=(1000 + i,),
+            procedure=lambda message: None,
+            ))
+    dispatcher.register_callback(supriya.osc.OscCallback(
+        address_pattern='/n_*',
+        procedure=lambda message: None,
+        ))
+    return dispatcher
+
+
+def main(number=10000):
+    messages = [
+        supriya.osc.OscMessage('/levels/0', 1000, 1, 0.5, 0.5),
+        supriya.osc.OscMessage('/tr', 1000, 0, 0.5),
+        supriya.osc.OscMessage('/n_set', 1000, 'amplitude', 0.5),
+        ]
+    for callback_count in (1, 10, 100, 1000):
+        dispatcher = make_dispatcher(callback_count)
+        seconds = min(timeit.repeat(
+            lambda: [dispatcher(message) for message in messages],
+            number=number,
+            repeat=5,
+            ))
+        print('{:>5} callbacks per kind: {:>8.2f} us per message'.format(
+            callback_count,
+            seconds / number / len(messages) * 1e6,
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmarks querying a server's node tree, with controls, as it grows to
+tens of thousands of synths spread across groups.
+
+Requires ``scsynth``.
+
+Run with::
+
+    python benchmarks/benchmark_query_tree.py
+
+"""
+import time
+import supriya.assets.synthdefs
+import supriya.realtime
+
+
+def main(group_count=100, synths_per_group=(10, 100, 200)):
+    server = supriya.realtime.Server().boot(
+        maximum_node_count=65536, memory_size=2 ** 18)
+    synthdef = supriya.assets.synthdefs.default
+    synthdef.allocate(server=server)
+    groups = [
+        supriya.realtime.Group().allocate(target_node=server)
+        for _ in range(group_count)
+        ]
+    synth_count = 0
+    try:
+        for count in synths_per_group:
+            for group in groups:
+                for _ in range(count - synth_count // group_count):
+                    supriya.realtime.Synth(synthdef, amplitude=0.0).allocate(
+                        target_node=group)
+            synth_count = count * group_count
+            server.sync()
+            start_time = time.time()
+            query_tree_group = server.query_remote_nodes(
+                include_controls=True)
+            print('{:>6} synths: {:.3f}s, {}'.format(
+                synth_count,
+                time.time() - start_time,
+                'complete' if query_tree_group is not None else 'timed out',
+                ))
+    finally:
+        server.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmarks getting a ready server, by booting and quitting one each time
+or by acquiring and releasing one from a ServerPool.
+
+Requires ``scsynth``.
+
+Run with::
+
+    python benchmarks/benchmark_server_pool.py
+
+"""
+import statistics
+import time
+import supriya.realtime
+
+
+def use_server(server):
+    group = supriya.realtime.Group().allocate(target_node=server)
+    supriya.realtime.Buffer().allocate(frame_count=512, server=server)
+    supriya.realtime.Synth().allocate(target_node=group)
+
+
+def cold_boots(iterations):
+    latencies = []
+    for _ in range(iterations):
+        start_time = time.time()
+        server = supriya.realtime.Server(port=57760).boot()
+        latencies.append(time.time() - start_time)
+        use_server(server)
+        server.quit()
+    return latencies
+
+
+def pooled_boots(iterations):
+    latencies = []
+    with supriya.realtime.ServerPool(server_count=2) as server_pool:
+        for _ in range(iterations):
+            start_time = time.time()
+            server = server_pool.acquire()
+            latencies.append(time.time() - start_time)
+            use_server(server)
+            server_pool.release(server)
+        print('{:>16}: {}'.format(
+            'pool boots',
+            ', '.join('{:.3f}s'.format(_) for _ in server_pool.boot_latencies),
+            ))
+        print('{:>16}: mean {:.3f}s'.format(
+            'pool resets', statistics.mean(server_pool.reset_latencies)))
+    return latencies
+
+
+def main(iterations=20):
+    for label, function in (
+        ('cold boots', cold_boots),
+        ('pooled boots', pooled_boots),
+        ):
+        latencies = function(iterations)
+        print('{:>16}: mean {:.3f}s, max {:.3f}s'.format(
+            label, statistics.mean(latencies), max(latencies)))
+
+
+if __name__ == '__main__':
+    main()
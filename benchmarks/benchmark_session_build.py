@@ -0,0 +1,55 @@
+"""
+Benchmarks building non-realtime sessions of many synths, with and without
+deferred propagation.
+
+Adds synths all at one offset, then staggered over many offsets. Without
+deferred propagation only the smallest sessions are built, as each edit
+re-applies every transition at the offsets it touches.
+
+Run with::
+
+    python benchmarks/benchmark_session_build.py
+
+"""
+import contextlib
+import time
+import supriya.nonrealtime
+
+
+def build_simultaneous(session, synth_count):
+    with session.at(0):
+        for _ in range(synth_count):
+            session.add_synth(duration=10)
+
+
+def build_staggered(session, synth_count):
+    for i in range(synth_count):
+        with session.at(i * 0.01):
+            session.add_synth(duration=5)
+
+
+def main():
+    for build in (build_simultaneous, build_staggered):
+        for synth_count, defer in (
+            (300, False),
+            (300, True),
+            (1000, True),
+            (10000, True),
+            ):
+            session = supriya.nonrealtime.Session(0, 2)
+            context_manager = contextlib.ExitStack()
+            if defer:
+                context_manager = session.defer_propagation()
+            start_time = time.time()
+            with context_manager:
+                build(session, synth_count)
+            print('{:>18}: {:>5} synths, {:<8} {:.2f}s'.format(
+                build.__name__,
+                synth_count,
+                'deferred' if defer else 'eager',
+                time.time() - start_time,
+                ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Benchmarks recompiling a non-realtime session after a small edit.
+
+Builds a session with many short synths, compiles it, appends one synth,
+then compiles it again, first reusing the compiled offsets and then from
+scratch.
+
+Run with::
+
+    python benchmarks/benchmark_session_compile.py
+
+"""
+import time
+import supriya.nonrealtime
+
+
+def build_session(event_count):
+    session = supriya.nonrealtime.Session(0, 2)
+    for i in range(event_count):
+        with session.at(i * 0.25):
+            session.add_synth(duration=0.5, frequency=440 + i % 100)
+    return session
+
+
+def time_compile(session):
+    start_time = time.time()
+    session.to_osc_bundles()
+    return time.time() - start_time
+
+
+def main():
+    for event_count in (1000, 10000):
+        session = build_session(event_count)
+        initial_time = time_compile(session)
+        with session.at(event_count * 0.25):
+            session.add_synth(duration=0.5)
+        incremental_time = time_compile(session)
+        session._compiled_offsets.clear()
+        full_time = time_compile(session)
+        print(
+            '{:>6} events: initial {:.3f}s, after edit {:.3f}s '
+            '(from scratch {:.3f}s)'.format(
+                event_count,
+                initial_time,
+                incremental_time,
+                full_time,
+                ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Benchmarks adding states to a non-realtime session with many offsets.
+
+Clones a state at each of many shuffled offsets, so each new state lands
+somewhere among the session's existing offsets, then looks up the states
+neighbouring every offset.
+
+Run with::
+
+    python benchmarks/benchmark_session_offsets.py
+
+"""
+import random
+import time
+import supriya.nonrealtime
+
+
+def main():
+    for offset_count in (10000, 50000, 200000):
+        offsets = [i * 0.25 for i in range(1, offset_count + 1)]
+        random.Random(0).shuffle(offsets)
+        session = supriya.nonrealtime.Session(0, 2)
+        start_time = time.time()
+        for offset in offsets:
+            session._find_state_at(offset, clone_if_missing=True)
+        insert_time = time.time() - start_time
+        start_time = time.time()
+        for offset in offsets:
+            session._find_state_before(offset, with_node_tree=True)
+            session._find_state_after(offset, with_node_tree=True)
+        lookup_time = time.time() - start_time
+        print(
+            '{:>6} offsets: insert {:.2f}s, neighbour lookups {:.2f}s'.format(
+                len(session.offsets),
+                insert_time,
+                lookup_time,
+                ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmarks the memory held by a non-realtime session's states.
+
+Builds a session with many overlapping long synths, so every offset's state
+holds a large node tree, then reports the memory allocated while building
+it.
+
+Run with::
+
+    python benchmarks/benchmark_session_states.py
+
+"""
+import time
+import tracemalloc
+import supriya.nonrealtime
+
+
+def build_session(event_count, concurrency):
+    session = supriya.nonrealtime.Session(0, 2)
+    for i in range(event_count):
+        with session.at(i * 0.25):
+            session.add_synth(duration=concurrency * 0.25)
+    return session
+
+
+def main():
+    for event_count, concurrency in ((1000, 100), (1000, 500)):
+        tracemalloc.start()
+        start_time = time.time()
+        session = build_session(event_count, concurrency)
+        elapsed_time = time.time() - start_time
+        _, peak_size = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            '{:>6} events, {:>5} concurrent: {:.1f}MB peak, {:.2f}s '
+            '({} states)'.format(
+                event_count,
+                concurrency,
+                peak_size / 2 ** 20,
+                elapsed_time,
+                len(session.states),
+                ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmarks building SynthDefs: flattening, cleaning up, optimizing and
+topologically sorting their ugen graphs.
+
+Rebuilds every bundled SynthDef from its ugens, builds one SynthDef per
+ugen class in ``supriya.ugens`` which builds from default arguments, then
+builds SynthDefFactory SynthDefs with many iterations and wide multichannel
+expansion.
+
+Run with::
+
+    python benchmarks/benchmark_synthdef_build.py
+
+"""
+import inspect
+import time
+import supriya.assets.synthdefs
+import supriya.synthdefs
+import supriya.ugens
+
+
+def build_asset_synthdefs():
+    synthdefs = [
+        value for value in vars(supriya.assets.synthdefs).values()
+        if isinstance(value, supriya.synthdefs.SynthDef)
+        ]
+    for synthdef in synthdefs:
+        supriya.synthdefs.SynthDef(synthdef.ugens, name=synthdef.name)
+    return len(synthdefs)
+
+
+def build_ugen_synthdefs():
+    count = 0
+    for name in sorted(dir(supriya.ugens)):
+        ugen_class = getattr(supriya.ugens, name)
+        if (
+            not inspect.isclass(ugen_class) or
+            not issubclass(ugen_class, supriya.ugens.UGen) or
+            inspect.isabstract(ugen_class)
+            ):
+            continue
+        for rate in ('ar', 'kr', 'ir'):
+            try:
+                with supriya.synthdefs.SynthDefBuilder() as builder:
+                    getattr(ugen_class, rate)()
+                builder.build()
+                count += 1
+                break
+            except Exception:
+                continue
+    return count
+
+
+def signal_block(builder, source, state):
+    for _ in range(state.get('iterations') or 2):
+        source = supriya.ugens.AllpassC.ar(
+            decay_time=supriya.ugens.ExpRand.ir(0.01, 0.1),
+            delay_time=supriya.ugens.ExpRand.ir(0.01, 0.1),
+            source=source,
+            maximum_delay_time=0.1,
+            ) * 0.5 + source
+    return source
+
+
+def build_factory_synthdefs(iterations, channel_count):
+    factory = supriya.synthdefs.SynthDefFactory(channel_count=channel_count)
+    factory = factory.with_input()
+    factory = factory.with_output()
+    factory = factory.with_signal_block(signal_block)
+    synthdef = factory.build(iterations=iterations)
+    return len(synthdef.ugens)
+
+
+def main():
+    for label, build in (
+        ('asset synthdefs', build_asset_synthdefs),
+        ('ugen synthdefs', build_ugen_synthdefs),
+        ('100 iterations', lambda: build_factory_synthdefs(100, 1)),
+        ('16 channels', lambda: build_factory_synthdefs(16, 16)),
+        ('50 x 8 channels', lambda: build_factory_synthdefs(50, 8)),
+        ):
+        start_time = time.time()
+        count = build()
+        print('{:>16}: {:>5}, {:.2f}s'.format(
+            label, count, time.time() - start_time))
+
+
+if __name__ == '__main__':
+    main()
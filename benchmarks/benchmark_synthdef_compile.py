@@ -0,0 +1,52 @@
+"""
+Benchmarks compiling SynthDefs repeatedly, with and without the SynthDef
+cache.
+
+Compiles every bundled SynthDef, under its own and its anonymous name, as
+sessions and servers do each time they send SynthDefs.
+
+Run with::
+
+    python benchmarks/benchmark_synthdef_compile.py
+
+"""
+import time
+import supriya.assets.synthdefs
+import supriya.synthdefs
+
+
+def compile_uncached(synthdefs):
+    compiler = supriya.synthdefs.SynthDefCompiler
+    for synthdef in synthdefs:
+        compiler.compile_synthdefs([synthdef])
+        compiler.compile_synthdefs([synthdef], use_anonymous_names=True)
+
+
+def compile_cached(synthdefs):
+    synthdef_cache = supriya.synthdefs.SynthDefCache.get_default_cache()
+    for synthdef in synthdefs:
+        synthdef_cache.compile_synthdef(synthdef)
+        synthdef_cache.compile_synthdef(synthdef, use_anonymous_name=True)
+
+
+def main():
+    synthdefs = [
+        value for value in vars(supriya.assets.synthdefs).values()
+        if isinstance(value, supriya.synthdefs.SynthDef)
+        ]
+    iterations = 1000
+    for compile_ in (compile_uncached, compile_cached):
+        supriya.synthdefs.SynthDefCache.get_default_cache().clear()
+        start_time = time.time()
+        for _ in range(iterations):
+            compile_(synthdefs)
+        print('{:>16}: {} synthdefs x {}, {:.2f}s'.format(
+            compile_.__name__,
+            len(synthdefs),
+            iterations,
+            time.time() - start_time,
+            ))
+
+
+if __name__ == '__main__':
+    main()
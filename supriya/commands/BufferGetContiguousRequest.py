@@ -91,6 +91,8 @@ class BufferGetContiguousRequest(Request):
         return {
             supriya.commands.BufferSetContiguousResponse: {
                 'buffer_id': self.buffer_id,
+                # Tells apart replies to pipelined requests.
+                'index_count_pairs': self.index_count_pairs,
                 },
             supriya.commands.FailResponse: {
                 'failed_command': '/b_getn',
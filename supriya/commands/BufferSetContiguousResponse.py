@@ -48,6 +48,13 @@ class BufferSetContiguousResponse(Response, collections.Sequence):
     def buffer_id(self):
         return self._buffer_id
 
+    @property
+    def index_count_pairs(self):
+        return tuple(
+            (item.starting_sample_index, len(item.sample_values))
+            for item in self.items
+            )
+
     @property
     def items(self):
         return self._items
@@ -1,25 +1,72 @@
+import collections
+import supriya.osc
 from supriya.commands.Request import Request
 
 
 class GroupFreeAllRequest(Request):
+    """
+    A /g_freeAll request.
+
+    ::
+
+        >>> import supriya.commands
+        >>> request = supriya.commands.GroupFreeAllRequest(
+        ...     group_ids=0,
+        ...     )
+        >>> request
+        GroupFreeAllRequest(
+            group_ids=(0,),
+            )
+
+    ::
+
+        >>> message = request.to_osc_message()
+        >>> message
+        OscMessage(24, 0)
+
+    ::
+
+        >>> message.address == supriya.commands.RequestId.GROUP_FREE_ALL
+        True
+
+    """
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ()
+    __slots__ = (
+        '_group_ids',
+        )
 
     ### INITIALIZER ###
 
-    def __init__(self):
+    def __init__(
+        self,
+        group_ids=None
+        ):
         Request.__init__(self)
-        raise NotImplementedError
+        if not isinstance(group_ids, collections.Sequence):
+            group_ids = (group_ids,)
+        group_ids = tuple(int(_) for _ in group_ids)
+        self._group_ids = group_ids
 
     ### PUBLIC METHODS ###
 
     def to_osc_message(self, with_textual_osc_command=False):
-        raise NotImplementedError
+        if with_textual_osc_command:
+            request_id = self.request_command
+        else:
+            request_id = int(self.request_id)
+        contents = [request_id]
+        contents.extend(self.group_ids)
+        message = supriya.osc.OscMessage(*contents)
+        return message
 
     ### PUBLIC PROPERTIES ###
 
+    @property
+    def group_ids(self):
+        return self._group_ids
+
     @property
     def response_specification(self):
         return None
@@ -80,7 +80,10 @@ class GroupQueryTreeRequest(Request):
     def response_specification(self):
         import supriya.commands
         return {
-            supriya.commands.QueryTreeResponse: None,
+            supriya.commands.QueryTreeResponse: {
+                # Tells apart replies to concurrent requests.
+                'node_id': self.node_id,
+                },
             }
 
     @property
@@ -1,4 +1,5 @@
 import abc
+import asyncio
 import collections
 import threading
 import time
@@ -12,6 +13,8 @@ class Request(SupriyaValueObject):
 
     __slots__ = (
         '_condition',
+        '_future',
+        '_loop',
         '_response',
         )
 
@@ -23,6 +26,8 @@ class Request(SupriyaValueObject):
         self,
         ):
         self._condition = threading.Condition()
+        self._future = None
+        self._loop = None
         self._response = None
 
     ### SPECIAL METHODS ###
@@ -50,6 +55,11 @@ class Request(SupriyaValueObject):
             completion_message = bytearray(completion_message)
             contents.append(completion_message)
 
+    @staticmethod
+    def _resolve_future(future, response):
+        if not future.done():
+            future.set_result(response)
+
     ### PUBLIC METHODS ###
 
     def communicate(
@@ -86,6 +96,47 @@ class Request(SupriyaValueObject):
             return None
         return self._response
 
+    async def communicate_async(
+        self,
+        message=None,
+        server=None,
+        sync=True,
+        timeout=1.0,
+        ):
+        """
+        Communicates with `server` without blocking the event loop.
+
+        `server` must be an ``AsyncServer``; the reply is awaited on a
+        future resolved when the server's response dispatcher handles
+        the matching response.
+
+        Returns response or none.
+        """
+        import supriya.realtime
+        server = server or supriya.realtime.AsyncServer.get_default_server()
+        assert isinstance(server, supriya.realtime.AsyncServer)
+        assert server.is_running
+        message = message or self.to_osc_message()
+        if not sync or self.response_specification is None:
+            server.send_message(message)
+            return None
+        self._loop = server.loop
+        self._future = self._loop.create_future()
+        future = self._future
+        callback = self.response_callback
+        with server.response_dispatcher.lock:
+            server.register_response_callback(callback)
+            server.send_message(message)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            server.unregister_response_callback(callback)
+            print('TIMED OUT:', repr(self))
+            return None
+        finally:
+            self._future = None
+            self._loop = None
+
     @abc.abstractmethod
     def to_osc_message(self, with_textual_osc_command=False):
         raise NotImplementedError
@@ -116,6 +167,16 @@ class Request(SupriyaValueObject):
         with self.condition:
             self._response = response
             self.condition.notify()
+        if self._future is None:
+            return
+        elif self._loop is not None:
+            self._loop.call_soon_threadsafe(
+                self._resolve_future,
+                self._future,
+                response,
+                )
+        else:
+            self._resolve_future(self._future, response)
 
     @property
     def response_callback(self):
@@ -0,0 +1,185 @@
+import concurrent.futures
+import functools
+import supriya.osc
+from supriya.system.SupriyaObject import SupriyaObject
+
+
+class RequestPipeline(SupriyaObject):
+    """
+    A request pipeline.
+
+    Packs many requests into as few OSC bundles as fit within
+    `maximum_datagram_size` bytes, sends them back-to-back, and returns one
+    future per request, resolved by the server's response dispatcher as
+    replies arrive.
+
+    ::
+
+        >>> import supriya.commands
+        >>> pipeline = supriya.commands.RequestPipeline(
+        ...     maximum_datagram_size=64,
+        ...     )
+        >>> pipeline.add_requests(
+        ...     supriya.commands.NodeQueryRequest(node_id)
+        ...     for node_id in range(1000, 1005)
+        ...     )
+        >>> for bundle in pipeline.to_osc_bundles(True):
+        ...     bundle
+        ...
+        OscBundle(
+            contents=(
+                OscMessage('/n_query', 1000),
+                OscMessage('/n_query', 1001),
+                ),
+            )
+        OscBundle(
+            contents=(
+                OscMessage('/n_query', 1002),
+                OscMessage('/n_query', 1003),
+                ),
+            )
+        OscBundle(
+            contents=(
+                OscMessage('/n_query', 1004),
+                ),
+            )
+
+    ::
+
+        >>> futures = pipeline.communicate(server=server)  # doctest: +SKIP
+        >>> [future.result(timeout=1).node_id for future in futures]  # doctest: +SKIP
+        [1000, 1001, 1002, 1003, 1004]
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        '_maximum_datagram_size',
+        '_requests',
+        )
+
+    _bundle_header_size = 16
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        requests=None,
+        maximum_datagram_size=1472,
+        ):
+        maximum_datagram_size = int(maximum_datagram_size)
+        assert self._bundle_header_size < maximum_datagram_size
+        self._maximum_datagram_size = maximum_datagram_size
+        self._requests = []
+        if requests is not None:
+            self.add_requests(requests)
+
+    ### SPECIAL METHODS ###
+
+    def __len__(self):
+        return len(self._requests)
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _handle_done_future(server, callback, future):
+        if future.cancelled():
+            server.unregister_response_callback(callback)
+
+    def _make_future(self, request, server):
+        import supriya.realtime
+        if isinstance(server, supriya.realtime.AsyncServer):
+            future = server.loop.create_future()
+            request._loop = server.loop
+        else:
+            future = concurrent.futures.Future()
+            request._loop = None
+        request._future = future
+        return future
+
+    def _pack_messages(self, messages):
+        packs, pack, pack_size = [], [], self._bundle_header_size
+        for message in messages:
+            message_size = 4 + len(message.to_datagram())
+            if pack and self.maximum_datagram_size < pack_size + message_size:
+                packs.append(pack)
+                pack, pack_size = [], self._bundle_header_size
+            pack.append(message)
+            pack_size += message_size
+        if pack:
+            packs.append(pack)
+        return packs
+
+    ### PUBLIC METHODS ###
+
+    def add_request(self, request):
+        import supriya.commands
+        assert isinstance(request, supriya.commands.Request)
+        self._requests.append(request)
+
+    def add_requests(self, requests):
+        for request in requests:
+            self.add_request(request)
+
+    def communicate(self, server=None, sync=True):
+        """
+        Sends all requests to `server`.
+
+        When `sync` is true, returns a list of futures, one per request, in
+        request order. Requests without a response specification receive an
+        already-resolved future. Futures are ``concurrent.futures.Future``
+        instances for a ``Server`` and event loop futures for an
+        ``AsyncServer``. Cancelling a future unregisters its callback.
+
+        Returns list of futures or none.
+        """
+        import supriya.realtime
+        server = server or supriya.realtime.Server.get_default_server()
+        prototype = (supriya.realtime.Server, supriya.realtime.AsyncServer)
+        assert isinstance(server, prototype)
+        assert server.is_running
+        if not sync:
+            for osc_bundle in self.to_osc_bundles():
+                server.send_message(osc_bundle)
+            return None
+        futures = []
+        with server.response_dispatcher.lock:
+            for request in self.requests:
+                future = self._make_future(request, server)
+                futures.append(future)
+                if request.response_specification is None:
+                    future.set_result(None)
+                    continue
+                callback = request.response_callback
+                server.register_response_callback(callback)
+                future.add_done_callback(functools.partial(
+                    self._handle_done_future,
+                    server,
+                    callback,
+                    ))
+            for osc_bundle in self.to_osc_bundles():
+                server.send_message(osc_bundle)
+        return futures
+
+    def to_osc_bundles(self, with_textual_osc_command=False):
+        messages = [
+            request.to_osc_message(
+                with_textual_osc_command=with_textual_osc_command,
+                )
+            for request in self.requests
+            ]
+        return [
+            supriya.osc.OscBundle(contents=pack)
+            for pack in self._pack_messages(messages)
+            ]
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def maximum_datagram_size(self):
+        return self._maximum_datagram_size
+
+    @property
+    def requests(self):
+        return tuple(self._requests)
@@ -61,6 +61,20 @@ class ResponseManager(SupriyaObject):
             node_id=1023,
             )
 
+    ::
+
+        >>> message = supriya.osc.OscMessage('/n_setn', 1023, 0, 2, 0.5, 0.25)
+        >>> manager.handle_message(message)
+        NodeSetContiguousResponse(
+            items=(
+                NodeSetContiguousItem(
+                    control_values=(0.5, 0.25),
+                    starting_control_index_or_name=0,
+                    ),
+                ),
+            node_id=1023,
+            )
+
     ::
 
         >>> message = supriya.osc.OscMessage('/b_setn', 1, 0, 8, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
@@ -320,7 +334,7 @@ class ResponseManager(SupriyaObject):
             control_count = remainder[1]
             control_values = tuple(remainder[2:2 + control_count])
             item = supriya.commands.NodeSetContiguousItem(
-                control_index_or_name=control_index_or_name,
+                starting_control_index_or_name=control_index_or_name,
                 control_values=control_values,
                 )
             items.append(item)
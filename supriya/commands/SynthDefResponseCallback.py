@@ -29,6 +29,7 @@ class SynthDefResponseCallback(ResponseCallback):
 
     def __call__(self, response):
         synthdef_name = response.synthdef_name
+        self._server.synthdef_residency.discard(synthdef_name)
         synthdef = self._server._synthdefs.get(synthdef_name)
         if synthdef is None:
             return
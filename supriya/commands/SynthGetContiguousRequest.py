@@ -1,28 +1,99 @@
+import supriya.osc
 from supriya.commands.Request import Request
 
 
 class SynthGetContiguousRequest(Request):
+    """
+    A /s_getn request.
+
+    ::
+
+        >>> import supriya.commands
+        >>> request = supriya.commands.SynthGetContiguousRequest(
+        ...     node_id=1000,
+        ...     index_count_pairs=[(0, 2), (4, 1)],
+        ...     )
+        >>> request
+        SynthGetContiguousRequest(
+            index_count_pairs=(
+                (0, 2),
+                (4, 1),
+                ),
+            node_id=1000,
+            )
+
+    ::
+
+        >>> message = request.to_osc_message()
+        >>> message
+        OscMessage(45, 1000, 0, 2, 4, 1)
+
+    ::
+
+        >>> message.address == supriya.commands.RequestId.SYNTH_GET_CONTIGUOUS
+        True
+
+    """
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ()
+    __slots__ = (
+        '_index_count_pairs',
+        '_node_id',
+        )
 
     ### INITIALIZER ###
 
-    def __init__(self):
+    def __init__(
+        self,
+        node_id=None,
+        index_count_pairs=None,
+        ):
         Request.__init__(self)
-        raise NotImplementedError
+        self._node_id = int(node_id)
+        self._index_count_pairs = tuple(
+            (index, int(count))
+            for index, count in index_count_pairs
+            )
 
     ### PUBLIC METHODS ###
 
     def to_osc_message(self, with_textual_osc_command=False):
-        raise NotImplementedError
+        if with_textual_osc_command:
+            request_id = self.request_command
+        else:
+            request_id = int(self.request_id)
+        contents = [
+            request_id,
+            self.node_id,
+            ]
+        for index, count in self.index_count_pairs:
+            contents.append(index)
+            contents.append(count)
+        message = supriya.osc.OscMessage(*contents)
+        return message
 
     ### PUBLIC PROPERTIES ###
 
+    @property
+    def index_count_pairs(self):
+        return self._index_count_pairs
+
+    @property
+    def node_id(self):
+        return self._node_id
+
     @property
     def response_specification(self):
-        return None
+        import supriya.commands
+        return {
+            supriya.commands.NodeSetContiguousResponse: {
+                'node_id': self.node_id,
+                },
+            supriya.commands.FailResponse: {
+                'failed_command': '/s_getn',
+                },
+            }
 
     @property
     def request_id(self):
@@ -67,6 +67,7 @@ class Buffer(SessionObject):
     def _set_event(self, item, value, offset=None):
         if offset < 0 or self.duration < offset:
             return
+        self.session._invalidate_offsets(offset)
         events = self._events.setdefault(item, [])
         new_event = (offset, value)
         if not events:
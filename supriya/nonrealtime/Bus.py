@@ -117,6 +117,7 @@ class Bus(SessionObject):
 
     def _set_at_offset(self, offset, value):
         assert self.calculation_rate == supriya.synthdefs.CalculationRate.CONTROL
+        self.session._invalidate_offsets(offset)
         events = self._events
         event = (offset, value)
         if not events:
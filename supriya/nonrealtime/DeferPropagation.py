@@ -0,0 +1,78 @@
+class DeferPropagation:
+    """
+    Context manager which defers propagation of node hierarchy changes across
+    a session's states until it exits.
+
+    Each edit otherwise re-applies the transitions of every state it touches,
+    so building many nodes at one offset takes quadratic time. Deferred
+    edits propagate once, in offset order, when the outermost context
+    manager exits.
+
+    ::
+
+        >>> import supriya.nonrealtime
+        >>> session = supriya.nonrealtime.Session()
+        >>> with session.defer_propagation():
+        ...     with session.at(0):
+        ...         group = session.add_group(duration=10)
+        ...         for _ in range(3):
+        ...             synth = group.add_synth(duration=5)
+        ...
+
+    ::
+
+        >>> print(session.to_strings())
+        0.0:
+            NODE TREE 0 group
+                1000 group
+                    1003 default
+                    1002 default
+                    1001 default
+        5.0:
+            NODE TREE 0 group
+                1000 group
+        10.0:
+            NODE TREE 0 group
+
+    Node trees read inside the context manager may lag behind its edits.
+    Node methods which depend on them, like ``delete()``, ``split()`` and
+    ``get_parentage()``, propagate deferred changes first.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Session Internals'
+
+    __slots__ = (
+        '_is_outermost',
+        '_session',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, session):
+        self._session = session
+        self._is_outermost = False
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self):
+        if self.session._deferred_offsets is None:
+            self.session._deferred_offsets = set()
+            self._is_outermost = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if not self._is_outermost:
+            return
+        self._is_outermost = False
+        try:
+            self.session._apply_deferred_transitions()
+        finally:
+            self.session._deferred_offsets = None
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def session(self):
+        return self._session
@@ -71,6 +71,7 @@ class Node(SessionObject):
             clone_if_missing=True,
             )
         state.start_nodes.add(node)
+        self.session._invalidate_offsets(node.start_offset)
         if node not in state.nodes_to_children:
             state.nodes_to_children[node] = None
         state = self.session._find_state_at(
@@ -78,6 +79,7 @@ class Node(SessionObject):
             clone_if_missing=True,
             )
         state.stop_nodes.add(node)
+        self.session._invalidate_offsets(node.stop_offset)
         self.move_node(node, add_action=add_action)
         self.session.nodes.insert(node)
         self.session._apply_transitions([node.start_offset, node.stop_offset])
@@ -110,6 +112,8 @@ class Node(SessionObject):
         old_duration = self._duration
         if old_duration == new_duration:
             return
+        # Synths with a duration parameter are created with their duration.
+        self.session._invalidate_offsets(self.start_offset)
         with self.session.at(self.stop_offset, propagate=False) as moment:
             if self in moment.state.stop_nodes:
                 moment.state.stop_nodes.remove(self)
@@ -183,6 +187,7 @@ class Node(SessionObject):
         """
         if offset < self.start_offset or self.stop_offset <= offset:
             return
+        self.session._invalidate_offsets(offset)
         events = self._events.setdefault(item, [])
         new_event = (offset, value)
         if not events:
@@ -250,6 +255,7 @@ class Node(SessionObject):
                 new_actions[child] = action
             new_actions.update(old_actions)
             state._transitions = new_actions
+            self.session._invalidate_offsets(split_offset, stop_offset)
             self._fixup_events(new_node, split_offset)
             self._fixup_duration(split_offset - start_offset)
             self._fixup_node_actions(new_node, split_offset, stop_offset)
@@ -327,6 +333,8 @@ class Node(SessionObject):
         offset=None,
         ):
         import supriya.nonrealtime
+        # The parentage check needs transitions added earlier applied.
+        self.session._apply_deferred_transitions()
         state = self.session.active_moments[-1].state
         if state.nodes_to_parents is None:
             state._desparsify()
@@ -342,9 +350,13 @@ class Node(SessionObject):
             action=add_action,
             )
         state.transitions[node] = node_action
+        self.session._invalidate_offsets(state.offset)
         self.session._apply_transitions([state.offset, node.stop_offset])
 
     def delete(self):
+        self.session._apply_deferred_transitions()
+        # Transitions are rebuilt from here onward.
+        self.session._invalidate_offsets(self.start_offset, float('inf'))
         start_state = self.session._find_state_at(self.start_offset)
         start_state.start_nodes.remove(self)
         stop_state = self.session._find_state_at(self.stop_offset)
@@ -376,6 +388,7 @@ class Node(SessionObject):
         assert new_duration > 0
         if self.duration == new_duration:
             return
+        self.session._apply_deferred_transitions()
         if new_duration < self.duration:
             split_offset = self.start_offset + new_duration
             if clip_children:
@@ -434,6 +447,7 @@ class Node(SessionObject):
         offset=None,
         ):
         assert self.session.active_moments
+        self.session._apply_deferred_transitions()
         state = self.session.active_moments[-1].state
         self.session._apply_transitions(state.offset)
         shards = self._split(
@@ -451,6 +465,7 @@ class Node(SessionObject):
 
     @SessionObject.require_offset
     def inspect_children(self, offset=None):
+        self.session._apply_deferred_transitions()
         this_state = self.session._find_state_at(offset, clone_if_missing=True)
         prev_state = self.session._find_state_before(this_state.offset, True)
         prev_state._desparsify()
@@ -490,6 +505,7 @@ class Node(SessionObject):
 
     @SessionObject.require_offset
     def get_parent(self, offset=None):
+        self.session._apply_deferred_transitions()
         state = self.session._find_state_at(offset, clone_if_missing=True)
         if not state.nodes_to_children:
             state = self.session._find_state_before(state.offset, True)
@@ -499,6 +515,7 @@ class Node(SessionObject):
 
     @SessionObject.require_offset
     def get_parentage(self, offset=None):
+        self.session._apply_deferred_transitions()
         state = self.session._find_state_at(offset, clone_if_missing=True)
         if not state.nodes_to_children:
             state = self.session._find_state_before(state.offset, True)
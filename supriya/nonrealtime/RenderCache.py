@@ -0,0 +1,278 @@
+import contextlib
+import hashlib
+import json
+import os
+import pathlib
+import shutil
+import subprocess
+import threading
+import time
+from supriya.system.SupriyaObject import SupriyaObject
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+class RenderCache(SupriyaObject):
+    """
+    A persistent, content-addressed cache of rendered sound files.
+
+    Entries are keyed on a render's content hash, as computed by
+    :py:class:`~supriya.nonrealtime.SessionRenderer.SessionRenderer`, so
+    identical sessions render only once, across render directories and
+    projects. The cache keeps an index file alongside its entries and
+    evicts the least-recently-used entries once it outgrows
+    `maximum_size` bytes. Index updates hold a lock file, so processes can
+    share the cache.
+
+    ::
+
+        >>> import pathlib, tempfile
+        >>> import supriya.nonrealtime
+        >>> directory_path = pathlib.Path(tempfile.mkdtemp())
+        >>> render_cache = supriya.nonrealtime.RenderCache(
+        ...     directory_path=directory_path / 'cache',
+        ...     maximum_size=1024,
+        ...     )
+        >>> source_path = directory_path / 'source.aiff'
+        >>> _ = source_path.write_bytes(b'x' * 100)
+
+    ::
+
+        >>> render_cache.store('session-abc', source_path)
+        >>> 'session-abc' in render_cache
+        True
+
+    ::
+
+        >>> target_path = directory_path / 'target.aiff'
+        >>> render_cache.restore('session-abc', target_path)
+        True
+        >>> target_path.read_bytes() == source_path.read_bytes()
+        True
+
+    ::
+
+        >>> render_cache.restore('session-xyz', target_path)
+        False
+
+    The default render cache is configured by the ``render_cache_path`` and
+    ``render_cache_size`` options in the ``core`` section of supriya's
+    configuration file, and is none when no path is configured.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Session Internals'
+
+    __slots__ = (
+        '_directory_path',
+        '_index',
+        '_lock',
+        '_maximum_size',
+        )
+
+    _default_maximum_size = 2 ** 31
+
+    _index_file_name = 'index.json'
+
+    _lock_file_name = 'index.lock'
+
+    _scsynth_versions = {}
+
+    ### INITIALIZER ###
+
+    def __init__(self, directory_path, maximum_size=None):
+        directory_path = pathlib.Path(directory_path).expanduser().absolute()
+        directory_path.mkdir(parents=True, exist_ok=True)
+        if maximum_size is None:
+            maximum_size = self._default_maximum_size
+        maximum_size = int(maximum_size)
+        assert 0 < maximum_size
+        self._directory_path = directory_path
+        self._lock = threading.RLock()
+        self._maximum_size = maximum_size
+        self._index = self._read_index()
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, key):
+        with self._lock:
+            self._index = self._read_index()
+            return key in self._index
+
+    def __len__(self):
+        with self._lock:
+            self._index = self._read_index()
+            return len(self._index)
+
+    ### PRIVATE METHODS ###
+
+    def _evict(self):
+        entries = sorted(
+            self._index.items(),
+            key=lambda item: item[1]['accessed'],
+            )
+        size = sum(entry['size'] for _, entry in entries)
+        while entries and self.maximum_size < size:
+            key, entry = entries.pop(0)
+            self._remove_entry(key)
+            size -= entry['size']
+
+    def _get_entry_path(self, key):
+        return self.directory_path / hashlib.md5(key.encode()).hexdigest()
+
+    @contextlib.contextmanager
+    def _locked(self):
+        # Serializes index updates across threads, then across processes.
+        lock_path = self.directory_path / self._lock_file_name
+        with self._lock, lock_path.open('a') as file_pointer:
+            if fcntl is not None:
+                fcntl.flock(file_pointer.fileno(), fcntl.LOCK_EX)
+            else:
+                file_pointer.seek(0)
+                msvcrt.locking(file_pointer.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                self._index = self._read_index()
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(file_pointer.fileno(), fcntl.LOCK_UN)
+                else:
+                    file_pointer.seek(0)
+                    msvcrt.locking(file_pointer.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _read_index(self):
+        index_path = self.directory_path / self._index_file_name
+        try:
+            with index_path.open() as file_pointer:
+                index = json.load(file_pointer)
+        except (IOError, ValueError):
+            return {}
+        return {
+            key: entry for key, entry in index.items()
+            if self._get_entry_path(key).exists()
+            }
+
+    def _remove_entry(self, key):
+        # Another process may have removed the file already.
+        self._index.pop(key, None)
+        try:
+            self._get_entry_path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _write_index(self):
+        # Write-and-rename so concurrent readers never see a partial index.
+        index_path = self.directory_path / self._index_file_name
+        temporary_path = index_path.with_suffix('.{}'.format(os.getpid()))
+        with temporary_path.open('w') as file_pointer:
+            json.dump(self._index, file_pointer, indent=0, sort_keys=True)
+        os.replace(str(temporary_path), str(index_path))
+
+    ### PUBLIC METHODS ###
+
+    def clear(self):
+        """
+        Removes all entries from the render cache.
+        """
+        with self._locked():
+            for key in tuple(self._index):
+                self._remove_entry(key)
+            self._write_index()
+
+    @classmethod
+    def get_default_render_cache(cls):
+        """
+        Gets the render cache configured in supriya's configuration file.
+
+        Returns render cache or none.
+        """
+        import supriya
+        directory_path = supriya.config.get(
+            'core', 'render_cache_path', fallback=None)
+        if not directory_path:
+            return None
+        maximum_size = supriya.config.get(
+            'core', 'render_cache_size', fallback=None)
+        return cls(directory_path, maximum_size=maximum_size)
+
+    @classmethod
+    def get_scsynth_version(cls, scsynth_path='scsynth'):
+        """
+        Gets the version string reported by `scsynth_path`.
+
+        Returns string or none.
+        """
+        if scsynth_path not in cls._scsynth_versions:
+            try:
+                output = subprocess.check_output(
+                    [scsynth_path, '-v'],
+                    stderr=subprocess.STDOUT,
+                    )
+                version = output.decode().strip() or None
+            except (OSError, subprocess.CalledProcessError):
+                version = None
+            cls._scsynth_versions[scsynth_path] = version
+        return cls._scsynth_versions[scsynth_path]
+
+    def restore(self, key, file_path):
+        """
+        Copies the entry for `key` to `file_path`, if cached.
+
+        Returns true if restored, otherwise false.
+        """
+        file_path = pathlib.Path(file_path)
+        with self._locked():
+            if key not in self._index:
+                return False
+            try:
+                shutil.copyfile(str(self._get_entry_path(key)), str(file_path))
+            except FileNotFoundError:
+                self._remove_entry(key)
+                self._write_index()
+                return False
+            self._index[key]['accessed'] = time.time()
+            self._write_index()
+        return True
+
+    def store(self, key, file_path):
+        """
+        Copies `file_path` into the render cache under `key`, evicting the
+        least-recently-used entries as necessary.
+        """
+        file_path = pathlib.Path(file_path)
+        size = file_path.stat().st_size
+        if self.maximum_size < size:
+            return
+        entry_path = self._get_entry_path(key)
+        temporary_path = entry_path.with_suffix('.{}-{}'.format(
+            os.getpid(), threading.get_ident()))
+        shutil.copyfile(str(file_path), str(temporary_path))
+        with self._locked():
+            os.replace(str(temporary_path), str(entry_path))
+            self._index[key] = {'accessed': time.time(), 'size': size}
+            self._evict()
+            self._write_index()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory_path(self):
+        return self._directory_path
+
+    @property
+    def maximum_size(self):
+        return self._maximum_size
+
+    @property
+    def size(self):
+        """
+        Total size of cached entries, in bytes.
+        """
+        with self._lock:
+            self._index = self._read_index()
+            return sum(entry['size'] for entry in self._index.values())
@@ -1,14 +1,13 @@
-import bisect
 import collections
 import os
 import pathlib
-import struct
 import uqbar.io
 import supriya.osc
 import supriya.commands
 import supriya.realtime
 import supriya.soundfiles
 import supriya.synthdefs
+import supriya.system
 import supriya.time
 from queue import PriorityQueue
 from supriya.nonrealtime.SessionObject import SessionObject
@@ -76,6 +75,9 @@ class Session:
         '_audio_output_bus_group',
         '_buffers',
         '_buses',
+        '_compiled_id_mapping',
+        '_compiled_offsets',
+        '_deferred_offsets',
         '_input',
         '_name',
         '_nodes',
@@ -122,9 +124,12 @@ class Session:
             )
         self._active_moments = []
         self._buffers = supriya.time.TimespanCollection(accelerated=True)
+        self._compiled_id_mapping = {}
+        self._compiled_offsets = {}
+        self._deferred_offsets = None
         self._name = name
         self._nodes = supriya.time.TimespanCollection(accelerated=True)
-        self._offsets = []
+        self._offsets = supriya.system.SortedList()
         self._root_node = supriya.nonrealtime.RootNode(self)
         self._session_ids = {}
         self._states = {}
@@ -142,6 +147,7 @@ class Session:
 
     def __graph__(self, include_controls=False):
         import supriya.nonrealtime
+        self._apply_deferred_transitions()
         graph = uqbar.graphs.Graph()
         for offset, state in sorted(self.states.items()):
             if float('-inf') < offset:
@@ -179,22 +185,34 @@ class Session:
         old_state = self._find_state_before(offset)
         state = old_state._clone(offset)
         self.states[offset] = state
-        self.offsets.insert(
-            self.offsets.index(old_state.offset) + 1,
-            offset,
-            )
+        self.offsets.add(offset)
         return state
 
+    def _apply_deferred_transitions(self):
+        """
+        Propagates node hierarchy changes deferred so far, in one pass.
+        """
+        if not self._deferred_offsets:
+            return
+        offsets, self._deferred_offsets = self._deferred_offsets, None
+        try:
+            self._apply_transitions(offsets)
+        finally:
+            self._deferred_offsets = set()
+
     def _apply_transitions(self, offsets, chain=True):
         import supriya.nonrealtime
         if supriya.nonrealtime.DoNotPropagate._stack:
             return
+        if not isinstance(offsets, collections.Iterable):
+            offsets = [offsets]
+        if self._deferred_offsets is not None:
+            # Chaining from the earliest offset later covers every state.
+            self._deferred_offsets.update(offsets)
+            return
         queue = PriorityQueue()
-        try:
-            for offset in offsets:
-                queue.put(offset)
-        except TypeError:
-            queue.put(offsets)
+        for offset in offsets:
+            queue.put(offset)
         previous_offset = None
         while not queue.empty():
             offset = queue.get()
@@ -219,13 +237,20 @@ class Session:
                 state._nodes_to_children = nodes_to_children
                 state._nodes_to_parents = nodes_to_parents
                 changed = True
-            if changed and chain:
-                next_state = self._find_state_after(
-                    offset,
-                    with_node_tree=True,
-                    )
-                if next_state is not None:
-                    queue.put(next_state.offset)
+            if not changed:
+                continue
+            next_state = self._find_state_after(
+                offset,
+                with_node_tree=True,
+                )
+            # Sparse states up to the next node tree order their node
+            # settings by this state's node tree.
+            if next_state is None:
+                self._invalidate_offsets(offset, float('inf'))
+            else:
+                self._invalidate_offsets(offset, next_state.offset)
+            if chain and next_state is not None:
+                queue.put(next_state.offset)
 
     def _build_id_mapping(self):
         id_mapping = {}
@@ -735,19 +760,82 @@ class Session:
             requests.append(request)
         return requests
 
+    def _compile_offset(
+        self,
+        buffer_open_states,
+        buffer_settings,
+        bus_settings,
+        duration,
+        id_mapping,
+        is_last_offset,
+        offset,
+        visited_synthdefs,
+        ):
+        """
+        Compiles the OSC bundle at `offset`, reusing the bundle compiled by
+        a previous call when nothing at `offset` has changed since.
+
+        Updates `buffer_open_states` and `visited_synthdefs` in place.
+
+        Returns OSC bundle or none.
+        """
+        carried_state = (
+            frozenset(buffer_open_states.items()),
+            frozenset(visited_synthdefs),
+            )
+        compiled_offset = self._compiled_offsets.get(offset)
+        if compiled_offset is not None and not is_last_offset:
+            (
+                old_carried_state,
+                (minimum_duration, maximum_duration),
+                new_buffer_open_states,
+                new_visited_synthdefs,
+                osc_bundle,
+                ) = compiled_offset
+            if (
+                old_carried_state == carried_state and
+                minimum_duration <= duration <= maximum_duration
+                ):
+                buffer_open_states.clear()
+                buffer_open_states.update(new_buffer_open_states)
+                visited_synthdefs.update(new_visited_synthdefs)
+                return osc_bundle
+        requests = self._collect_requests_at_offset(
+            buffer_open_states,
+            buffer_settings,
+            bus_settings,
+            duration,
+            id_mapping,
+            is_last_offset,
+            offset,
+            visited_synthdefs,
+            )
+        osc_messages = [_.to_osc_message(True) for _ in requests]
+        if is_last_offset:
+            osc_messages.append(supriya.osc.OscMessage(0))
+        osc_bundle = None
+        if osc_messages:
+            osc_bundle = supriya.osc.OscBundle(
+                timestamp=float(offset),
+                contents=osc_messages,
+                )
+        if not is_last_offset:
+            self._compiled_offsets[offset] = (
+                carried_state,
+                self._get_duration_range(offset, duration),
+                buffer_open_states.copy(),
+                frozenset(visited_synthdefs),
+                osc_bundle,
+                )
+        return osc_bundle
+
     def _find_state_after(self, offset, with_node_tree=None):
-        index = bisect.bisect(self.offsets, offset)
-        if with_node_tree:
-            while index < len(self.offsets):
-                state = self.states[self.offsets[index]]
-                if state.nodes_to_children is not None:
-                    return state
-                index += 1
-            return None
-        if index < len(self.offsets):
-            old_offset = self.offsets[index]
-            if offset < old_offset:
-                return self.states[old_offset]
+        next_offset = self.offsets.higher(offset)
+        while next_offset is not None:
+            state = self.states[next_offset]
+            if not with_node_tree or state.nodes_to_children is not None:
+                return state
+            next_offset = self.offsets.higher(next_offset)
         return None
 
     def _find_state_at(self, offset, clone_if_missing=False):
@@ -756,29 +844,37 @@ class Session:
             old_state = self._find_state_before(offset, with_node_tree=True)
             state = old_state._clone(offset)
             self.states[offset] = state
-            self.offsets.insert(
-                self.offsets.index(old_state.offset) + 1,
-                offset,
-            )
+            self.offsets.add(offset)
         return state
 
     def _find_state_before(self, offset, with_node_tree=None):
-        index = bisect.bisect_left(self.offsets, offset)
-        if index == len(self.offsets):
-            index -= 1
-        old_offset = self.offsets[index]
-        if offset <= old_offset:
-            index -= 1
-        if index < 0:
-            return None
-        if with_node_tree:
-            while 0 <= index:
-                state = self.states[self.offsets[index]]
-                if state.nodes_to_children is not None:
-                    return state
-                index -= 1
-            return None
-        return self.states[self.offsets[index]]
+        previous_offset = self.offsets.lower(offset)
+        while previous_offset is not None:
+            state = self.states[previous_offset]
+            if not with_node_tree or state.nodes_to_children is not None:
+                return state
+            previous_offset = self.offsets.lower(previous_offset)
+        return None
+
+    def _get_duration_range(self, offset, duration):
+        """
+        Gets the range of session durations over which the OSC bundle
+        compiled at `offset` for `duration` stays the same.
+
+        Synths with a duration parameter which outlive the session are
+        created with their duration clipped to the session's.
+        """
+        import supriya.nonrealtime
+        minimum_duration = float('-inf')
+        for node in self.states[offset].start_nodes:
+            if not isinstance(node, supriya.nonrealtime.Synth):
+                continue
+            elif 'duration' not in node.synthdef.parameter_names:
+                continue
+            elif duration < node.stop_offset:
+                return duration, duration
+            minimum_duration = max(minimum_duration, node.stop_offset)
+        return minimum_duration, float('inf')
 
     def _get_next_session_id(self, kind='node'):
         default = 0
@@ -788,6 +884,19 @@ class Session:
         self._session_ids[kind] += 1
         return session_id
 
+    def _invalidate_offsets(self, start_offset, stop_offset=None):
+        """
+        Discards compiled OSC bundles from `start_offset` through
+        `stop_offset` inclusive, or at `start_offset` alone.
+        """
+        if not self._compiled_offsets:
+            return
+        elif stop_offset is None:
+            self._compiled_offsets.pop(start_offset, None)
+            return
+        for offset in self.offsets.irange(start_offset, stop_offset):
+            self._compiled_offsets.pop(offset, None)
+
     def _iterate_state_pairs(
         self,
         offset,
@@ -841,20 +950,23 @@ class Session:
         import supriya.nonrealtime
         offset = float('-inf')
         state = supriya.nonrealtime.State(self, offset)
-        state._nodes_to_children = {self.root_node: ()}
-        state._nodes_to_parents = {self.root_node: None}
+        state._nodes_to_children = supriya.system.PersistentMapping(
+            {self.root_node: ()})
+        state._nodes_to_parents = supriya.system.PersistentMapping(
+            {self.root_node: None})
         self.states[offset] = state
-        self.offsets.append(offset)
+        self.offsets.add(offset)
         offset = 0.0
         state = state._clone(offset)
         self.states[offset] = state
-        self.offsets.append(offset)
+        self.offsets.add(offset)
 
     def _remove_state_at(self, offset):
         state = self._find_state_at(offset, clone_if_missing=False)
         if state is None:
             return
         assert state.is_sparse
+        self._invalidate_offsets(offset)
         self.offsets.remove(offset)
         del(self.states[offset])
         return state
@@ -863,6 +975,7 @@ class Session:
         self,
         duration=None,
         ):
+        self._apply_deferred_transitions()
         id_mapping = self._build_id_mapping()
         if self.duration == float('inf'):
             assert duration is not None and 0 < duration < float('inf')
@@ -871,6 +984,12 @@ class Session:
         if duration not in offsets:
             offsets.append(duration)
             offsets.sort()
+        # New session objects extend the ID mapping; anything else moves IDs.
+        for key, id_ in self._compiled_id_mapping.items():
+            if id_mapping.get(key, id_) != id_:
+                self._compiled_offsets.clear()
+                break
+        self._compiled_id_mapping = id_mapping
         buffer_settings = self._collect_buffer_settings(
             id_mapping,
             )
@@ -880,10 +999,9 @@ class Session:
         buffer_open_states = {}
         visited_synthdefs = set()
         for offset in offsets:
-            osc_messages = []
             if offset == duration:
                 is_last_offset = True
-            requests = self._collect_requests_at_offset(
+            osc_bundle = self._compile_offset(
                 buffer_open_states,
                 buffer_settings,
                 bus_settings,
@@ -893,14 +1011,7 @@ class Session:
                 offset,
                 visited_synthdefs,
                 )
-            osc_messages.extend(_.to_osc_message(True) for _ in requests)
-            if is_last_offset:
-                osc_messages.append(supriya.osc.OscMessage(0))
-            if osc_messages:
-                osc_bundle = supriya.osc.OscBundle(
-                    timestamp=float(offset),
-                    contents=osc_messages,
-                    )
+            if osc_bundle is not None:
                 osc_bundles.append(osc_bundle)
             if is_last_offset:
                 break
@@ -912,6 +1023,8 @@ class Session:
         import supriya.nonrealtime
         offset = float(offset)
         assert 0 <= offset
+        # Moments are the entry point for edits: assume one is coming.
+        self._invalidate_offsets(offset)
         state = self._find_state_at(offset)
         if state:
             assert state.offset in self.states
@@ -1061,6 +1174,18 @@ class Session:
             )
         return buffer_
 
+    def defer_propagation(self):
+        """
+        Defers propagation of node hierarchy changes until the returned
+        context manager exits.
+
+        Use around loops building many nodes.
+
+        Returns context manager.
+        """
+        import supriya.nonrealtime
+        return supriya.nonrealtime.DeferPropagation(self)
+
     @classmethod
     def from_project_settings(
         cls,
@@ -1119,6 +1244,8 @@ class Session:
             )
 
     def rebuild_transitions(self):
+        self._apply_deferred_transitions()
+        self._compiled_offsets.clear()
         for state_one, state_two in self._iterate_state_pairs(
             float('-inf'), with_node_tree=True):
             transitions = state_two._rebuild_transitions(state_one, state_two)
@@ -1135,7 +1262,11 @@ class Session:
         sample_format=supriya.soundfiles.SampleFormat.INT24,
         sample_rate=44100,
         print_transcript=None,
+        render_cache=None,
         transcript_prefix=None,
+        worker_count=None,
+        segment_duration=None,
+        segment_overlap=0.,
         **kwargs
         ):
         import supriya.nonrealtime
@@ -1145,6 +1276,7 @@ class Session:
             session=self,
             header_format=header_format,
             print_transcript=print_transcript,
+            render_cache=render_cache,
             render_directory_path=render_directory_path,
             sample_format=sample_format,
             sample_rate=sample_rate,
@@ -1154,6 +1286,9 @@ class Session:
             output_file_path,
             duration=duration,
             debug=debug,
+            worker_count=worker_count,
+            segment_duration=segment_duration,
+            segment_overlap=segment_overlap,
             **kwargs
             )
         self._transcript = transcript
@@ -1180,18 +1315,10 @@ class Session:
         self,
         duration=None,
         ):
-        osc_bundles = self.to_osc_bundles(
-            duration=duration,
-            )
-        datagrams = []
-        for osc_bundle in osc_bundles:
-            datagram = osc_bundle.to_datagram(realtime=False)
-            size = len(datagram)
-            size = struct.pack('>i', size)
-            datagrams.append(size)
-            datagrams.append(datagram)
-        datagram = b''.join(datagrams)
-        return datagram
+        import supriya.nonrealtime
+        renderer = supriya.nonrealtime.SessionRenderer(session=self)
+        osc_bundles = renderer.to_osc_bundles(duration=duration)
+        return b''.join(renderer._iterate_datagrams(osc_bundles))
 
     def to_lists(
         self,
@@ -1227,6 +1354,7 @@ class Session:
 
     def to_strings(self, include_controls=False, include_timespans=False):
         import supriya.commands
+        self._apply_deferred_transitions()
         result = []
         previous_string = None
         for offset, state in sorted(self.states.items()):
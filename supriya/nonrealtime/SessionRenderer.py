@@ -1,6 +1,9 @@
+import collections
+import concurrent.futures
 import hashlib
 import os
 import pathlib
+import queue
 import shutil
 import struct
 import subprocess
@@ -16,6 +19,7 @@ from supriya.nonrealtime import (
     NonrealtimeRenderError,
     NonrealtimeOutputMissing,
 )
+import supriya.osc
 import supriya.realtime
 import supriya.soundfiles
 import supriya.system
@@ -35,6 +39,7 @@ class SessionRenderer(supriya.system.SupriyaObject):
         '_header_format',
         '_prerender_tuples',
         '_print_transcript',
+        '_render_cache',
         '_render_directory_path',
         '_sample_format',
         '_sample_rate',
@@ -47,6 +52,18 @@ class SessionRenderer(supriya.system.SupriyaObject):
         '_sessionables_to_sessions',
         )
 
+    _scsynth_path = 'scsynth'
+
+    # Header and sample format names which differ in libsndfile.
+    _wavefile_formats = {
+        'INT8': 'PCM_S8',
+        'INT16': 'PCM_16',
+        'INT24': 'PCM_24',
+        'INT32': 'PCM_32',
+        'MULAW': 'ULAW',
+        'NEXT': 'AU',
+        }
+
     ### INITIALIZER ###
 
     def __init__(
@@ -54,11 +71,13 @@ class SessionRenderer(supriya.system.SupriyaObject):
         session,
         header_format=supriya.soundfiles.HeaderFormat.AIFF,
         print_transcript=None,
+        render_cache=None,
         render_directory_path=None,
         sample_format=supriya.soundfiles.SampleFormat.INT24,
         sample_rate=44100,
         transcript_prefix=None,
         ):
+        import supriya.nonrealtime
         self._session = session
 
         self._header_format = supriya.soundfiles.HeaderFormat.from_expr(
@@ -68,6 +87,13 @@ class SessionRenderer(supriya.system.SupriyaObject):
             print_transcript = bool(print_transcript)
         self._print_transcript = print_transcript
 
+        if render_cache is None:
+            render_cache = \
+                supriya.nonrealtime.RenderCache.get_default_render_cache()
+        assert isinstance(
+            render_cache, (supriya.nonrealtime.RenderCache, type(None)))
+        self._render_cache = render_cache
+
         self._render_directory_path = pathlib.Path(
             render_directory_path or
             supriya.output_path
@@ -87,26 +113,15 @@ class SessionRenderer(supriya.system.SupriyaObject):
 
     ### PRIVATE METHODS ###
 
-    def _build_datagram(self, osc_bundles):
-        datagrams = []
-        for osc_bundle in osc_bundles:
-            datagram = osc_bundle.to_datagram(realtime=False)
-            size = len(datagram)
-            size = struct.pack('>i', size)
-            datagrams.append(size)
-            datagrams.append(datagram)
-        datagram = b''.join(datagrams)
-        return datagram
-
     def _build_file_path(
         self,
-        datagram,
+        datagrams,
         input_file_path,
         session,
         ):
-        #print('BUILDING FILE PATH')
         md5 = hashlib.md5()
-        md5.update(datagram)
+        for datagram in datagrams:
+            md5.update(datagram)
         hash_values = []
         if input_file_path is not None:
             hash_values.append(input_file_path)
@@ -138,7 +153,7 @@ class SessionRenderer(supriya.system.SupriyaObject):
         server_options = server_options or supriya.realtime.ServerOptions()
         if os.environ.get('TRAVIS', None):
             server_options = utils.new(server_options, load_synthdefs=True)
-        scsynth_path = 'scsynth'
+        scsynth_path = self._scsynth_path
         if not uqbar.io.find_executable(scsynth_path):
             raise RuntimeError('Cannot find scsynth')
         if session_osc_file_path.is_absolute():
@@ -160,6 +175,33 @@ class SessionRenderer(supriya.system.SupriyaObject):
         command = ' '.join(str(_) for _ in parts)
         return command
 
+    def _build_render_cache_key(
+        self,
+        renderable_prefix,
+        input_file_path=None,
+        segment_duration=None,
+        segment_overlap=0.,
+        server_options=None,
+        ):
+        import supriya.nonrealtime
+        parts = [renderable_prefix.name]
+        if server_options is not None:
+            # Key on the version of the scsynth the render command runs.
+            scsynth_paths = uqbar.io.find_executable(self._scsynth_path)
+            scsynth_path = (scsynth_paths or [self._scsynth_path])[0]
+            parts.append(supriya.nonrealtime.RenderCache.get_scsynth_version(
+                scsynth_path))
+            parts.append(server_options.as_options_string(realtime=False))
+        # Segments restart synths at each split, so differ from whole renders.
+        if segment_duration is not None:
+            parts.extend([
+                'segments', float(segment_duration), float(segment_overlap)])
+        # Input files not rendered here are keyed on their path only.
+        if input_file_path is not None and pathlib.Path(input_file_path).exists():
+            stat = pathlib.Path(input_file_path).stat()
+            parts.extend([stat.st_size, stat.st_mtime_ns])
+        return ' '.join(str(part) for part in parts)
+
     def _build_render_yml(self, session_prefixes):
         session_prefixes = session_prefixes[:]
         render_data = {'render': session_prefixes.pop(), 'source': None}
@@ -172,11 +214,119 @@ class SessionRenderer(supriya.system.SupriyaObject):
             )
         return render_yaml
 
+    def _build_segments(
+        self,
+        session,
+        osc_bundles,
+        segment_offsets,
+        segment_overlap=0.,
+        ):
+        """
+        Splits `session`'s compiled `osc_bundles` at `segment_offsets` into
+        independently renderable segments.
+
+        Segments after the first open with a setup bundle which replays
+        earlier synthdefs and control bus settings and recreates the groups
+        outliving the segment's start. Messages stopping nodes and buffers
+        at a split offset stay with the earlier segment, which plays on for
+        `segment_overlap` seconds to let releases ring out.
+
+        Returns list of start offset and OSC bundle list pairs.
+        """
+        import supriya.commands
+        import supriya.realtime
+        id_mapping = session._compiled_id_mapping
+        replay_addresses = ('/c_fill', '/c_set', '/c_setn', '/d_recv')
+        replayed_messages, pending_messages = [], []
+        segments, index = [], 0
+        start_offsets = [0.] + list(segment_offsets)
+        stop_offsets = list(segment_offsets) + [None]
+        for start_offset, stop_offset in zip(start_offsets, stop_offsets):
+            segment_bundles = []
+            if start_offset:
+                contents = list(replayed_messages)
+                state = session._find_state_before(
+                    start_offset, with_node_tree=True)
+                carried_nodes = set(session.states[start_offset].overlap_nodes)
+                for parent, child in state._iterate_node_pairs(
+                    session.root_node, state.nodes_to_children):
+                    if child not in carried_nodes:
+                        continue
+                    request = supriya.commands.GroupNewRequest(
+                        add_action=supriya.realtime.AddAction.ADD_TO_TAIL,
+                        node_id=id_mapping[child],
+                        target_node_id=id_mapping[parent],
+                        )
+                    contents.append(request.to_osc_message(True))
+                contents.extend(pending_messages)
+                replayed_messages.extend(
+                    osc_message for osc_message in pending_messages
+                    if osc_message.address in replay_addresses
+                    )
+                segment_bundles.append(supriya.osc.OscBundle(
+                    timestamp=0.,
+                    contents=contents,
+                    ))
+            pending_messages = []
+            while index < len(osc_bundles):
+                osc_bundle = osc_bundles[index]
+                timestamp = osc_bundle.timestamp
+                if stop_offset is not None and stop_offset <= timestamp:
+                    break
+                index += 1
+                segment_bundles.append(supriya.osc.OscBundle(
+                    timestamp=timestamp - start_offset,
+                    contents=osc_bundle.contents,
+                    ))
+                replayed_messages.extend(
+                    osc_message for osc_message in osc_bundle.contents
+                    if osc_message.address in replay_addresses
+                    )
+            if stop_offset is not None:
+                state = session.states[stop_offset]
+                stop_ids = {
+                    '/b_': set(id_mapping[_] for _ in state.stop_buffers),
+                    '/n_': set(id_mapping[_] for _ in state.stop_nodes),
+                    }
+                stop_messages = []
+                if (
+                    index < len(osc_bundles) and
+                    osc_bundles[index].timestamp == stop_offset
+                    ):
+                    for osc_message in osc_bundles[index].contents:
+                        ids = stop_ids.get(osc_message.address[:3], ())
+                        if osc_message.contents[0] in ids:
+                            stop_messages.append(osc_message)
+                        else:
+                            pending_messages.append(osc_message)
+                    index += 1
+                terminator = supriya.osc.OscMessage(0)
+                if segment_overlap:
+                    if stop_messages:
+                        segment_bundles.append(supriya.osc.OscBundle(
+                            timestamp=stop_offset - start_offset,
+                            contents=stop_messages,
+                            ))
+                    segment_bundles.append(supriya.osc.OscBundle(
+                        timestamp=stop_offset - start_offset + segment_overlap,
+                        contents=[terminator],
+                        ))
+                else:
+                    segment_bundles.append(supriya.osc.OscBundle(
+                        timestamp=stop_offset - start_offset,
+                        contents=stop_messages + [terminator],
+                        ))
+            segments.append((start_offset, segment_bundles))
+        return segments
+
     def _build_xrefd_bundles(self, osc_bundles):
+        # Sessions cache their compiled bundles: copy rather than mutate.
         extension = '.{}'.format(self.header_format.name.lower())
+        xrefd_bundles = []
         for osc_bundle in osc_bundles:
+            osc_messages, bundle_changed = [], False
             for osc_message in osc_bundle.contents:
-                contents = list(osc_message.contents)
+                contents, message_changed = list(osc_message.contents), False
                 for i, x in enumerate(contents):
                     x = self._sessionable_to_session(x)
                     try:
@@ -186,8 +336,20 @@ class SessionRenderer(supriya.system.SupriyaObject):
                         continue
                     renderable_file_path = self.renderable_prefixes[x].with_suffix(extension)
                     contents[i] = str(renderable_file_path)
-                osc_message._contents = tuple(contents)
-        return osc_bundles
+                    message_changed = bundle_changed = True
+                if message_changed:
+                    osc_message = supriya.osc.OscMessage(
+                        osc_message.address,
+                        *contents
+                        )
+                osc_messages.append(osc_message)
+            if bundle_changed:
+                osc_bundle = supriya.osc.OscBundle(
+                    timestamp=osc_bundle.timestamp,
+                    contents=osc_messages,
+                    )
+            xrefd_bundles.append(osc_bundle)
+        return xrefd_bundles
 
     def _build_dependency_graph_and_nonxrefd_osc_bundles_conditionally(
         self, expr, parent):
@@ -220,7 +382,12 @@ class SessionRenderer(supriya.system.SupriyaObject):
     def _call_subprocess(self, command):
         return subprocess.call(command, shell=True)
 
-    def _stream_subprocess(self, command, session_duration):
+    def _stream_subprocess(
+        self,
+        command,
+        session_duration,
+        progress_bar_position=None,
+        ):
         process = subprocess.Popen(
             command,
             shell=True,
@@ -231,6 +398,7 @@ class SessionRenderer(supriya.system.SupriyaObject):
         progress_bar = tqdm.tqdm(
             bar_format=(
                 ),
+            position=progress_bar_position,
             total=int(session_duration * 1000),
             unit='ms',
             )
@@ -290,10 +458,66 @@ class SessionRenderer(supriya.system.SupriyaObject):
             input_file_path = self.get_path_relative_to_render_path(
                 input_file_path, self.render_directory_path)
             self.session_input_paths[session] = input_file_path
-        datagram = self._build_datagram(osc_bundles)
         renderable_prefix = self._build_file_path(
-            datagram, input_file_path, session).with_suffix('')
-        return (session, datagram, input_, osc_bundles), renderable_prefix
+            self._iterate_datagrams(osc_bundles),
+            input_file_path,
+            session,
+            ).with_suffix('')
+        return (session, input_, osc_bundles), renderable_prefix
+
+    def _find_segment_offsets(self, session, duration, segment_duration):
+        """
+        Finds offsets at least `segment_duration` seconds apart at which
+        `session` can be split for segmented rendering.
+
+        Only groups may outlive a split offset, and only beneath other
+        groups which do: synths and buffers carry state which cannot be
+        recreated.
+
+        Returns list of offsets.
+        """
+        import supriya.nonrealtime
+        segment_offsets = []
+        minimum_offset = segment_duration
+        for offset in session.offsets:
+            if offset < minimum_offset:
+                continue
+            elif duration <= offset:
+                break
+            state = session.states[offset]
+            if state.overlap_buffers:
+                continue
+            overlap_nodes = set(state.overlap_nodes)
+            if overlap_nodes:
+                nodes_to_parents = session._find_state_before(
+                    offset, with_node_tree=True).nodes_to_parents
+                if any(
+                    not isinstance(node, supriya.nonrealtime.Group) or (
+                        nodes_to_parents[node] is not session.root_node and
+                        nodes_to_parents[node] not in overlap_nodes
+                        )
+                    for node in overlap_nodes
+                    ):
+                    continue
+            segment_offsets.append(offset)
+            minimum_offset = offset + segment_duration
+        return segment_offsets
+
+    def _get_relative_file_path(self, file_path):
+        cwd = pathlib.Path.cwd()
+        if file_path.is_absolute() and cwd in file_path.parents:
+            return file_path.relative_to(cwd)
+        return file_path
+
+    def _iterate_datagrams(self, osc_bundles):
+        """
+        Iterates over `osc_bundles` as a non-realtime score, one
+        length-prefixed bundle at a time.
+        """
+        for osc_bundle in osc_bundles:
+            datagram = osc_bundle.to_datagram(realtime=False)
+            yield struct.pack('>i', len(datagram))
+            yield datagram
 
     def _render_datagram(
         self,
@@ -301,6 +525,8 @@ class SessionRenderer(supriya.system.SupriyaObject):
         input_file_path,
         output_file_path,
         session_osc_file_path,
+        duration=None,
+        progress_bar_position=None,
         **kwargs
         ):
         relative_session_osc_file_path = session_osc_file_path
@@ -323,7 +549,11 @@ class SessionRenderer(supriya.system.SupriyaObject):
                 server_options=server_options,
                 )
             self._report('    Command: {}'.format(command))
-            exit_code = self._stream_subprocess(command, session.duration)
+            exit_code = self._stream_subprocess(
+                command,
+                duration or session.duration,
+                progress_bar_position=progress_bar_position,
+                )
             server_options = utils.new(
                 server_options,
                 memory_size=memory_size * (2**factor),
@@ -344,6 +574,267 @@ class SessionRenderer(supriya.system.SupriyaObject):
         except FileNotFoundError:
             return None
 
+    def _render_in_parallel(
+        self,
+        worker_count,
+        skipped_renderables=None,
+        **kwargs
+        ):
+        """
+        Renders prerender tuples across `worker_count` threads, each
+        waiting on its own scsynth process, starting each renderable once
+        all of its dependencies have rendered.
+
+        Falls back to rendering serially if any job fails.
+        """
+        skipped_renderables = skipped_renderables or ()
+        prerender_tuples = collections.OrderedDict(
+            (prerender_tuple[0], prerender_tuple)
+            for prerender_tuple in self.prerender_tuples
+            if prerender_tuple[0] not in skipped_renderables
+            )
+        dependencies = {
+            renderable: set(self.dependency_graph.children(renderable))
+            for renderable in prerender_tuples
+            }
+        exit_codes, futures, positions = {}, {}, list(range(worker_count))
+        failed = False
+        with concurrent.futures.ThreadPoolExecutor(worker_count) as executor:
+            while prerender_tuples or futures:
+                for renderable in list(prerender_tuples):
+                    if failed or not positions:
+                        break
+                    elif dependencies[renderable]:
+                        continue
+                    prerender_tuple = prerender_tuples.pop(renderable)
+                    position = positions.pop(0)
+                    future = executor.submit(
+                        self._render_prerender_tuple,
+                        prerender_tuple,
+                        progress_bar_position=position,
+                        **kwargs
+                        )
+                    futures[future] = renderable, position
+                if not futures:
+                    break
+                done, _ = concurrent.futures.wait(
+                    futures,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                    )
+                for future in done:
+                    renderable, position = futures.pop(future)
+                    positions.append(position)
+                    try:
+                        exit_codes[renderable] = future.result()
+                    except BaseException as exception:
+                        self._report('    Parallel render failed: {!r}'.format(
+                            exception))
+                        failed = True
+                        continue
+                    for dependencies_ in dependencies.values():
+                        dependencies_.discard(renderable)
+        if failed:
+            self._report('Falling back to serial rendering.')
+            skipped_renderables = set(skipped_renderables)
+            skipped_renderables.update(exit_codes)
+            exit_codes.update(self._render_serially(
+                skipped_renderables=skipped_renderables,
+                **kwargs
+                ))
+        return exit_codes
+
+    def _render_prerender_tuple(
+        self,
+        prerender_tuple,
+        progress_bar_position=None,
+        **kwargs
+        ):
+        import supriya.nonrealtime
+        extension = '.{}'.format(self.header_format.name.lower())
+        renderable = prerender_tuple[0]
+        renderable_prefix = self.renderable_prefixes[renderable]
+        output_file_path = renderable_prefix.with_suffix(extension)
+        if not isinstance(renderable, supriya.nonrealtime.Session):
+            render_cache_key = self._build_render_cache_key(renderable_prefix)
+            if self._restore_from_render_cache(
+                render_cache_key, output_file_path):
+                return 0
+            renderable.__render__(
+                output_file_path=output_file_path,
+                print_transcript=self.print_transcript,
+                )
+            self._store_in_render_cache(render_cache_key, output_file_path)
+            return 0
+        (session, input_, osc_bundles) = prerender_tuple
+        osc_file_path = renderable_prefix.with_suffix('.osc')
+        input_file_path = self.session_input_paths.get(session)
+        self._write_datagrams(
+            osc_file_path, self._iterate_datagrams(osc_bundles))
+        render_cache_key = self._build_render_cache_key(
+            renderable_prefix,
+            input_file_path=(
+                None if input_ in self.renderable_prefixes
+                else input_file_path
+                ),
+            server_options=utils.new(session._options, **kwargs),
+            )
+        if self._restore_from_render_cache(render_cache_key, output_file_path):
+            return 0
+        try:
+            exit_code = self._render_datagram(
+                session,
+                input_file_path,
+                output_file_path,
+                osc_file_path,
+                progress_bar_position=progress_bar_position,
+                **kwargs
+                )
+        except Exception:
+            output_file_path.unlink()
+            sys.exit(1)
+        if exit_code:
+            self._report('    SuperCollider errored!')
+            raise NonrealtimeRenderError(exit_code)
+        self._store_in_render_cache(render_cache_key, output_file_path)
+        return exit_code
+
+    def _render_segment(
+        self,
+        session,
+        osc_bundles,
+        progress_bar_positions=None,
+        **kwargs
+        ):
+        """
+        Renders one segment of `session`, skipping segments rendered by an
+        earlier, interrupted render.
+
+        Returns output file path.
+        """
+        extension = '.{}'.format(self.header_format.name.lower())
+        segment_prefix = self._build_file_path(
+            self._iterate_datagrams(osc_bundles),
+            None,
+            session,
+            ).with_suffix('')
+        output_file_path = segment_prefix.with_suffix(extension)
+        if output_file_path.exists():
+            self._report('Skipped {}. Output already exists.'.format(
+                output_file_path))
+            return output_file_path
+        osc_file_path = segment_prefix.with_suffix('.osc')
+        self._write_datagrams(
+            osc_file_path, self._iterate_datagrams(osc_bundles))
+        # Render beside the output, so only complete segments are skipped.
+        partial_file_path = segment_prefix.with_suffix('.partial' + extension)
+        if partial_file_path.exists():
+            partial_file_path.unlink()
+        progress_bar_position = None
+        if progress_bar_positions is not None:
+            progress_bar_position = progress_bar_positions.get()
+        try:
+            exit_code = self._render_datagram(
+                session,
+                None,
+                partial_file_path,
+                osc_file_path,
+                duration=osc_bundles[-1].timestamp,
+                progress_bar_position=progress_bar_position,
+                **kwargs
+                )
+        finally:
+            if progress_bar_positions is not None:
+                progress_bar_positions.put(progress_bar_position)
+        if exit_code:
+            self._report('    SuperCollider errored!')
+            raise NonrealtimeRenderError(exit_code)
+        os.replace(str(partial_file_path), str(output_file_path))
+        return output_file_path
+
+    def _render_segments(
+        self,
+        prerender_tuple,
+        segment_duration,
+        segment_overlap=0.,
+        worker_count=None,
+        **kwargs
+        ):
+        """
+        Renders a session prerender tuple as segments of at least
+        `segment_duration` seconds across `worker_count` threads, then
+        stitches the segments together.
+
+        Renders sessions with input, or without any offsets to split at,
+        whole.
+        """
+        session, input_, osc_bundles = prerender_tuple
+        extension = '.{}'.format(self.header_format.name.lower())
+        renderable_prefix = self.renderable_prefixes[session]
+        output_file_path = renderable_prefix.with_suffix(extension)
+        segment_offsets = []
+        if input_ is None:
+            segment_offsets = self._find_segment_offsets(
+                session, osc_bundles[-1].timestamp, segment_duration)
+        if not segment_offsets:
+            return self._render_prerender_tuple(prerender_tuple, **kwargs)
+        if output_file_path.exists():
+            self._report('Skipped {}. Output already exists.'.format(
+                output_file_path))
+            return 0
+        render_cache_key = self._build_render_cache_key(
+            renderable_prefix,
+            segment_duration=segment_duration,
+            segment_overlap=segment_overlap,
+            server_options=utils.new(session._options, **kwargs),
+            )
+        if self._restore_from_render_cache(render_cache_key, output_file_path):
+            return 0
+        segments = self._build_segments(
+            session,
+            osc_bundles,
+            segment_offsets,
+            segment_overlap=segment_overlap,
+            )
+        self._report('Rendering {} in {} segments.'.format(
+            output_file_path, len(segments)))
+        worker_count = worker_count or 1
+        progress_bar_positions = queue.Queue()
+        for position in range(worker_count):
+            progress_bar_positions.put(position)
+        with concurrent.futures.ThreadPoolExecutor(worker_count) as executor:
+            futures = [
+                executor.submit(
+                    self._render_segment,
+                    session,
+                    segment_osc_bundles,
+                    progress_bar_positions=progress_bar_positions,
+                    **kwargs
+                    )
+                for _, segment_osc_bundles in segments
+                ]
+            segment_file_paths = [future.result() for future in futures]
+        self._stitch_segments(
+            output_file_path,
+            [start_offset for start_offset, _ in segments],
+            segment_file_paths,
+            session.options.output_bus_channel_count,
+            )
+        self._store_in_render_cache(render_cache_key, output_file_path)
+        return 0
+
+    def _render_serially(self, skipped_renderables=None, **kwargs):
+        skipped_renderables = skipped_renderables or ()
+        exit_codes = {}
+        for prerender_tuple in self.prerender_tuples:
+            renderable = prerender_tuple[0]
+            if renderable in skipped_renderables:
+                continue
+            exit_codes[renderable] = self._render_prerender_tuple(
+                prerender_tuple,
+                **kwargs
+                )
+        return exit_codes
+
     def _report(self, message):
         if self.transcript_prefix:
             message = '{}{}'.format(self.transcript_prefix, message)
@@ -360,6 +851,15 @@ class SessionRenderer(supriya.system.SupriyaObject):
         self._session_input_paths = {}
         self._sessionables_to_sessions = {}
 
+    def _restore_from_render_cache(self, key, output_file_path):
+        if self.render_cache is None or output_file_path.exists():
+            return False
+        if not self.render_cache.restore(key, output_file_path):
+            return False
+        self._report('Restored {} from render cache.'.format(
+            output_file_path.name))
+        return True
+
     def _sessionable_to_session(self, expr):
         if hasattr(expr, '__session__'):
             if expr not in self._sessionables_to_sessions:
@@ -367,17 +867,105 @@ class SessionRenderer(supriya.system.SupriyaObject):
             return self._sessionables_to_sessions[expr]
         return expr
 
-    def _write_datagram(self, file_path, new_contents):
-        self._write(file_path, new_contents, mode='b')
+    def _stitch_segments(
+        self,
+        output_file_path,
+        start_offsets,
+        segment_file_paths,
+        channel_count,
+        ):
+        """
+        Writes segment sound files to `output_file_path`, each starting at
+        its start offset, summing wherever segments overlap.
+        """
+        import numpy
+        import wavefile
+        header_format = self.header_format.name
+        sample_format = self.sample_format.name
+        format_ = (
+            getattr(
+                wavefile.Format,
+                self._wavefile_formats.get(header_format, header_format),
+                ) |
+            getattr(
+                wavefile.Format,
+                self._wavefile_formats.get(sample_format, sample_format),
+                )
+            )
+        start_frames = [
+            int(round(start_offset * self.sample_rate))
+            for start_offset in start_offsets
+            ]
+        stop_frames = start_frames[1:] + [None]
+        partial_file_path = output_file_path.with_suffix(
+            '.partial' + output_file_path.suffix)
+        self._report('Stitching {} segments into {}.'.format(
+            len(segment_file_paths), output_file_path))
+        tail = numpy.zeros((channel_count, 0), numpy.float32, order='F')
+        with wavefile.WaveWriter(
+            str(partial_file_path),
+            channels=channel_count,
+            format=format_,
+            samplerate=self.sample_rate,
+            ) as writer:
+            for segment_file_path, start_frame, stop_frame in zip(
+                segment_file_paths, start_frames, stop_frames):
+                with wavefile.WaveReader(str(segment_file_path)) as reader:
+                    frames = reader.buffer(reader.frames)
+                    reader.read(frames)
+                frame_count = tail.shape[1]
+                if stop_frame is not None:
+                    frame_count = max(frame_count, stop_frame - start_frame)
+                if frames.shape[1] < frame_count:
+                    padding = numpy.zeros(
+                        (channel_count, frame_count - frames.shape[1]),
+                        numpy.float32,
+                        )
+                    frames = numpy.asfortranarray(
+                        numpy.concatenate((frames, padding), axis=1))
+                frames[:, :tail.shape[1]] += tail
+                if stop_frame is None:
+                    writer.write(frames)
+                    continue
+                writer.write(frames[:, :stop_frame - start_frame])
+                tail = frames[:, stop_frame - start_frame:]
+        os.replace(str(partial_file_path), str(output_file_path))
+
+    def _store_in_render_cache(self, key, output_file_path):
+        if self.render_cache is None or not output_file_path.exists():
+            return
+        elif key in self.render_cache:
+            return
+        self.render_cache.store(key, output_file_path)
+        self._report('Stored {} in render cache.'.format(
+            output_file_path.name))
+
+    def _write_datagrams(self, file_path, datagrams):
+        """
+        Streams `datagrams` into `file_path`.
+
+        OSC file names hash their contents, so an existing file is skipped
+        unread. New files are written beside their destination and moved
+        into place once complete.
+        """
+        relative_file_path = self._get_relative_file_path(file_path)
+        self._report('Writing {}.'.format(relative_file_path))
+        if file_path.exists():
+            self._report('    Skipped {}. File already exists.'.format(
+                relative_file_path))
+            return
+        partial_file_path = file_path.with_suffix('.partial' + file_path.suffix)
+        with open(str(partial_file_path), 'wb') as file_pointer:
+            for datagram in datagrams:
+                file_pointer.write(datagram)
+        os.replace(str(partial_file_path), str(file_path))
+        self._report('    Wrote {}.'.format(relative_file_path))
 
     def _write_render_yml(self, file_path, render_yaml):
         self._write(file_path, render_yaml)
 
     def _write(self, file_path, new_contents, mode=''):
-        cwd = pathlib.Path.cwd()
-        relative_file_path = file_path
-        if file_path.is_absolute() and cwd in file_path.parents:
-            relative_file_path = file_path.relative_to(cwd)
+        relative_file_path = self._get_relative_file_path(file_path)
         self._report('Writing {}.'.format(relative_file_path))
         old_contents = self._read(file_path, mode=mode)
         if old_contents == new_contents:
@@ -398,7 +986,6 @@ class SessionRenderer(supriya.system.SupriyaObject):
         self._collect_prerender_tuples(self.session, duration=duration)
         (
             session,
-            datagram,
             input_file_path,
             osc_bundles,
             ) = self.prerender_tuples[-1]
@@ -431,9 +1018,31 @@ class SessionRenderer(supriya.system.SupriyaObject):
         debug=None,
         duration=None,
         build_render_yml=None,
+        worker_count=None,
+        segment_duration=None,
+        segment_overlap=0.,
         **kwargs
         ):
-        import supriya.nonrealtime
+        """
+        Renders the session, and all sessions and renderables it depends
+        on, rendering at most `worker_count` independent dependencies at
+        once.
+
+        When `segment_duration` is set, splits the session itself into
+        segments of at least `segment_duration` seconds, at offsets which
+        no synth or buffer outlives, renders those segments in parallel and
+        stitches them together. Each segment renders for an extra
+        `segment_overlap` seconds, mixed into the next, to let releases
+        ring out. Segments already rendered by an interrupted render are
+        reused.
+
+        Returns exit code, transcript and output file path.
+        """
+        if segment_duration is not None:
+            segment_duration = float(segment_duration)
+            assert 0 < segment_duration
+        segment_overlap = float(segment_overlap)
+        assert 0 <= segment_overlap
         extension = '.{}'.format(self.header_format.name.lower())
         if output_file_path is not None:
             output_file_path = pathlib.Path(output_file_path)
@@ -441,40 +1050,39 @@ class SessionRenderer(supriya.system.SupriyaObject):
         original_output_file_path = output_file_path
         self._collect_prerender_tuples(self.session, duration=duration)
         assert self.prerender_tuples, self.prerender_tuples
-        visited_renderable_prefixes = []
+        visited_renderable_prefixes = [
+            self.renderable_prefixes[prerender_tuple[0]].name
+            for prerender_tuple in self.prerender_tuples
+            ]
+        renderable = self.prerender_tuples[-1][0]
         with uqbar.io.DirectoryChange(
             directory=str(self.render_directory_path),
             ):
-            for prerender_tuple in self.prerender_tuples:
-                renderable = prerender_tuple[0]
-                renderable_prefix = self.renderable_prefixes[renderable]
-                visited_renderable_prefixes.append(
-                    renderable_prefix.with_suffix('').name)
-                output_file_path = renderable_prefix.with_suffix(extension)
-                if isinstance(renderable, supriya.nonrealtime.Session):
-                    (session, datagram, input_, _) = prerender_tuple
-                    osc_file_path = renderable_prefix.with_suffix('.osc')
-                    input_file_path = self.session_input_paths.get(session)
-                    self._write_datagram(osc_file_path, datagram)
-                    try:
-                        exit_code = self._render_datagram(
-                            session,
-                            input_file_path,
-                            output_file_path,
-                            osc_file_path,
-                            **kwargs
-                            )
-                    except Exception:
-                        output_file_path.unlink()
-                        sys.exit(1)
-                    if exit_code:
-                        self._report('    SuperCollider errored!')
-                        raise NonrealtimeRenderError(exit_code)
-                else:
-                    renderable.__render__(
-                        output_file_path=output_file_path,
-                        print_transcript=self.print_transcript,
-                        )
+            skipped_renderables = ()
+            if segment_duration:
+                skipped_renderables = (renderable,)
+            if worker_count is not None and 1 < worker_count:
+                exit_codes = self._render_in_parallel(
+                    worker_count,
+                    skipped_renderables=skipped_renderables,
+                    **kwargs
+                    )
+            else:
+                exit_codes = self._render_serially(
+                    skipped_renderables=skipped_renderables,
+                    **kwargs
+                    )
+            if segment_duration:
+                exit_codes[renderable] = self._render_segments(
+                    self.prerender_tuples[-1],
+                    segment_duration,
+                    segment_overlap=segment_overlap,
+                    worker_count=worker_count,
+                    **kwargs
+                    )
+        exit_code = exit_codes[renderable]
+        output_file_path = self.renderable_prefixes[renderable].with_suffix(
+            extension)
         output_file_path = self.render_directory_path / output_file_path
         if not output_file_path.exists():
             self._report('    Output file is missing!')
@@ -514,6 +1122,10 @@ class SessionRenderer(supriya.system.SupriyaObject):
     def print_transcript(self):
         return self._print_transcript
 
+    @property
+    def render_cache(self):
+        return self._render_cache
+
     @property
     def render_directory_path(self):
         return self._render_directory_path
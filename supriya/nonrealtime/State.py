@@ -6,6 +6,9 @@ from supriya.nonrealtime.SessionObject import SessionObject
 class State(SessionObject):
     """
     A non-realtime state.
+
+    States keep their node trees in persistent mappings, so cloning a
+    state is cheap and consecutive states share all but their changes.
     """
 
     ### CLASS VARIABLES ###
@@ -67,14 +70,15 @@ class State(SessionObject):
         stop_nodes=None,
         ):
         import supriya.nonrealtime
+        import supriya.system
         if nodes_to_children is not None:
             nodes_to_children = nodes_to_children.copy()
         else:
-            nodes_to_children = {}
+            nodes_to_children = supriya.system.PersistentMapping()
         if nodes_to_parents is not None:
             nodes_to_parents = nodes_to_parents.copy()
         else:
-            nodes_to_parents = {}
+            nodes_to_parents = supriya.system.PersistentMapping()
         transitions = transitions or {}
         for node, action in transitions.items():
             action.apply_transform(nodes_to_children, nodes_to_parents)
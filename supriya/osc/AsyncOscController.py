@@ -0,0 +1,197 @@
+import asyncio
+import time
+from supriya.system.SupriyaObject import SupriyaObject
+
+
+class AsyncOscController(SupriyaObject):
+    """
+    An asyncio OSC controller.
+
+    Sends and receives OSC datagrams through an asyncio datagram endpoint,
+    dispatching received messages on the event loop rather than on a
+    dedicated listener thread.
+
+    ::
+
+        >>> import asyncio
+        >>> import supriya.osc
+        >>> import supriya.realtime
+        >>> server = supriya.realtime.Server(port=57761)
+        >>> controller = supriya.osc.AsyncOscController(server=server)
+        >>> loop = asyncio.new_event_loop()
+        >>> loop.run_until_complete(controller.boot(loop=loop))
+        >>> controller.is_running
+        True
+
+    ::
+
+        >>> controller.quit()
+        >>> controller.is_running
+        False
+        >>> loop.close()
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        '_debug_osc',
+        '_debug_udp',
+        '_loop',
+        '_protocol',
+        '_server',
+        '_transport',
+        )
+
+    class Protocol(asyncio.DatagramProtocol):
+
+        def __init__(self, controller):
+            self.controller = controller
+
+        def connection_lost(self, exc):
+            self.controller._transport = None
+
+        def datagram_received(self, data, address):
+            self.controller._handle_datagram(data)
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        debug_osc=False,
+        debug_udp=False,
+        server=None,
+        ):
+        self._debug_osc = bool(debug_osc)
+        self._debug_udp = bool(debug_udp)
+        self._server = server
+        self._loop = None
+        self._protocol = None
+        self._transport = None
+
+    ### PRIVATE METHODS ###
+
+    def _dispatch_message(self, message):
+        if self.debug_osc:
+            if message.address != '/status.reply':
+                print('RECV', '{:0.6f}'.format(time.time()), message.to_list())
+                if self.debug_udp:
+                    for line in str(message).splitlines():
+                        print('    ' + line)
+        self.server._osc_dispatcher(message)
+        self.server._response_dispatcher(message)
+
+    def _handle_datagram(self, datagram):
+        import supriya.osc
+        if supriya.osc.OscBundle.datagram_is_bundle(datagram):
+            messages = self._iterate_bundle(
+                supriya.osc.OscBundle.from_datagram(datagram))
+        else:
+            messages = [supriya.osc.OscMessage.from_datagram(datagram)]
+        for message in messages:
+            self._dispatch_message(message)
+
+    def _iterate_bundle(self, bundle):
+        import supriya.osc
+        for x in bundle.contents:
+            if isinstance(x, supriya.osc.OscBundle):
+                yield from self._iterate_bundle(x)
+            else:
+                yield x
+
+    ### PUBLIC METHODS ###
+
+    async def boot(self, loop=None):
+        """
+        Opens the datagram endpoint on `loop`.
+
+        Returns none.
+        """
+        if self.is_running:
+            return
+        self._loop = loop or asyncio.get_event_loop()
+        self._transport, self._protocol = \
+            await self._loop.create_datagram_endpoint(
+                lambda: self.Protocol(self),
+                local_addr=('0.0.0.0', 0),
+                )
+
+    def quit(self):
+        """
+        Closes the datagram endpoint.
+
+        Closing is immediate: there is no polling timeout to wait out.
+
+        Returns none.
+        """
+        if self._transport is not None:
+            self._transport.close()
+        self._transport = None
+        self._protocol = None
+
+    def send(self, message):
+        import supriya.osc
+        prototype = (
+            str,
+            tuple,
+            supriya.osc.OscMessage,
+            supriya.osc.OscBundle,
+            )
+        assert isinstance(message, prototype)
+        assert self.is_running
+        if isinstance(message, str):
+            message = supriya.osc.OscMessage(message)
+        elif isinstance(message, tuple):
+            assert len(message)
+            message = supriya.osc.OscMessage(
+                message[0],
+                *message[1:]
+                )
+        if self.debug_osc:
+            as_list = message.to_list()
+            if as_list != [2]:
+                print('SEND', '{:0.6f}'.format(time.time()), message.to_list())
+                if self.debug_udp:
+                    for line in str(message).splitlines():
+                        print('    ' + line)
+        datagram = message.to_datagram()
+        self._transport.sendto(
+            datagram,
+            (self.server.ip_address, self.server.port),
+            )
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def debug_osc(self):
+        return self._debug_osc
+
+    @debug_osc.setter
+    def debug_osc(self, expr):
+        self._debug_osc = bool(expr)
+
+    @property
+    def debug_udp(self):
+        return self._debug_udp
+
+    @debug_udp.setter
+    def debug_udp(self, expr):
+        self._debug_udp = bool(expr)
+
+    @property
+    def is_running(self):
+        return self._transport is not None
+
+    @property
+    def local_address(self):
+        if self._transport is None:
+            return None
+        return self._transport.get_extra_info('sockname')
+
+    @property
+    def loop(self):
+        return self._loop
+
+    @property
+    def server(self):
+        return self._server
@@ -85,6 +85,7 @@ class OscBundle(OscMixin):
         )
 
     _bundle_prefix = b'#bundle\x00'
+    _date_struct = struct.Struct('>II')
     _immediately = struct.pack('>q', 1)
 
     ### INITIALIZER ###
@@ -106,6 +107,23 @@ class OscBundle(OscMixin):
 
     ### PRIVATE METHODS ###
 
+    def _encode_into(self, buffer, realtime=True):
+        """
+        Appends this bundle's datagram to the bytearray `buffer`.
+
+        Contents encode directly into the same buffer, their length
+        prefixes patched in place once each is written.
+        """
+        import supriya.osc
+        buffer += OscBundle._bundle_prefix
+        buffer += OscBundle._write_date(self._timestamp, realtime=realtime)
+        for content in self.contents:
+            start = len(buffer)
+            buffer += b'\x00\x00\x00\x00'
+            content._encode_into(buffer)
+            supriya.osc.OscMessage._int_struct.pack_into(
+                buffer, start, len(buffer) - start - 4)
+
     @staticmethod
     def _get_ntp_delta():
         import time
@@ -118,14 +136,38 @@ class OscBundle(OscMixin):
     def _ntp_to_system_time(date):
         return float(date) - OscBundle._get_ntp_delta()
 
+    @staticmethod
+    def _read_bundle(datagram, offset, end):
+        import supriya.osc
+        assert OscBundle.datagram_is_bundle(datagram, offset)
+        offset += 8
+        timestamp, offset = OscBundle._read_date(datagram, offset)
+        contents = []
+        while offset < end:
+            length = supriya.osc.OscMessage._int_struct.unpack_from(
+                datagram, offset)[0]
+            offset += 4
+            if OscBundle.datagram_is_bundle(datagram, offset):
+                item = OscBundle._read_bundle(
+                    datagram, offset, offset + length)
+            else:
+                item = supriya.osc.OscMessage._read_message(datagram, offset)
+            contents.append(item)
+            offset += length
+        osc_bundle = OscBundle(
+            timestamp=timestamp,
+            contents=tuple(contents),
+            )
+        return osc_bundle
+
     @staticmethod
     def _read_date(payload, offset):
         if payload[offset:offset + 8] == OscBundle._immediately:
             date = None
         else:
-            seconds, fraction = struct.unpack(
-                '>II',
-                payload[offset:offset + 8],
+            seconds, fraction = OscBundle._date_struct.unpack_from(
+                payload,
+                offset,
                 )
             date = decimal.Decimal('{!s}.{!s}'.format(seconds, fraction))
             date = float(date)
@@ -161,48 +203,30 @@ class OscBundle(OscMixin):
 
     @staticmethod
     def from_datagram(datagram):
-        import supriya.osc
-        assert OscBundle.datagram_is_bundle(datagram)
-        offset = 8
-        timestamp, offset = OscBundle._read_date(datagram, offset)
-        contents = []
-        while offset < len(datagram):
-            length, offset = supriya.osc.OscMessage._read_int(datagram, offset)
-            data = datagram[offset:offset + length]
-            if OscBundle.datagram_is_bundle(data):
-                item = OscBundle.from_datagram(data)
-            else:
-                item = supriya.osc.OscMessage.from_datagram(data)
-            contents.append(item)
-            offset += length
-        osc_bundle = OscBundle(
-            timestamp=timestamp,
-            contents=tuple(contents),
-            )
-        return osc_bundle
+        """
+        Decodes a bundle from `datagram`.
+
+        Accepts ``bytes``, ``bytearray`` or ``memoryview``; nested bundles
+        and messages are decoded in place by offset rather than sliced out.
+        """
+        return OscBundle._read_bundle(datagram, 0, len(datagram))
 
     @staticmethod
     def bundles_to_nonrealtime_datagram(osc_bundles):
-        datagrams = []
+        import supriya.osc
+        buffer = bytearray()
         for osc_bundle in osc_bundles:
-            datagram = osc_bundle.to_datagram(realtime=False)
-            size = len(datagram)
-            size = struct.pack('>i', size)
-            datagrams.append(size)
-            datagrams.append(datagram)
-        datagram = b''.join(datagrams)
-        return datagram
+            start = len(buffer)
+            buffer += b'\x00\x00\x00\x00'
+            osc_bundle._encode_into(buffer, realtime=False)
+            supriya.osc.OscMessage._int_struct.pack_into(
+                buffer, start, len(buffer) - start - 4)
+        return bytes(buffer)
 
     def to_datagram(self, realtime=True):
-        import supriya.osc
-        datagram = OscBundle._bundle_prefix
-        datagram += OscBundle._write_date(self._timestamp, realtime=realtime)
-        for content in self.contents:
-            content_datagram = content.to_datagram()
-            content_length = len(content_datagram)
-            datagram += supriya.osc.OscMessage._write_int(content_length)
-            datagram += content_datagram
-        return datagram
+        buffer = bytearray()
+        self._encode_into(buffer, realtime=realtime)
+        return bytes(buffer)
 
     def to_list(self):
         result = [self.timestamp]
@@ -16,6 +16,7 @@ class OscController(SupriyaObject):
         '_debug_udp',
         '_incoming_message_queue',
         '_listener',
+        '_receive_buffer_size',
         '_server',
         '_socket_instance',
         '_timeout',
@@ -41,11 +42,13 @@ class OscController(SupriyaObject):
         self,
         debug_osc=False,
         debug_udp=False,
+        receive_buffer_size=2 ** 16,
         server=None,
         timeout=2,
         ):
         self._debug_osc = bool(debug_osc)
         self._debug_udp = bool(debug_udp)
+        self._receive_buffer_size = int(receive_buffer_size)
         self._server = server
         assert 0 < int(timeout)
         self._timeout = int(timeout)
@@ -70,6 +73,7 @@ class OscController(SupriyaObject):
             client=self,
             debug_osc=self.debug_osc,
             debug_udp=self.debug_udp,
+            receive_buffer_size=self.receive_buffer_size,
             )
         self._listener.start()
         self._socket_instance.bind(('', 0))
@@ -136,6 +140,21 @@ class OscController(SupriyaObject):
     def listener(self):
         return self._listener
 
+    @property
+    def receive_buffer_size(self):
+        """
+        Size in bytes of the largest datagram received.
+
+        Larger datagrams are dropped.
+        """
+        return self._receive_buffer_size
+
+    @receive_buffer_size.setter
+    def receive_buffer_size(self, expr):
+        self._receive_buffer_size = int(expr)
+        if self.listener is not None:
+            self.listener.buffer = bytearray(self.receive_buffer_size)
+
     @property
     def server(self):
         return self._server
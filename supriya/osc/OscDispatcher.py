@@ -38,14 +38,98 @@ class OscDispatcher(SupriyaObject):
 
     __slots__ = (
         '_address_map',
+        '_literal_map',
+        '_pattern_trie',
         '_regex_map',
+        '_sequence',
         )
 
+    _literal_characters = re.compile(r'^[\w./:,-]*$')
+
+    _trie_safe_characters = re.compile(r'^[\w./:,*-]*$')
+
+    class CallbackBucket(object):
+        """
+        The callbacks registered against one address pattern, indexed by
+        argument template.
+
+        Templated callbacks are hashed by template, grouped by template
+        length, so a message only probes one dictionary per distinct
+        template length rather than comparing against every template.
+        """
+
+        def __init__(self):
+            self.callbacks = {}
+            self.templates = {}
+            self.unindexed = {}
+
+        def __len__(self):
+            return len(self.callbacks)
+
+        def collect(self, message):
+            result = []
+            contents = message.contents
+            for length, templates in self.templates.items():
+                if len(contents) < length:
+                    # short messages match templates they are a prefix of
+                    for template, entries in templates.items():
+                        if template[:len(contents)] == contents:
+                            result.extend(entries.items())
+                    continue
+                try:
+                    entries = templates.get(contents[:length], {})
+                except TypeError:
+                    continue
+                result.extend(entries.items())
+            for callback, sequence in self.unindexed.items():
+                template = callback.argument_template
+                if template and not all(
+                    one == two for one, two in zip(contents, template)
+                    ):
+                    continue
+                result.append((callback, sequence))
+            return result
+
+        def register(self, callback, sequence):
+            if callback in self.callbacks:
+                return
+            self.callbacks[callback] = sequence
+            template = callback.argument_template
+            if template:
+                try:
+                    hash(template)
+                    length = len(template)
+                    templates = self.templates.setdefault(length, {})
+                    templates.setdefault(template, {})[callback] = sequence
+                    return
+                except TypeError:
+                    pass
+            self.unindexed[callback] = sequence
+
+        def unregister(self, callback):
+            if callback not in self.callbacks:
+                return False
+            del(self.callbacks[callback])
+            if callback in self.unindexed:
+                del(self.unindexed[callback])
+                return True
+            template = callback.argument_template
+            templates = self.templates[len(template)]
+            del(templates[template][callback])
+            if not templates[template]:
+                del(templates[template])
+            if not templates:
+                del(self.templates[len(template)])
+            return True
+
     ### INITIALIZER ###
 
     def __init__(self):
         self._address_map = {}
+        self._literal_map = {}
+        self._pattern_trie = self._new_trie_node()
         self._regex_map = {}
+        self._sequence = 0
 
     ### SPECIAL METHODS ###
 
@@ -55,28 +139,123 @@ class OscDispatcher(SupriyaObject):
 
         Finds all matching callbacks and passes the message to each.
 
+        Literal address patterns are found with a single dictionary lookup,
+        wildcard patterns by walking a trie of address segments, and only
+        patterns using other regular expression syntax are matched by
+        regex. Callbacks are called in registration order.
+
         Returns none.
         """
         import supriya.osc
         assert isinstance(message, supriya.osc.OscMessage)
-        callbacks = []
-        for regex in self._regex_map:
-            if regex.match(message.address):
-                callbacks.extend(self._regex_map[regex])
-        for callback in callbacks:
-            if callback.argument_template:
-                is_valid = True
-                generator = zip(message.contents, callback.argument_template)
-                for one, two in generator:
-                    if one != two:
-                        is_valid = False
-                        break
-                if not is_valid:
-                    continue
+        address = message.address
+        buckets = []
+        if address in self._literal_map:
+            buckets.append(self._literal_map[address])
+        if isinstance(address, str):
+            self._collect_trie_buckets(
+                self._pattern_trie,
+                address.split('/'),
+                0,
+                buckets,
+                )
+            for regex, bucket in self._regex_map.items():
+                if regex.match(address):
+                    buckets.append(bucket)
+        pairs = []
+        for bucket in buckets:
+            pairs.extend(bucket.collect(message))
+        if 1 < len(pairs):
+            pairs.sort(key=lambda pair: pair[1])
+        for callback, _ in pairs:
             callback(message)
             if callback.is_one_shot:
                 self.unregister_callback(callback)
 
+    ### PRIVATE METHODS ###
+
+    def _collect_trie_buckets(self, node, segments, index, buckets):
+        if index == len(segments):
+            if node['bucket'] is not None:
+                buckets.append(node['bucket'])
+            return
+        segment = segments[index]
+        child = node['literals'].get(segment)
+        if child is not None:
+            self._collect_trie_buckets(child, segments, index + 1, buckets)
+        for regex, child in node['wildcards'].values():
+            if regex.match(segment):
+                self._collect_trie_buckets(
+                    child, segments, index + 1, buckets)
+
+    def _get_bucket(self, address_pattern):
+        if address_pattern in self._address_map:
+            return self._address_map[address_pattern]
+        bucket = self.CallbackBucket()
+        if self._is_literal(address_pattern):
+            self._literal_map[address_pattern] = bucket
+        elif self._trie_safe_characters.match(address_pattern):
+            node = self._pattern_trie
+            for segment in address_pattern.split('/'):
+                node = self._get_trie_child(node, segment)
+            node['bucket'] = bucket
+        else:
+            regex = self.compile_address_pattern(address_pattern)
+            self._regex_map[regex] = bucket
+        self._address_map[address_pattern] = bucket
+        return bucket
+
+    def _get_trie_child(self, node, segment):
+        if '*' not in segment:
+            key, mapping = segment, node['literals']
+            if key not in mapping:
+                mapping[key] = self._new_trie_node()
+            return mapping[key]
+        mapping = node['wildcards']
+        if segment not in mapping:
+            regex = self.compile_address_pattern(segment)
+            mapping[segment] = (regex, self._new_trie_node())
+        return mapping[segment][1]
+
+    @staticmethod
+    def _is_literal(address_pattern):
+        if not isinstance(address_pattern, str):
+            return True
+        return OscDispatcher._literal_characters.match(address_pattern)
+
+    @staticmethod
+    def _new_trie_node():
+        return {'bucket': None, 'literals': {}, 'wildcards': {}}
+
+    def _remove_bucket(self, address_pattern):
+        bucket = self._address_map.pop(address_pattern)
+        if address_pattern in self._literal_map:
+            del(self._literal_map[address_pattern])
+            return
+        for regex, other in tuple(self._regex_map.items()):
+            if other is bucket:
+                del(self._regex_map[regex])
+                return
+        path = [self._pattern_trie]
+        for segment in address_pattern.split('/'):
+            node = path[-1]
+            if '*' in segment:
+                path.append(node['wildcards'][segment][1])
+            else:
+                path.append(node['literals'][segment])
+        path[-1]['bucket'] = None
+        segments = address_pattern.split('/')
+        for index in reversed(range(len(segments))):
+            parent, child = path[index], path[index + 1]
+            if child['bucket'] is not None:
+                break
+            if child['literals'] or child['wildcards']:
+                break
+            if '*' in segments[index]:
+                del(parent['wildcards'][segments[index]])
+            else:
+                del(parent['literals'][segments[index]])
+
     ### PUBLIC METHODS ###
 
     @staticmethod
@@ -95,16 +274,9 @@ class OscDispatcher(SupriyaObject):
         """
         import supriya.osc
         assert isinstance(osc_callback, supriya.osc.OscCallback)
-        if osc_callback.address_pattern in self._address_map:
-            regex = self._address_map[osc_callback.address_pattern]
-        else:
-            regex = self.compile_address_pattern(osc_callback.address_pattern)
-            self._address_map[osc_callback.address_pattern] = regex
-        if regex not in self._regex_map:
-            self._regex_map[regex] = []
-        osc_callbacks = self._regex_map[regex]
-        if osc_callback not in osc_callbacks:
-            osc_callbacks.append(osc_callback)
+        bucket = self._get_bucket(osc_callback.address_pattern)
+        bucket.register(osc_callback, self._sequence)
+        self._sequence += 1
 
     def unregister_callback(self, osc_callback):
         """
@@ -114,15 +286,11 @@ class OscDispatcher(SupriyaObject):
         """
         import supriya.osc
         assert isinstance(osc_callback, supriya.osc.OscCallback)
-        if osc_callback.address_pattern not in self._address_map:
-            return
-        regex = self._address_map[osc_callback.address_pattern]
-        if regex not in self._regex_map:
+        address_pattern = osc_callback.address_pattern
+        if address_pattern not in self._address_map:
             return
-        osc_callbacks = self._regex_map[regex]
-        if osc_callback not in osc_callbacks:
+        bucket = self._address_map[address_pattern]
+        if not bucket.unregister(osc_callback):
             return
-        osc_callbacks.remove(osc_callback)
-        if not osc_callbacks:
-            del(self._regex_map[regex])
-            del(self._address_map[osc_callback.address_pattern])
+        if not len(bucket):
+            self._remove_bucket(address_pattern)
@@ -18,12 +18,14 @@ class OscListener(SupriyaObject, threading.Thread):
         client=None,
         debug_osc=False,
         debug_udp=False,
+        receive_buffer_size=2 ** 16,
         timeout=1,
         ):
         threading.Thread.__init__(self)
         self.debug_osc = bool(debug_osc)
         self.debug_udp = bool(debug_udp)
         self.client = client
+        self.buffer = bytearray(int(receive_buffer_size))
         self.setDaemon(True)
         self.running = False
         self.timeout = int(timeout)
@@ -37,9 +39,17 @@ class OscListener(SupriyaObject, threading.Thread):
 
     def get_message(self):
         import supriya.osc
+        # The buffer may be replaced while receiving, when the receive
+        # buffer size changes, so keep the one received into.
+        buffer = self.buffer
         try:
-            data, address = self.client.socket_instance.recvfrom(2 ** 13)
-            if data:
+            size, address = self.client.socket_instance.recvfrom_into(buffer)
+            if size == len(buffer):
+                sys.stderr.write(
+                    'Dropped datagram larger than {} bytes\n'.format(size))
+                return None
+            if size:
+                data = memoryview(buffer)[:size]
                 message = supriya.osc.OscMessage.from_datagram(data)
                 return message
             return None
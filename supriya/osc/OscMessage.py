@@ -1,4 +1,5 @@
 import collections
+import re
 import struct
 import sys
 from supriya.osc.OscMixin import OscMixin
@@ -30,6 +31,20 @@ class OscMessage(OscMixin):
         '_contents',
         )
 
+    _codec_cache = {}
+
+    _constant_type_tags = {
+        'F': False,
+        'N': None,
+        'T': True,
+        }
+
+    _int_struct = struct.Struct('>i')
+
+    _null_regex = re.compile(b'\x00')
+
+    _STRUCT, _CONSTANT, _STRING, _BLOB = range(4)
+
     ### INITIALIZER ###
 
     def __init__(
@@ -60,6 +75,46 @@ class OscMessage(OscMixin):
 
     ### PRIVATE METHODS ###
 
+    @staticmethod
+    def _compile_type_tags(type_tags):
+        """
+        Compiles `type_tags` into a tuple of codec steps.
+
+        Runs of fixed-width type tags collapse into a single cached
+        ``struct.Struct``. Returns none for type tags the compiled codec
+        does not handle, such as arrays.
+        """
+        if type_tags in OscMessage._codec_cache:
+            return OscMessage._codec_cache[type_tags]
+        steps, format_, is_valid = [], '', True
+        for type_tag in type_tags + ',':
+            if type_tag in 'dfi':
+                format_ += type_tag
+                continue
+            if format_:
+                steps.append((
+                    OscMessage._STRUCT,
+                    (struct.Struct('>' + format_), len(format_)),
+                    ))
+                format_ = ''
+            if type_tag == ',':
+                break
+            elif type_tag in OscMessage._constant_type_tags:
+                steps.append((
+                    OscMessage._CONSTANT,
+                    OscMessage._constant_type_tags[type_tag],
+                    ))
+            elif type_tag == 's':
+                steps.append((OscMessage._STRING, None))
+            elif type_tag == 'b':
+                steps.append((OscMessage._BLOB, None))
+            else:
+                is_valid = False
+                break
+        steps = tuple(steps) if is_valid else None
+        OscMessage._codec_cache[type_tags] = steps
+        return steps
+
     @staticmethod
     def _decode_array(type_tags, type_tag_offset, payload, payload_offset):
         assert type_tags[type_tag_offset] == '['
@@ -217,6 +272,52 @@ class OscMessage(OscMixin):
         encoded_value = OscMessage._write_int(value)
         return type_tags, encoded_value
 
+    def _encode_into(self, buffer):
+        """
+        Appends this message's datagram to the bytearray `buffer`.
+        """
+        contents = self.contents
+        type_tags = []
+        for value in contents:
+            if isinstance(value, bytearray):
+                type_tags.append('b')
+            elif isinstance(value, str):
+                type_tags.append('s')
+            elif isinstance(value, bool):
+                type_tags.append('T' if value else 'F')
+            elif isinstance(value, float):
+                type_tags.append('f')
+            elif isinstance(value, int):
+                type_tags.append('i')
+            elif value is None:
+                type_tags.append('N')
+            else:
+                buffer += self._to_datagram_generic()
+                return
+        type_tags = ''.join(type_tags)
+        steps = OscMessage._compile_type_tags(type_tags)
+        # address can be a string or (in SuperCollider) an int
+        if isinstance(self.address, str):
+            OscMessage._write_string_into(buffer, self.address)
+        else:
+            buffer += OscMessage._int_struct.pack(self.address)
+        OscMessage._write_string_into(buffer, ',' + type_tags)
+        index = 0
+        for kind, argument in steps:
+            if kind == OscMessage._STRUCT:
+                struct_, count = argument
+                buffer += struct_.pack(*contents[index:index + count])
+                index += count
+                continue
+            elif kind == OscMessage._STRING:
+                OscMessage._write_string_into(buffer, contents[index])
+            elif kind == OscMessage._BLOB:
+                value = contents[index]
+                buffer += OscMessage._int_struct.pack(len(value))
+                buffer += value
+                buffer += b'\x00' * (-len(value) % 4)
+            index += 1
+
     @staticmethod
     def _encode_none():
         type_tags = 'N'
@@ -254,6 +355,29 @@ class OscMessage(OscMixin):
             raise TypeError(message)
         return type_tags, encoded_value
 
+    @staticmethod
+    def _from_datagram_generic(datagram):
+        datagram = bytearray(datagram)
+        contents = []
+        offset = 0
+        address, offset = OscMessage._read_string(datagram, offset)
+        type_tags, offset = OscMessage._read_string(datagram, offset)
+        assert type_tags[0] == ','
+        payload = datagram[offset:]
+        payload_offset = 0
+        type_tag_offset = 1
+        while type_tag_offset < len(type_tags):
+            result, type_tag_offset, payload_offset = \
+                OscMessage._decode_value(
+                    type_tags,
+                    type_tag_offset,
+                    payload,
+                    payload_offset
+                    )
+            contents.append(result)
+        osc_message = OscMessage(address, *contents)
+        return osc_message
+
     @staticmethod
     def _read_double(payload, payload_offset):
         result = payload[payload_offset:payload_offset + 8]
@@ -278,6 +402,46 @@ class OscMessage(OscMixin):
         payload_offset += 4
         return result, payload_offset
 
+    @staticmethod
+    def _read_message(datagram, offset=0):
+        """
+        Decodes a message from any bytes-like `datagram`, starting at
+        `offset`, without slicing intermediate copies of the payload.
+        """
+        start = offset
+        if datagram[offset] == 0:
+            # SuperCollider allows integer command addresses
+            address = OscMessage._int_struct.unpack_from(datagram, offset)[0]
+            offset += 4
+        else:
+            address, offset = OscMessage._read_string_from(datagram, offset)
+        type_tags, offset = OscMessage._read_string_from(datagram, offset)
+        assert type_tags[0] == ','
+        steps = OscMessage._compile_type_tags(type_tags[1:])
+        if steps is None:
+            return OscMessage._from_datagram_generic(datagram[start:])
+        contents = []
+        for kind, argument in steps:
+            if kind == OscMessage._STRUCT:
+                struct_ = argument[0]
+                contents.extend(struct_.unpack_from(datagram, offset))
+                offset += struct_.size
+            elif kind == OscMessage._CONSTANT:
+                contents.append(argument)
+            elif kind == OscMessage._STRING:
+                value, offset = OscMessage._read_string_from(datagram, offset)
+                contents.append(value)
+            elif kind == OscMessage._BLOB:
+                length = OscMessage._int_struct.unpack_from(
+                    datagram, offset)[0]
+                offset += 4
+                contents.append(bytearray(datagram[offset:offset + length]))
+                offset += length + (-length % 4)
+        osc_message = OscMessage.__new__(OscMessage)
+        osc_message._address = address
+        osc_message._contents = tuple(contents)
+        return osc_message
+
     @staticmethod
     def _read_string(payload, payload_offset):
         offset = 0
@@ -297,16 +461,13 @@ class OscMessage(OscMixin):
         return result, payload_offset
 
     @staticmethod
-    def _write_float(value):
-        return struct.pack('>f', value)
-
-    @staticmethod
-    def _write_int(value):
-        return struct.pack('>i', value)
-
-    ### PUBLIC METHODS ###
+    def _read_string_from(datagram, offset):
+        end = OscMessage._null_regex.search(datagram, offset).start()
+        result = str(datagram[offset:end], 'utf-8')
+        offset += (end - offset + 4) & ~3
+        return result, offset
 
-    def to_datagram(self):
+    def _to_datagram_generic(self):
         # address can be a string or (in SuperCollider) an int
         datagram = OscMessage._encode_value(self.address)[1]
         if self.contents is None:
@@ -324,28 +485,36 @@ class OscMessage(OscMixin):
         datagram = bytes(datagram)
         return datagram
 
+    @staticmethod
+    def _write_float(value):
+        return struct.pack('>f', value)
+
+    @staticmethod
+    def _write_int(value):
+        return struct.pack('>i', value)
+
+    @staticmethod
+    def _write_string_into(buffer, value):
+        encoded_value = value.encode('utf-8')
+        buffer += encoded_value
+        buffer += b'\x00' * (4 - (len(encoded_value) % 4))
+
+    ### PUBLIC METHODS ###
+
+    def to_datagram(self):
+        buffer = bytearray()
+        self._encode_into(buffer)
+        return bytes(buffer)
+
     @staticmethod
     def from_datagram(datagram):
-        datagram = bytearray(datagram)
-        contents = []
-        offset = 0
-        address, offset = OscMessage._read_string(datagram, offset)
-        type_tags, offset = OscMessage._read_string(datagram, offset)
-        assert type_tags[0] == ','
-        payload = datagram[offset:]
-        payload_offset = 0
-        type_tag_offset = 1
-        while type_tag_offset < len(type_tags):
-            result, type_tag_offset, payload_offset = \
-                OscMessage._decode_value(
-                    type_tags,
-                    type_tag_offset,
-                    payload,
-                    payload_offset
-                    )
-            contents.append(result)
-        osc_message = OscMessage(address, *contents)
-        return osc_message
+        """
+        Decodes a message from `datagram`.
+
+        Accepts ``bytes``, ``bytearray`` or ``memoryview``; decoding reads
+        values in place rather than slicing the datagram.
+        """
+        return OscMessage._read_message(datagram)
 
     def to_list(self):
         result = [self.address]
@@ -1,69 +1,154 @@
+import collections
+import heapq
+import sys
 import time
 import threading
-from queue import PriorityQueue
+import traceback
 from supriya.system.SupriyaObject import SupriyaObject
 
 
 class Clock(SupriyaObject):
+    """
+    A clock.
+
+    Runs scheduled procedures on a single long-lived scheduler thread,
+    waking each procedure `lookahead` seconds before its scheduled time.
+    Procedures are called with an execution time and their scheduled time,
+    and return the delta until their next call, or none to stop.
+
+    Scheduled times are wall-clock times, but waits are measured against a
+    monotonic clock, so rescheduling never drifts and wall-clock
+    adjustments do not disturb a running schedule.
+
+    ::
+
+        >>> import supriya.patterns
+        >>> clock = supriya.patterns.Clock(lookahead=0.05)
+        >>> clock.lookahead
+        0.05
+
+    """
 
     ### CLASS VARIABLES ###
 
     _default_clock = None
 
     __slots__ = (
+        '_condition',
+        '_counter',
+        '_lateness_count',
+        '_lateness_maximum',
+        '_lateness_total',
         '_lock',
+        '_lookahead',
+        '_pending_messages',
         '_queue',
-        '_timer',
         '_registry',
+        '_thread',
+        '_time_offset',
         )
 
     ### INITIALIZER ###
 
-    def __init__(self):
+    def __init__(self, lookahead=0.):
+        lookahead = float(lookahead)
+        assert 0 <= lookahead
         self._lock = threading.RLock()
-        self._queue = PriorityQueue()
-        self._timer = None
+        self._condition = threading.Condition(self._lock)
+        self._counter = 0
+        self._lookahead = lookahead
+        self._pending_messages = collections.OrderedDict()
+        self._queue = []
         self._registry = {}
+        self._thread = None
+        self._time_offset = time.time() - time.monotonic()
+        self._reset_metrics()
 
     ### PRIVATE METHODS ###
 
     def _execute(self, execution_time):
-        with self._lock:
-            while not self._queue.empty():
-                pair = self._queue.get()
-                if execution_time < pair[0]:
-                    self._queue.put(pair)
-                    break
-                scheduled_time, registry_key = pair
-                if registry_key not in self._registry:
-                    continue
-                procedure = self._registry[registry_key]
+        deadline_offset = self.get_current_time() + self._lookahead
+        window_time = execution_time + self._lookahead
+        while self._queue and self._queue[0][0] <= window_time:
+            scheduled_time, _, registry_key = heapq.heappop(self._queue)
+            if registry_key not in self._registry:
+                continue
+            self._update_metrics(deadline_offset - scheduled_time)
+            procedure = self._registry[registry_key]
+            try:
                 delta = procedure(execution_time, scheduled_time)
-                if delta is not None:
-                    rescheduled_time = scheduled_time + delta
-                    self.schedule(
-                        procedure,
-                        rescheduled_time,
-                        absolute=True,
-                        registry_key=registry_key,
-                        )
-            if not self._queue.empty():
-                self._new_timer()
-
-    def _new_timer(self):
-        if self._timer is not None:
-            self._timer.cancel()
-        pair = self._queue.get()
-        self._queue.put(pair)
-        scheduled_time, _ = pair
-        now = time.time()
-        delta = scheduled_time - now
-        self._timer = threading.Timer(
-            delta,
-            self._execute,
-            (scheduled_time,),
+            except Exception:
+                # Stop the failing procedure, but keep the others running.
+                sys.stderr.write('Exception in clock procedure:\n')
+                traceback.print_exc()
+                delta = None
+            if delta is not None:
+                self._push(scheduled_time + delta, registry_key)
+            else:
+                self._registry.pop(registry_key, None)
+        self._flush_messages()
+
+    def _flush_messages(self):
+        import supriya.osc
+        pending_messages = self._pending_messages
+        self._pending_messages = collections.OrderedDict()
+        for server, messages in pending_messages.items():
+            contents_by_timestamp = collections.OrderedDict()
+            for message in messages:
+                if isinstance(message, supriya.osc.OscBundle):
+                    timestamp, contents = message.timestamp, message.contents
+                else:
+                    timestamp, contents = None, (message,)
+                contents_by_timestamp.setdefault(timestamp, []).extend(
+                    contents)
+            for timestamp, contents in contents_by_timestamp.items():
+                server.send_message(supriya.osc.OscBundle(
+                    timestamp=timestamp,
+                    contents=contents,
+                    ))
+
+    def _push(self, scheduled_time, registry_key):
+        self._counter += 1
+        heapq.heappush(
+            self._queue,
+            (scheduled_time, self._counter, registry_key),
             )
-        self._timer.start()
+
+    def _reset_metrics(self):
+        self._lateness_count = 0
+        self._lateness_maximum = 0.
+        self._lateness_total = 0.
+
+    def _run(self):
+        with self._condition:
+            try:
+                while True:
+                    while self._queue and (
+                        self._queue[0][2] not in self._registry):
+                        heapq.heappop(self._queue)
+                    if not self._queue:
+                        return
+                    execution_time = self._queue[0][0]
+                    delta = (
+                        execution_time - self._lookahead -
+                        self.get_current_time()
+                        )
+                    if 0 < delta:
+                        self._condition.wait(delta)
+                        continue
+                    self._execute(execution_time)
+            finally:
+                # Lets the next schedule start a new thread, even if this
+                # one failed.
+                if self._thread is threading.current_thread():
+                    self._thread = None
+
+    def _update_metrics(self, lateness):
+        lateness = max(lateness, 0.)
+        self._lateness_count += 1
+        self._lateness_total += lateness
+        if self._lateness_maximum < lateness:
+            self._lateness_maximum = lateness
 
     ### PUBLIC METHODS ###
 
@@ -71,6 +156,7 @@ class Clock(SupriyaObject):
         with self._lock:
             if registry_key in self._registry:
                 self._registry.pop(registry_key)
+                self._condition.notify()
 
     @classmethod
     def get_default_clock(cls):
@@ -78,13 +164,21 @@ class Clock(SupriyaObject):
             cls._default_clock = cls()
         return cls._default_clock
 
+    def get_current_time(self):
+        """
+        Gets the clock's current wall-clock time.
+
+        Returns float.
+        """
+        return self._time_offset + time.monotonic()
+
     def reset(self):
         with self._lock:
-            if self._timer is not None:
-                self._timer.cancel()
-                self._timer = None
             self._registry.clear()
-            self._queue = PriorityQueue()
+            self._queue[:] = []
+            self._pending_messages.clear()
+            self._reset_metrics()
+            self._condition.notify()
 
     def schedule(
         self,
@@ -94,7 +188,7 @@ class Clock(SupriyaObject):
         registry_key=None,
         ):
         registry_key = registry_key or procedure
-        now = time.time()
+        now = self.get_current_time()
         if not absolute:
             scheduled_time += now
         with self._lock:
@@ -110,6 +204,61 @@ class Clock(SupriyaObject):
                         )
             else:
                 self._registry[registry_key] = procedure
-                self._queue.put((scheduled_time, registry_key))
-                self._new_timer()
+                self._push(scheduled_time, registry_key)
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run)
+                    self._thread.daemon = True
+                    self._thread.start()
+                else:
+                    self._condition.notify()
         return now
+
+    def send_message(self, message, server):
+        """
+        Sends `message` to `server`.
+
+        Messages sent by procedures running on the scheduler thread are
+        held until the end of the current tick, then sent as one OSC bundle
+        per server and timestamp. Messages sent from any other thread are
+        sent immediately.
+        """
+        if threading.current_thread() is not self._thread:
+            server.send_message(message)
+            return
+        self._pending_messages.setdefault(server, []).append(message)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def event_count(self):
+        """
+        Number of procedure calls made by the scheduler thread since the
+        clock was created or last reset.
+        """
+        return self._lateness_count
+
+    @property
+    def lookahead(self):
+        """
+        Seconds ahead of their scheduled time at which procedures are
+        called.
+        """
+        return self._lookahead
+
+    @property
+    def maximum_lateness(self):
+        """
+        Largest delay, in seconds, between a procedure's wake-up deadline
+        and its actual call.
+        """
+        return self._lateness_maximum
+
+    @property
+    def mean_lateness(self):
+        """
+        Mean delay, in seconds, between procedures' wake-up deadlines and
+        their actual calls.
+        """
+        if not self._lateness_count:
+            return 0.
+        return self._lateness_total / self._lateness_count
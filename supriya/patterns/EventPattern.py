@@ -24,10 +24,15 @@ class EventPattern(Pattern):
     def play(self, clock=None, server=None):
         import supriya.patterns
         import supriya.realtime
+        server = server or supriya.realtime.Server.get_default_server()
+        if isinstance(server, supriya.realtime.ServerCluster):
+            # A pattern's voices share its groups and buses, so the whole
+            # pattern plays on one server.
+            server = server.select_server()
         event_player = supriya.patterns.RealtimeEventPlayer(
             self,
             clock=clock,
-            server=server or supriya.realtime.Server.get_default_server(),
+            server=server,
             )
         event_player.start()
         return event_player
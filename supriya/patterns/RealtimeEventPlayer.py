@@ -84,17 +84,29 @@ class RealtimeEventPlayer(EventPlayer):
             contents=requests,
             )
         if communicate:
+            self._allocate_synthdefs(requests)
             osc_bundle = consolidated_bundle.to_osc_bundle()
             osc_bundle = utils.new(
                 osc_bundle,
                 timestamp=osc_bundle.timestamp + self._server.latency,
                 )
-            self._server.send_message(osc_bundle)
+            self._clock.send_message(osc_bundle, self._server)
             return delta
         return consolidated_bundle, delta
 
     ### PRIVATE METHODS ###
 
+    def _allocate_synthdefs(self, requests):
+        # Sent now, ahead of the latency-delayed bundle which needs them.
+        import supriya.synthdefs
+        synthdefs = [
+            request.synthdef for request in requests
+            if isinstance(request, supriya.commands.SynthNewRequest) and
+            isinstance(request.synthdef, supriya.synthdefs.SynthDef)
+            ]
+        if synthdefs:
+            self._server.synthdef_residency.allocate(synthdefs, sync=False)
+
     def _collect_stop_requests(self):
         import supriya.nonrealtime
         requests = []
@@ -0,0 +1,251 @@
+import asyncio
+import functools
+from supriya.system import SupriyaObject
+
+
+class AsyncServer(SupriyaObject):
+    """
+    An asyncio facade over an scsynth server proxy.
+
+    Wraps a :py:class:`~supriya.realtime.Server.Server`, sharing its proxies,
+    allocators and dispatchers, but sends requests through an
+    :py:class:`~supriya.osc.AsyncOscController.AsyncOscController` so that
+    replies are awaited on the event loop rather than on one blocked thread
+    per request.
+
+    ::
+
+        >>> import asyncio
+        >>> import supriya.commands
+        >>> import supriya.realtime
+        >>> async def main(async_server):
+        ...     await async_server.boot()
+        ...     requests = [
+        ...         supriya.commands.NodeQueryRequest(node_id)
+        ...         for node_id in (0, 1)
+        ...         ]
+        ...     responses = await asyncio.gather(*[
+        ...         request.communicate_async(server=async_server)
+        ...         for request in requests
+        ...         ])
+        ...     await async_server.quit()
+        ...     return [response.node_id for response in responses]
+        ...
+
+    ::
+
+        >>> async_server = supriya.realtime.AsyncServer()
+        >>> loop = asyncio.get_event_loop()
+        >>> loop.run_until_complete(main(async_server))  # doctest: +SKIP
+        [0, 1]
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Main Classes'
+
+    __slots__ = (
+        '_loop',
+        '_osc_controller',
+        '_server',
+        )
+
+    _default_server = None
+
+    _servers = {}
+
+    ### CONSTRUCTOR ###
+
+    def __new__(
+        cls,
+        ip_address='127.0.0.1',
+        port=57751,
+        **kwargs
+        ):
+        key = (ip_address, port)
+        if key not in cls._servers:
+            instance = object.__new__(cls)
+            instance.__init__(
+                ip_address=ip_address,
+                port=port,
+                **kwargs
+                )
+            cls._servers[key] = instance
+        return cls._servers[key]
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        ip_address='127.0.0.1',
+        port=57751,
+        ):
+        import supriya.osc
+        import supriya.realtime
+        if hasattr(self, '_server'):
+            return
+        self._loop = None
+        self._server = supriya.realtime.Server(
+            ip_address=ip_address,
+            port=port,
+            )
+        self._osc_controller = supriya.osc.AsyncOscController(
+            debug_osc=self._server.debug_osc,
+            debug_udp=self._server.debug_udp,
+            server=self._server,
+            )
+
+    ### SPECIAL METHODS ###
+
+    async def __aenter__(self):
+        await self.boot()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.sync()
+        await self.quit()
+
+    def __repr__(self):
+        if not self.is_running:
+            return '<AsyncServer: offline>'
+        return '<AsyncServer: {}>'.format(repr(self.server)[9:-1])
+
+    ### PRIVATE METHODS ###
+
+    async def _run_in_executor(self, procedure, *args, **kwargs):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(procedure, *args, **kwargs),
+            )
+
+    ### PUBLIC METHODS ###
+
+    async def boot(self, server_options=None, **kwargs):
+        """
+        Boots the wrapped server, if necessary, and connects to it on the
+        running event loop.
+
+        Booting the scsynth process happens in the loop's default executor
+        so that the event loop is not blocked while scsynth starts.
+
+        Returns async server.
+        """
+        if not self.server.is_running:
+            await self._run_in_executor(
+                self.server.boot,
+                server_options=server_options,
+                **kwargs
+                )
+        await self.connect()
+        return self
+
+    async def connect(self):
+        """
+        Connects to an already-running server.
+
+        Returns async server.
+        """
+        assert self.server.is_running
+        if not self._osc_controller.is_running:
+            self._loop = asyncio.get_event_loop()
+            await self._osc_controller.boot(loop=self._loop)
+        return self
+
+    def disconnect(self):
+        """
+        Disconnects from the server without quitting it.
+
+        Returns async server.
+        """
+        self._osc_controller.quit()
+        return self
+
+    @staticmethod
+    def get_default_server():
+        if AsyncServer._default_server is None:
+            AsyncServer._default_server = AsyncServer()
+        return AsyncServer._default_server
+
+    async def query_remote_nodes(self, include_controls=False):
+        """
+        Queries all nodes on scsynth.
+
+        Returns server query-tree group response.
+        """
+        import supriya.commands
+        request = supriya.commands.GroupQueryTreeRequest(
+            node_id=0,
+            include_controls=include_controls,
+            )
+        response = await request.communicate_async(server=self)
+        return response.query_tree_group
+
+    async def quit(self):
+        """
+        Disconnects from and quits the wrapped server.
+
+        Returns async server.
+        """
+        self.disconnect()
+        if self.server.is_running:
+            await self._run_in_executor(self.server.quit)
+        return self
+
+    def register_osc_callback(self, osc_callback):
+        self.server.register_osc_callback(osc_callback)
+
+    def register_response_callback(self, response_callback):
+        self.server.register_response_callback(response_callback)
+
+    def send_message(self, message):
+        if not message or not self.is_running:
+            return
+        self._osc_controller.send(message)
+
+    async def sync(self, sync_id=None):
+        import supriya.commands
+        if not self.is_running:
+            return
+        if sync_id is None:
+            sync_id = self.server.next_sync_id
+        request = supriya.commands.SyncRequest(sync_id=sync_id)
+        await request.communicate_async(server=self)
+        return self
+
+    def unregister_osc_callback(self, osc_callback):
+        self.server.unregister_osc_callback(osc_callback)
+
+    def unregister_response_callback(self, response_callback):
+        self.server.unregister_response_callback(response_callback)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def is_running(self):
+        return self.server.is_running and self._osc_controller.is_running
+
+    @property
+    def ip_address(self):
+        return self.server.ip_address
+
+    @property
+    def loop(self):
+        return self._loop
+
+    @property
+    def osc_controller(self):
+        return self._osc_controller
+
+    @property
+    def port(self):
+        return self.server.port
+
+    @property
+    def response_dispatcher(self):
+        return self.server.response_dispatcher
+
+    @property
+    def server(self):
+        return self._server
@@ -1,4 +1,7 @@
 import collections
+import os
+import struct
+import tempfile
 from supriya.realtime.ServerObjectProxy import ServerObjectProxy
 
 
@@ -45,6 +48,10 @@ class Buffer(ServerObjectProxy):
         '_buffer_id_was_set_manually',
         )
 
+    _local_ip_addresses = ('127.0.0.1', '::1', 'localhost')
+
+    _staging_sample_count = 65536
+
     ### INITIALIZER ###
 
     def __init__(
@@ -206,6 +213,76 @@ class Buffer(ServerObjectProxy):
                 raise ValueError
             self._buffer_id = buffer_id
 
+    def _build_get_contiguous_requests(
+        self,
+        starting_sample,
+        sample_count,
+        maximum_datagram_size,
+        ):
+        import supriya.commands
+        return [
+            supriya.commands.BufferGetContiguousRequest(
+                buffer_id=self.buffer_id,
+                index_count_pairs=[(index, count)],
+                )
+            for index, count in self._iterate_sample_chunks(
+                starting_sample, sample_count, maximum_datagram_size)
+            ]
+
+    def _build_set_contiguous_requests(
+        self,
+        starting_sample,
+        samples,
+        maximum_datagram_size,
+        ):
+        import supriya.commands
+        return [
+            supriya.commands.BufferSetContiguousRequest(
+                buffer_id=self.buffer_id,
+                index_values_pairs=[(
+                    index,
+                    samples[
+                        index - starting_sample:
+                        index - starting_sample + count
+                        ].tolist(),
+                    )],
+                )
+            for index, count in self._iterate_sample_chunks(
+                starting_sample, len(samples), maximum_datagram_size)
+            ]
+
+    def _get_array_via_staging(self, starting_frame, frame_count):
+        import numpy
+        import supriya.soundfiles
+        with tempfile.TemporaryDirectory() as directory_path:
+            file_path = os.path.join(directory_path, 'buffer.wav')
+            self.write(
+                file_path,
+                frame_count=frame_count,
+                header_format='wav',
+                sample_format='float',
+                starting_frame=starting_frame,
+                )
+            # /b_write is asynchronous: wait until the server finishes.
+            self.server.sync()
+            soundfile = supriya.soundfiles.SoundFile(
+                file_path, memory_map=True)
+            array = numpy.array(soundfile[:])
+            del(soundfile)
+        return array
+
+    @staticmethod
+    def _iterate_sample_chunks(
+        starting_sample,
+        sample_count,
+        maximum_datagram_size,
+        ):
+        # A bundled /b_setn carrying n samples takes at most 48 + 5n bytes.
+        chunk_size = max(1, (maximum_datagram_size - 48) // 5)
+        stopping_sample = starting_sample + sample_count
+        for index in range(starting_sample, stopping_sample, chunk_size):
+            yield index, min(chunk_size, stopping_sample - index)
+
     def _register_with_local_server(self):
         if self.buffer_id not in self.server._buffers:
             self.server._buffers[self.buffer_id] = set()
@@ -255,6 +332,29 @@ class Buffer(ServerObjectProxy):
                 )
         return request
 
+    def _set_array_via_staging(self, samples, starting_frame):
+        with tempfile.TemporaryDirectory() as directory_path:
+            file_path = os.path.join(directory_path, 'buffer.wav')
+            self._write_staging_file(
+                file_path,
+                samples,
+                self.channel_count,
+                self.sample_rate or 44100,
+                )
+            self.read(
+                file_path,
+                frame_count=len(samples) // self.channel_count,
+                starting_frame_in_buffer=starting_frame,
+                )
+
+    def _should_stage(self, sample_count, use_staging):
+        if use_staging is not None:
+            return bool(use_staging)
+        return (
+            self._staging_sample_count <= sample_count and
+            self.server.ip_address in self._local_ip_addresses
+            )
+
     def _unregister_with_local_server(self):
         buffer_id = self.buffer_id
         buffers = self.server._buffers[buffer_id]
@@ -275,6 +375,30 @@ class Buffer(ServerObjectProxy):
             )
         return request
 
+    @staticmethod
+    def _write_staging_file(file_path, samples, channel_count, sample_rate):
+        import numpy
+        data = numpy.asarray(samples, dtype='<f4').tobytes()
+        fmt_chunk = struct.pack(
+            '<HHIIHH',
+            3,  # WAVE_FORMAT_IEEE_FLOAT
+            channel_count,
+            int(sample_rate),
+            int(sample_rate) * 4 * channel_count,
+            4 * channel_count,
+            32,
+            )
+        with open(file_path, 'wb') as file_pointer:
+            file_pointer.write(b'RIFF')
+            file_pointer.write(struct.pack('<I', 4 + 24 + 8 + len(data)))
+            file_pointer.write(b'WAVE')
+            file_pointer.write(b'fmt ')
+            file_pointer.write(struct.pack('<I', len(fmt_chunk)))
+            file_pointer.write(fmt_chunk)
+            file_pointer.write(b'data')
+            file_pointer.write(struct.pack('<I', len(data)))
+            file_pointer.write(data)
+
     ### PUBLIC METHODS ###
 
     def allocate(
@@ -896,6 +1020,75 @@ class Buffer(ServerObjectProxy):
             raise IndexError('Index out of range.')
         return response
 
+    def get_array(
+        self,
+        starting_frame=0,
+        frame_count=None,
+        maximum_datagram_size=1472,
+        timeout=1.0,
+        use_staging=None,
+        ):
+        """
+        Gets frames as a NumPy array, with one column per channel.
+
+        ::
+
+            >>> server = supriya.realtime.Server().boot()
+            >>> buffer_ = supriya.realtime.Buffer().allocate(
+            ...     channel_count=2,
+            ...     frame_count=4,
+            ...     server=server,
+            ...     sync=True,
+            ...     )
+            >>> buffer_.get_array()
+            array([[0., 0.],
+                   [0., 0.],
+                   [0., 0.],
+                   [0., 0.]], dtype=float32)
+
+        ::
+
+            >>> buffer_.free()
+
+        Pipelines as many ``/b_getn`` requests as needed for each reply to
+        fit in `maximum_datagram_size` bytes. Large reads from a server on
+        this host instead stage through a temporary soundfile. Pass
+        `use_staging` to choose either path.
+
+        Returns NumPy array.
+        """
+        import numpy
+        import supriya.commands
+        if not self.is_allocated:
+            raise Exception
+        channel_count = self.channel_count
+        if frame_count is None:
+            frame_count = self.frame_count - starting_frame
+        starting_sample = starting_frame * channel_count
+        sample_count = frame_count * channel_count
+        if self._should_stage(sample_count, use_staging):
+            return self._get_array_via_staging(starting_frame, frame_count)
+        pipeline = supriya.commands.RequestPipeline(
+            self._build_get_contiguous_requests(
+                starting_sample, sample_count, maximum_datagram_size),
+            maximum_datagram_size=maximum_datagram_size,
+            )
+        futures = pipeline.communicate(server=self.server)
+        samples = numpy.zeros(sample_count, dtype=numpy.float32)
+        try:
+            for future in futures:
+                response = future.result(timeout=timeout)
+                if isinstance(response, supriya.commands.FailResponse):
+                    raise IndexError('Index out of range.')
+                for item in response:
+                    index = item.starting_sample_index - starting_sample
+                    count = len(item.sample_values)
+                    samples[index:index + count] = item.sample_values
+        finally:
+            for future in futures:
+                future.cancel()
+        return samples.reshape(frame_count, channel_count)
+
     def get_contiguous(
         self,
         index_count_pairs=None,
@@ -1186,6 +1379,76 @@ class Buffer(ServerObjectProxy):
             sync=sync,
             )
 
+    def set_array(
+        self,
+        array,
+        starting_frame=0,
+        maximum_datagram_size=1472,
+        sync=True,
+        timeout=1.0,
+        use_staging=None,
+        ):
+        """
+        Sets frames from a NumPy array, with one column per channel.
+
+        ::
+
+            >>> import numpy
+            >>> server = supriya.realtime.Server().boot()
+            >>> buffer_ = supriya.realtime.Buffer().allocate(
+            ...     frame_count=8,
+            ...     server=server,
+            ...     sync=True,
+            ...     )
+
+        ::
+
+            >>> buffer_.set_array(numpy.linspace(0, 1, 5), starting_frame=2)
+            >>> buffer_.get_array()[:, 0]
+            array([0.  , 0.  , 0.  , 0.25, 0.5 , 0.75, 1.  , 0.  ], dtype=float32)
+
+        ::
+
+            >>> buffer_.free()
+
+        Pipelines as many ``/b_setn`` requests as needed for each to fit in
+        `maximum_datagram_size` bytes, then waits for the server to sync if
+        `sync` is true. Large writes to a server on this host instead stage
+        through a temporary soundfile. Pass `use_staging` to choose either
+        path.
+
+        Returns none.
+        """
+        import numpy
+        import supriya.commands
+        if not self.is_allocated:
+            raise Exception
+        channel_count = self.channel_count
+        samples = numpy.asarray(array, dtype=numpy.float32)
+        if samples.ndim == 2 and samples.shape[1] != channel_count:
+            raise ValueError('Expected {} channels, got {}.'.format(
+                channel_count, samples.shape[1]))
+        samples = samples.reshape(-1)
+        if len(samples) % channel_count:
+            raise ValueError('Expected whole frames of {} channels.'.format(
+                channel_count))
+        if self._should_stage(len(samples), use_staging):
+            self._set_array_via_staging(samples, starting_frame)
+            return
+        requests = self._build_set_contiguous_requests(
+            starting_frame * channel_count, samples, maximum_datagram_size)
+        if sync:
+            requests.append(supriya.commands.SyncRequest(
+                sync_id=self.server.next_sync_id,
+                ))
+        pipeline = supriya.commands.RequestPipeline(
+            requests,
+            maximum_datagram_size=maximum_datagram_size,
+            )
+        futures = pipeline.communicate(server=self.server, sync=sync)
+        if sync:
+            futures[-1].result(timeout=timeout)
+
     def set_contiguous(
         self,
         index_values_pairs=None,
@@ -80,12 +80,40 @@ class Bus(ServerObjectProxy):
             allocator = server.control_bus_allocator
         return allocator
 
+    @staticmethod
+    def _get_buses(
+        calculation_rate=None,
+        server=None,
+        ):
+        import supriya.synthdefs
+        if calculation_rate == supriya.synthdefs.CalculationRate.AUDIO:
+            buses = server._audio_buses
+        else:
+            buses = server._control_buses
+        return buses
+
     def _receive_bound_event(self, event=None):
         if event is None:
             return
         event = float(event)
         self.set(event)
 
+    def _register_with_local_server(self):
+        buses = self._get_buses(
+            calculation_rate=self.calculation_rate,
+            server=self.server,
+            )
+        buses.setdefault(self.bus_id, set()).add(self)
+
+    def _unregister_with_local_server(self):
+        buses = self._get_buses(
+            calculation_rate=self.calculation_rate,
+            server=self.server,
+            )
+        buses.get(self.bus_id, set()).discard(self)
+        if not buses.get(self.bus_id, True):
+            del(buses[self.bus_id])
+
     ### PUBLIC METHODS ###
 
     def allocate(
@@ -108,6 +136,7 @@ class Bus(ServerObjectProxy):
                 ServerObjectProxy.free(self)
                 raise ValueError
             self._bus_id = bus_id
+        self._register_with_local_server()
         if sync:
             self.server.sync()
         return self
@@ -190,6 +219,7 @@ class Bus(ServerObjectProxy):
     def free(self):
         if not self.is_allocated:
             return
+        self._unregister_with_local_server()
         if not self._bus_id_was_set_manually:
             allocator = self._get_allocator(
                 calculation_rate=self.calculation_rate,
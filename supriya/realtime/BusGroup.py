@@ -95,6 +95,24 @@ class BusGroup(ServerObjectProxy):
         event = float(event)
         self.fill(event)
 
+    def _register_with_local_server(self):
+        import supriya.realtime
+        buses = supriya.realtime.Bus._get_buses(
+            calculation_rate=self.calculation_rate,
+            server=self.server,
+            )
+        buses.setdefault(self.bus_id, set()).add(self)
+
+    def _unregister_with_local_server(self):
+        import supriya.realtime
+        buses = supriya.realtime.Bus._get_buses(
+            calculation_rate=self.calculation_rate,
+            server=self.server,
+            )
+        buses.get(self.bus_id, set()).discard(self)
+        if not buses.get(self.bus_id, True):
+            del(buses[self.bus_id])
+
     ### PUBLIC METHODS ###
 
     def allocate(
@@ -115,6 +133,7 @@ class BusGroup(ServerObjectProxy):
             ServerObjectProxy.free(self)
             raise ValueError
         self._bus_id = bus_id
+        self._register_with_local_server()
         if sync:
             self.server.sync()
         return self
@@ -214,6 +233,7 @@ class BusGroup(ServerObjectProxy):
         import supriya.realtime
         if not self.is_allocated:
             return
+        self._unregister_with_local_server()
         allocator = supriya.realtime.Bus._get_allocator(
             calculation_rate=self.calculation_rate,
             server=self.server,
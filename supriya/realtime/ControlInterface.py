@@ -62,6 +62,15 @@ class ControlInterface(SupriyaObject):
                 raise ValueError(value)
         messages = []
         if self.client.is_allocated:
+            control_write_buffer = self.client.server.control_write_buffer
+            if control_write_buffer.is_running:
+                mapped_names = set(n_map_settings).union(n_mapa_settings)
+                if mapped_names:
+                    control_write_buffer.discard(
+                        self.node_id, *sorted(mapped_names))
+                if n_set_settings:
+                    control_write_buffer.write(self.node_id, **n_set_settings)
+                    n_set_settings = None
             if n_set_settings:
                 request = supriya.commands.NodeSetRequest(
                     self.node_id,
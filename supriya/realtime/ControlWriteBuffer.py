@@ -0,0 +1,256 @@
+import collections
+import sys
+import threading
+import traceback
+import supriya.system
+
+
+class ControlWriteBuffer(supriya.system.SupriyaObject):
+    """
+    Coalesces control changes sent to a server's nodes.
+
+    While started, setting node controls to numbers writes to the buffer
+    rather than sending ``/n_set`` at once. Each flush sends the last value
+    written to each control since the previous flush, as one bundle of
+    ``/n_set`` messages, and elides the writes those values superseded.
+
+    ::
+
+        >>> import supriya.realtime
+        >>> server = supriya.realtime.Server().boot()
+        >>> synth = supriya.realtime.Synth().allocate()
+
+    ::
+
+        >>> server.control_write_buffer.start()
+        >>> for frequency in range(440, 450):
+        ...     synth['frequency'] = frequency
+        ...
+        >>> server.control_write_buffer.stop()
+        >>> server.control_write_buffer.write_count
+        10
+        >>> server.control_write_buffer.elided_count
+        9
+
+    ::
+
+        >>> server = server.quit()
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Server Internals'
+
+    __slots__ = (
+        '_elided_count',
+        '_flush_interval',
+        '_lock',
+        '_pending_settings',
+        '_server',
+        '_stop_event',
+        '_thread',
+        '_write_count',
+        )
+
+    _default_flush_interval = 0.01
+
+    _maximum_datagram_size = 8192
+
+    ### INITIALIZER ###
+
+    def __init__(self, server):
+        self._elided_count = 0
+        self._flush_interval = None
+        self._lock = threading.RLock()
+        self._pending_settings = collections.OrderedDict()
+        self._server = server
+        self._stop_event = None
+        self._thread = None
+        self._write_count = 0
+
+    ### SPECIAL METHODS ###
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(_) for _ in self._pending_settings.values())
+
+    ### PRIVATE METHODS ###
+
+    def _get_default_flush_interval(self):
+        # Round to a whole number of control blocks, so each flush lands
+        # on the same block boundary relative to the server's clock.
+        server_options = self.server.server_options
+        sample_rate = server_options.sample_rate or 44100
+        status = getattr(self.server, 'status', None)
+        if status is not None and status.actual_sample_rate:
+            sample_rate = status.actual_sample_rate
+        block_duration = server_options.block_size / float(sample_rate)
+        block_count = max(
+            1, int(round(self._default_flush_interval / block_duration)))
+        return block_count * block_duration
+
+    def _run(self, stop_event, flush_interval):
+        try:
+            while not stop_event.wait(flush_interval):
+                try:
+                    self.flush()
+                except Exception:
+                    # Drop the failed flush, but keep flushing later writes.
+                    sys.stderr.write('Exception in control write buffer:\n')
+                    traceback.print_exc()
+        finally:
+            with self._lock:
+                if self._thread is threading.current_thread():
+                    self._flush_interval = None
+                    self._stop_event = None
+                    self._thread = None
+
+    ### PUBLIC METHODS ###
+
+    def discard(self, node_id, *names):
+        """
+        Discards pending writes to the controls named `names` of the node
+        with ID `node_id`, or to all its controls if `names` is empty.
+
+        Mapping a control, or freeing its node, supersedes pending writes
+        which would otherwise arrive afterwards.
+        """
+        with self._lock:
+            if not names:
+                self._pending_settings.pop(node_id, None)
+                return
+            settings = self._pending_settings.get(node_id)
+            if settings is None:
+                return
+            for name in names:
+                settings.pop(name, None)
+            if not settings:
+                del(self._pending_settings[node_id])
+
+    def flush(self):
+        """
+        Sends all pending writes.
+
+        Packs one ``/n_set`` message per node, in the order nodes were last
+        written, into as few bundles as fit in a datagram.
+
+        Returns tuple of sent OSC messages and bundles.
+        """
+        import supriya.commands
+        import supriya.osc
+        with self._lock:
+            pending_settings = self._pending_settings
+            self._pending_settings = collections.OrderedDict()
+        groups, group = [], []
+        # A bundle's header is 16 bytes, and each element carries its size.
+        total = 16
+        for node_id, settings in pending_settings.items():
+            message = supriya.commands.NodeSetRequest(
+                node_id,
+                **settings
+                ).to_osc_message()
+            size = len(message.to_datagram()) + 4
+            if group and self._maximum_datagram_size < total + size:
+                groups.append(group)
+                group, total = [], 16
+            group.append(message)
+            total += size
+        if group:
+            groups.append(group)
+        results = []
+        for group in groups:
+            if len(group) == 1:
+                result = group[0]
+            else:
+                result = supriya.osc.OscBundle(contents=group)
+            self.server.send_message(result)
+            results.append(result)
+        return tuple(results)
+
+    def start(self, flush_interval=None):
+        """
+        Starts buffering writes, flushing them every `flush_interval`
+        seconds.
+
+        Flushes about every 10 milliseconds, rounded to whole control
+        blocks, if `flush_interval` is none.
+        """
+        if flush_interval is None:
+            flush_interval = self._get_default_flush_interval()
+        flush_interval = float(flush_interval)
+        assert 0 < flush_interval
+        self.stop()
+        with self._lock:
+            self._flush_interval = flush_interval
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(self._stop_event, flush_interval),
+                )
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self):
+        """
+        Stops buffering writes, and flushes pending writes.
+        """
+        with self._lock:
+            stop_event, thread = self._stop_event, self._thread
+            self._flush_interval = None
+            self._stop_event = None
+            self._thread = None
+        if thread is None:
+            return
+        stop_event.set()
+        if thread is not threading.current_thread():
+            thread.join()
+        self.flush()
+
+    def write(self, node_id, **settings):
+        """
+        Writes `settings`, mapping control names to numbers, to the node
+        with ID `node_id`.
+
+        Each write replaces any value written to the same control since the
+        last flush, and counts as elided if it does.
+        """
+        with self._lock:
+            node_settings = self._pending_settings.setdefault(
+                node_id, collections.OrderedDict())
+            # Flush in last-write order, so a group's latest write still
+            # lands after earlier writes to its children.
+            self._pending_settings.move_to_end(node_id)
+            for name, value in settings.items():
+                if name in node_settings:
+                    self._elided_count += 1
+                node_settings[name] = float(value)
+                self._write_count += 1
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def elided_count(self):
+        """
+        Number of writes superseded before being sent.
+        """
+        return self._elided_count
+
+    @property
+    def flush_interval(self):
+        return self._flush_interval
+
+    @property
+    def is_running(self):
+        return self._thread is not None
+
+    @property
+    def server(self):
+        return self._server
+
+    @property
+    def write_count(self):
+        """
+        Number of writes buffered.
+        """
+        return self._write_count
@@ -192,8 +192,7 @@ class Group(Node, UniqueTreeContainer):
                         )
                     requests.append(request)
                 else:
-                    if not node.synthdef.is_allocated:
-                        synthdefs.add(node.synthdef)
+                    synthdefs.add(node.synthdef)
                     settings, map_requests = \
                         node.controls._make_synth_new_settings()
                     request = supriya.commands.SynthNewRequest(
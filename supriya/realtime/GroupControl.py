@@ -64,8 +64,18 @@ class GroupControl:
                 self.node,
                 **{self.name: expr}
                 )
-        if self.node.is_allocated:
-            request.communicate(server=self.node.server)
+        if not self.node.is_allocated:
+            return
+        control_write_buffer = self.node.server.control_write_buffer
+        if control_write_buffer.is_running:
+            if isinstance(request, supriya.commands.NodeSetRequest):
+                control_write_buffer.write(
+                    self.node.node_id,
+                    **{self.name: expr}
+                    )
+                return
+            control_write_buffer.discard(self.node.node_id, self.name)
+        request.communicate(server=self.node.server)
 
     ### PUBLIC PROPERTIES ###
 
@@ -63,8 +63,12 @@ class Node(ServerObjectProxy, UniqueTreeNode):
         import supriya.commands
         if isinstance(response, supriya.commands.NodeInfoResponse):
             if response.action == supriya.commands.NodeAction.NODE_REMOVED:
+                server = self.server
                 self._set_parent(None)
-                self._unregister_with_local_server()
+                node_id = self._unregister_with_local_server()
+                if server is not None:
+                    # The node ID may be reused before the next flush.
+                    server.control_write_buffer.discard(node_id)
             elif response.action == supriya.commands.NodeAction.NODE_ACTIVATED:
                 self._is_paused = False
             elif response.action == supriya.commands.NodeAction.NODE_DEACTIVATED:
@@ -235,6 +239,7 @@ class Node(ServerObjectProxy, UniqueTreeNode):
         server = self.server
         if self.node_id is not None and server.is_running:
             node_id = self._unregister_with_local_server()
+            server.control_write_buffer.discard(node_id)
             node_free_request = supriya.commands.NodeFreeRequest(
                 node_ids=(node_id,),
                 )
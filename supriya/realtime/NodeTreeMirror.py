@@ -0,0 +1,666 @@
+import threading
+import supriya.system
+
+
+class NodeTreeMirror(supriya.system.SupriyaObject):
+    """
+    Mirrors a server's node tree from its node notifications.
+
+    Keeps each node's parent and siblings, and each group's head and tail,
+    as ``scsynth`` does, so ``/n_go``, ``/n_move`` and ``/n_end``
+    notifications update it in constant time, as do lookups by node ID.
+    Notifications which do not fit the mirror, or synth and group counts
+    which disagree with two status replies in a row, reveal lost
+    notifications and mark the mirror stale. The server's status watcher
+    then reconciles it with a full query.
+
+    Querying splits the tree into subtrees whose ``/g_queryTree`` replies
+    fit the server's receive buffer, and queries them in parallel batches.
+
+    ::
+
+        >>> import supriya.realtime
+        >>> server = supriya.realtime.Server().boot()
+        >>> group = supriya.realtime.Group().allocate()
+        >>> synth = supriya.realtime.Synth().allocate(target_node=group)
+        >>> server.sync()
+        <Server: udp://127.0.0.1:57751, 8i8o>
+
+    ::
+
+        >>> mirror = server.node_tree_mirror
+        >>> print(mirror.to_query_tree_group())
+        NODE TREE 0 group
+            1 group
+                1000 group
+                    1001 default
+
+    ::
+
+        >>> mirror[1001].parent_group_id
+        1000
+        >>> mirror.diff()
+        {'local_only': (), 'moved': (), 'remote_only': ()}
+
+    ::
+
+        >>> server = server.quit()
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Server Internals'
+
+    _maximum_requests_in_flight = 8
+
+    __slots__ = (
+        '_head_ids',
+        '_lock',
+        '_mismatched_status_count',
+        '_next_ids',
+        '_parent_ids',
+        '_pending_responses',
+        '_previous_ids',
+        '_reconciliation_count',
+        '_response_callback',
+        '_server',
+        '_stale',
+        '_synthdef_names',
+        '_tail_ids',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, server):
+        import supriya.commands
+        self._lock = threading.RLock()
+        self._reconciliation_count = 0
+        self._response_callback = supriya.commands.ResponseCallback(
+            procedure=lambda response: self._handle_response(response),
+            prototype=(
+                supriya.commands.NodeInfoResponse,
+                ),
+            )
+        self._server = server
+        self.clear()
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, node_id):
+        return node_id in self._parent_ids
+
+    def __getitem__(self, node_id):
+        """
+        Gets node `node_id`'s position, as ``/n_query`` would reply.
+
+        Returns node info response.
+        """
+        import supriya.commands
+        with self._lock:
+            if node_id not in self._parent_ids:
+                raise KeyError(node_id)
+            is_group = node_id in self._head_ids
+            return supriya.commands.NodeInfoResponse(
+                action='/n_info',
+                node_id=node_id,
+                parent_group_id=self._parent_ids[node_id],
+                previous_node_id=self._previous_ids[node_id],
+                next_node_id=self._next_ids[node_id],
+                is_group=is_group,
+                head_node_id=self._head_ids.get(node_id),
+                tail_node_id=self._tail_ids.get(node_id),
+                )
+
+    def __len__(self):
+        return len(self._parent_ids)
+
+    ### PRIVATE METHODS ###
+
+    def _add(self, node_id, parent_id, previous_id, next_id, is_group):
+        # Links the node after its previous sibling, or before its next,
+        # whichever the mirror knows. Returns false if they disagree with
+        # the mirror, which has then missed a notification.
+        if previous_id is not None and (
+            self._parent_ids.get(previous_id) == parent_id):
+            is_consistent = self._next_ids[previous_id] == next_id
+            following_id = self._next_ids[previous_id]
+        elif next_id is not None and (
+            self._parent_ids.get(next_id) == parent_id):
+            is_consistent = (
+                previous_id is None and
+                self._previous_ids[next_id] is None
+                )
+            previous_id = self._previous_ids[next_id]
+            following_id = next_id
+        else:
+            is_consistent = (
+                previous_id is None and
+                next_id is None and
+                self._head_ids[parent_id] is None
+                )
+            if previous_id is None and next_id is not None:
+                previous_id, following_id = None, self._head_ids[parent_id]
+            else:
+                previous_id, following_id = self._tail_ids[parent_id], None
+        self._parent_ids[node_id] = parent_id
+        self._previous_ids[node_id] = previous_id
+        self._next_ids[node_id] = following_id
+        if previous_id is None:
+            self._head_ids[parent_id] = node_id
+        else:
+            self._next_ids[previous_id] = node_id
+        if following_id is None:
+            self._tail_ids[parent_id] = node_id
+        else:
+            self._previous_ids[following_id] = node_id
+        if is_group:
+            self._head_ids.setdefault(node_id, None)
+            self._tail_ids.setdefault(node_id, None)
+        return is_consistent
+
+    def _apply_response(self, response, lenient=False):
+        import supriya.commands
+        action = response.action
+        node_id = response.node_id
+        NodeAction = supriya.commands.NodeAction
+        if action == NodeAction.NODE_REMOVED:
+            if node_id in self._parent_ids and node_id != 0:
+                self._remove(node_id)
+            return True
+        if action == NodeAction.NODE_CREATED and node_id in self._parent_ids:
+            if not lenient:
+                return False
+            action = NodeAction.NODE_MOVED
+        elif action != NodeAction.NODE_CREATED and (
+            node_id not in self._parent_ids):
+            if not lenient:
+                return False
+            action = NodeAction.NODE_CREATED
+        if action in (
+            NodeAction.NODE_ACTIVATED,
+            NodeAction.NODE_DEACTIVATED,
+            NodeAction.NODE_QUERIED,
+            ):
+            return (
+                self._parent_ids[node_id] == response.parent_group_id and
+                self._previous_ids[node_id] == response.previous_node_id and
+                self._next_ids[node_id] == response.next_node_id
+                )
+        if response.parent_group_id not in self._head_ids:
+            if node_id in self._parent_ids:
+                self._remove(node_id)
+            return False
+        if action == NodeAction.NODE_MOVED:
+            self._unlink(node_id)
+        else:
+            self._synthdef_names.pop(node_id, None)
+            if not response.is_group:
+                synthdef_name = self._get_synthdef_name(node_id)
+                if synthdef_name is not None:
+                    self._synthdef_names[node_id] = synthdef_name
+        return self._add(
+            node_id,
+            response.parent_group_id,
+            response.previous_node_id,
+            response.next_node_id,
+            response.is_group,
+            )
+
+    def _communicate(self, requests, timeout):
+        # Sends requests a batch at a time, without waiting for each reply
+        # before sending the next. Returns replies by type and node ID.
+        import supriya.commands
+        condition = threading.Condition()
+        expected_keys, failure_counts, responses = set(), {}, {}
+
+        def collect(response):
+            with condition:
+                if isinstance(response, supriya.commands.FailResponse):
+                    # Nodes freed meanwhile fail, and never reply.
+                    command = response.failed_command
+                    if command in failure_counts:
+                        failure_counts[command] += 1
+                        condition.notify_all()
+                    return
+                key = (type(response), response.node_id)
+                if key in expected_keys:
+                    responses[key] = response
+                    condition.notify_all()
+
+        def is_complete(keys_by_command):
+            # Failures do not name their node, so count them per command.
+            return all(
+                len(keys.difference(responses)) <= failure_counts[command]
+                for command, keys in keys_by_command.items()
+                )
+
+        callback = supriya.commands.ResponseCallback(
+            procedure=collect,
+            prototype=(
+                supriya.commands.FailResponse,
+                supriya.commands.NodeSetContiguousResponse,
+                supriya.commands.QueryTreeResponse,
+                ),
+            )
+        self.server.register_response_callback(callback)
+        try:
+            batch_size = self._maximum_requests_in_flight
+            for i in range(0, len(requests), batch_size):
+                batch = requests[i:i + batch_size]
+                keys_by_command = {}
+                for request in batch:
+                    response_type, = (
+                        _ for _ in request.response_specification
+                        if _ is not supriya.commands.FailResponse
+                        )
+                    keys_by_command.setdefault(
+                        request.request_command, set()).add(
+                        (response_type, request.node_id))
+                with condition:
+                    for command, keys in keys_by_command.items():
+                        expected_keys.update(keys)
+                        failure_counts[command] = 0
+                for request in batch:
+                    self.server.send_message(request.to_osc_message())
+                with condition:
+                    condition.wait_for(
+                        lambda: is_complete(keys_by_command),
+                        timeout=timeout,
+                        )
+        finally:
+            self.server.unregister_response_callback(callback)
+        return responses
+
+    def _estimate_reply_size(self, node_id, include_controls):
+        # Estimates the bytes, type tags included, each node adds to a
+        # /g_queryTree reply: two integers, plus a SynthDef name and
+        # controls for synths. Each control takes a short name and a value.
+        if node_id in self._head_ids:
+            return 10
+        synthdef_name = self._synthdef_names.get(node_id) or ' ' * 32
+        size = 10 + (len(synthdef_name) // 4 + 1) * 4 + 1
+        if include_controls:
+            control_count = 8
+            index_count_pairs = self._get_index_count_pairs(node_id)
+            if index_count_pairs is not None:
+                control_count = sum(count for _, count in index_count_pairs)
+            size += 5 + control_count * 18
+        return size
+
+    def _get_index_count_pairs(self, node_id):
+        # Spans each of a proxied synth's parameters, arrays included.
+        import supriya.synthdefs
+        synth = self._server._nodes.get(node_id)
+        if synth is None or not hasattr(synth, 'controls'):
+            return None
+        synthdef = synth.synthdef
+        if not isinstance(synthdef, supriya.synthdefs.SynthDef):
+            return sorted((control.index, 1) for control in synth.controls)
+        return [
+            (index, len(parameter))
+            for index, parameter in synthdef.indexed_parameters
+            ]
+
+    def _get_synthdef_name(self, node_id):
+        import supriya.realtime
+        import supriya.synthdefs
+        synth = self._server._nodes.get(node_id)
+        if not isinstance(synth, supriya.realtime.Synth):
+            return None
+        synthdef = synth.synthdef
+        if isinstance(synthdef, supriya.synthdefs.SynthDef):
+            return synthdef.actual_name
+        return synthdef
+
+    def _get_synth_controls(self, node_id, response):
+        import supriya.commands
+        synth = self._server._nodes.get(node_id)
+        if response is None or synth is None:
+            return ()
+        names = {control.index: control.name for control in synth.controls}
+        controls = []
+        for item in response.items:
+            for offset, value in enumerate(item.control_values):
+                index = item.starting_control_index_or_name + offset
+                controls.append(supriya.commands.QueryTreeControl(
+                    control_name_or_index=names.get(index, index),
+                    control_value=value,
+                    ))
+        return tuple(controls)
+
+    def _handle_response(self, response):
+        with self._lock:
+            if self._pending_responses is not None:
+                self._pending_responses.append(response)
+            elif not self._apply_response(response):
+                self._stale = True
+
+    def _handle_status(self, response):
+        with self._lock:
+            if self._pending_responses is not None:
+                return
+            group_count = len(self._head_ids)
+            synth_count = len(self._parent_ids) - group_count
+            if (group_count, synth_count) == (
+                response.group_count, response.synth_count):
+                self._mismatched_status_count = 0
+                return
+            # A status reply can overtake notifications sent just before it,
+            # so only a second mismatch in a row reveals lost notifications.
+            self._mismatched_status_count += 1
+            if 1 < self._mismatched_status_count:
+                self._stale = True
+
+    def _iterate_children(self, group_id):
+        child_id = self._head_ids[group_id]
+        while child_id is not None:
+            yield child_id
+            child_id = self._next_ids[child_id]
+
+    def _load(self, query_tree_group):
+        import supriya.commands
+        self.clear()
+        stack = [query_tree_group]
+        while stack:
+            group = stack.pop()
+            previous_id = None
+            for child in group.children:
+                is_group = isinstance(child, supriya.commands.QueryTreeGroup)
+                self._add(child.node_id, group.node_id, previous_id, None,
+                    is_group)
+                if is_group:
+                    stack.append(child)
+                else:
+                    self._synthdef_names[child.node_id] = child.synthdef_name
+                previous_id = child.node_id
+
+    def _plan_query(self, include_controls):
+        # Queries each largest subtree whose reply fits in half the receive
+        # buffer, leaving room for estimates falling short, with one
+        # /g_queryTree. Groups too large for that are expanded: their
+        # subgroups are planned in turn, and their synths are queried one
+        # by one with /s_getn, as scsynth cannot query only a group's
+        # direct children.
+        maximum_size = self.server.receive_buffer_size // 2
+        group_ids, stack = [], [0]
+        while stack:
+            group_id = stack.pop()
+            group_ids.append(group_id)
+            stack.extend(
+                _ for _ in self._iterate_children(group_id)
+                if _ in self._head_ids
+                )
+        sizes = {}
+        for group_id in reversed(group_ids):
+            sizes[group_id] = self._estimate_reply_size(
+                group_id, include_controls) + sum(
+                sizes.get(child_id) or self._estimate_reply_size(
+                    child_id, include_controls)
+                for child_id in self._iterate_children(group_id)
+                )
+        queried_group_ids, expanded_groups, synth_ids = [], {}, []
+        stack = [0]
+        while stack:
+            group_id = stack.pop()
+            if sizes[group_id] <= maximum_size:
+                queried_group_ids.append(group_id)
+                continue
+            children = tuple(self._iterate_children(group_id))
+            expanded_groups[group_id] = children
+            for child_id in children:
+                if child_id in self._head_ids:
+                    stack.append(child_id)
+                else:
+                    synth_ids.append(child_id)
+        return queried_group_ids, expanded_groups, synth_ids
+
+    def _remove(self, node_id):
+        self._unlink(node_id)
+        stack = [node_id]
+        while stack:
+            node_id = stack.pop()
+            child_id = self._head_ids.pop(node_id, None)
+            self._tail_ids.pop(node_id, None)
+            while child_id is not None:
+                stack.append(child_id)
+                child_id = self._next_ids[child_id]
+            del(self._parent_ids[node_id])
+            del(self._previous_ids[node_id])
+            del(self._next_ids[node_id])
+            self._synthdef_names.pop(node_id, None)
+
+    def _unlink(self, node_id):
+        parent_id = self._parent_ids[node_id]
+        previous_id = self._previous_ids[node_id]
+        next_id = self._next_ids[node_id]
+        if previous_id is None:
+            self._head_ids[parent_id] = next_id
+        else:
+            self._next_ids[previous_id] = next_id
+        if next_id is None:
+            self._tail_ids[parent_id] = previous_id
+        else:
+            self._previous_ids[next_id] = previous_id
+
+    def _walk_positions(self, query_tree_group, node_ids=None):
+        # Maps each of `node_ids`, or each node, to its parent and previous
+        # sibling among `node_ids`, so nodes missing from one tree do not
+        # count as moves.
+        import supriya.commands
+        positions = {}
+        stack = [query_tree_group]
+        while stack:
+            group = stack.pop()
+            previous_id = None
+            for child in group.children:
+                if isinstance(child, supriya.commands.QueryTreeGroup):
+                    stack.append(child)
+                if node_ids is not None and child.node_id not in node_ids:
+                    continue
+                positions[child.node_id] = (group.node_id, previous_id)
+                previous_id = child.node_id
+        return positions
+
+    ### PUBLIC METHODS ###
+
+    def clear(self):
+        """
+        Forgets all nodes but the root node, as when the server boots.
+        """
+        with self._lock:
+            self._head_ids = {0: None}
+            self._mismatched_status_count = 0
+            self._next_ids = {0: None}
+            self._parent_ids = {0: None}
+            self._pending_responses = None
+            self._previous_ids = {0: None}
+            self._stale = False
+            self._synthdef_names = {}
+            self._tail_ids = {0: None}
+
+    def diff(self):
+        """
+        Compares the mirror with the server's node proxies.
+
+        Returns dictionary of sorted node IDs: those only proxied locally,
+        those in both trees but under another parent or after another
+        sibling, and those only on the server.
+        """
+        local_tree = self.server.query_local_nodes()
+        remote_tree = self.to_query_tree_group()
+        local_ids = set(self._walk_positions(local_tree))
+        remote_ids = set(self._walk_positions(remote_tree))
+        common_ids = local_ids & remote_ids
+        local_positions = self._walk_positions(local_tree, common_ids)
+        remote_positions = self._walk_positions(remote_tree, common_ids)
+        moved_ids = (
+            node_id for node_id in common_ids
+            if local_positions[node_id] != remote_positions[node_id]
+            )
+        return {
+            'local_only': tuple(sorted(local_ids - remote_ids)),
+            'moved': tuple(sorted(moved_ids)),
+            'remote_only': tuple(sorted(remote_ids - local_ids)),
+            }
+
+    def query(self, include_controls=False, timeout=1.0):
+        """
+        Queries the server's node tree, in as many ``/g_queryTree``
+        requests as needed for each reply to fit the receive buffer.
+
+        Groups too large for one reply are assembled from the mirror, and
+        from queries of their subgroups. Controls of their synths are
+        queried with ``/s_getn`` for synths with a local proxy, and named
+        after its SynthDef's parameters, as ``/g_queryTree`` names them.
+        Synths without a local proxy have no controls.
+
+        Reconciles a stale mirror first, as it may lack nodes of groups
+        too large for one reply.
+
+        Returns query-tree group, or none if any reply timed out.
+        """
+        import supriya.commands
+        assert self.server.is_running
+        if self._stale and self._pending_responses is None:
+            if not self.reconcile(timeout=timeout):
+                return None
+        with self._lock:
+            queried_group_ids, expanded_groups, synth_ids = self._plan_query(
+                include_controls)
+            synthdef_names = {
+                node_id: self._synthdef_names.get(node_id)
+                for node_id in synth_ids
+                }
+        requests = [
+            supriya.commands.GroupQueryTreeRequest(
+                include_controls=include_controls,
+                node_id=node_id,
+                )
+            for node_id in queried_group_ids
+            ]
+        if include_controls:
+            for node_id in synth_ids:
+                index_count_pairs = self._get_index_count_pairs(node_id)
+                if not index_count_pairs:
+                    continue
+                requests.append(supriya.commands.SynthGetContiguousRequest(
+                    node_id=node_id,
+                    index_count_pairs=index_count_pairs,
+                    ))
+        responses = self._communicate(requests, timeout)
+        with self._lock:
+            # While reconciling, notifications wait to be replayed.
+            freed_ids = set(
+                _.node_id for _ in self._pending_responses or ()
+                if _.action == supriya.commands.NodeAction.NODE_REMOVED
+                )
+
+        def build(node_id):
+            key = (supriya.commands.QueryTreeResponse, node_id)
+            if key in responses:
+                return responses[key].query_tree_group
+            elif node_id in expanded_groups:
+                children = tuple(
+                    build(child_id)
+                    for child_id in expanded_groups[node_id]
+                    )
+                return supriya.commands.QueryTreeGroup(
+                    node_id=node_id,
+                    children=tuple(_ for _ in children if _ is not None),
+                    )
+            elif node_id in synthdef_names:
+                key = (supriya.commands.NodeSetContiguousResponse, node_id)
+                return supriya.commands.QueryTreeSynth(
+                    node_id=node_id,
+                    synthdef_name=synthdef_names[node_id],
+                    controls=self._get_synth_controls(
+                        node_id, responses.get(key)),
+                    )
+            elif node_id in self and node_id not in freed_ids:
+                raise RuntimeError(node_id)
+            # Freed while querying.
+            return None
+
+        try:
+            return build(0)
+        except RuntimeError:
+            print('TIMED OUT:', repr(self))
+            return None
+
+    def reconcile(self, timeout=1.0):
+        """
+        Replaces the mirror with the server's node tree, queried in full.
+
+        Notifications arriving meanwhile are replayed after, leniently, as
+        the query may already reflect them. Only groups too large for one
+        reply keep their direct children from the stale mirror; status
+        replies disagreeing with the result mark the mirror stale again.
+
+        Returns true if the server replied in time.
+        """
+        with self._lock:
+            self._pending_responses = []
+        query_tree_group = None
+        try:
+            query_tree_group = self.query(timeout=timeout)
+        finally:
+            with self._lock:
+                pending_responses = self._pending_responses or ()
+                self._pending_responses = None
+                if query_tree_group is not None:
+                    self._load(query_tree_group)
+                    self._reconciliation_count += 1
+                for pending_response in pending_responses:
+                    self._apply_response(pending_response, lenient=True)
+        return query_tree_group is not None
+
+    def to_query_tree_group(self):
+        """
+        Converts the mirror to a query-tree group, as ``/g_queryTree``
+        would reply without controls.
+
+        Returns query-tree group.
+        """
+        import supriya.commands
+
+        def recurse(node_id):
+            if node_id not in self._head_ids:
+                return supriya.commands.QueryTreeSynth(
+                    node_id=node_id,
+                    synthdef_name=self._synthdef_names.get(node_id),
+                    controls=(),
+                    )
+            children = []
+            child_id = self._head_ids[node_id]
+            while child_id is not None:
+                children.append(recurse(child_id))
+                child_id = self._next_ids[child_id]
+            return supriya.commands.QueryTreeGroup(
+                node_id=node_id,
+                children=tuple(children),
+                )
+
+        with self._lock:
+            return recurse(0)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def is_stale(self):
+        """
+        Is true once the mirror has missed notifications, until reconciled.
+        """
+        return self._stale
+
+    @property
+    def reconciliation_count(self):
+        return self._reconciliation_count
+
+    @property
+    def response_callback(self):
+        return self._response_callback
+
+    @property
+    def server(self):
+        return self._server
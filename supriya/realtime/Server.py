@@ -35,12 +35,14 @@ class Server(SupriyaObject):
         '_audio_buses',
         '_audio_input_bus_group',
         '_audio_output_bus_group',
+        '_block_allocator_class',
         '_buffer_allocator',
         '_buffers',
         '_buffer_proxies',
         '_control_bus_allocator',
         '_control_buses',
         '_control_bus_proxies',
+        '_control_write_buffer',
         '_debug_subprocess',
         '_debug_osc',
         '_debug_udp',
@@ -50,6 +52,7 @@ class Server(SupriyaObject):
         '_latency',
         '_meters',
         '_node_id_allocator',
+        '_node_tree_mirror',
         '_nodes',
         '_osc_controller',
         '_osc_dispatcher',
@@ -62,6 +65,7 @@ class Server(SupriyaObject):
         '_status',
         '_status_watcher',
         '_sync_id',
+        '_synthdef_residency',
         '_synthdefs',
         )
 
@@ -123,13 +127,14 @@ class Server(SupriyaObject):
 
         fail_callback = supriya.osc.OscCallback(
             address_pattern='/fail',
-            procedure=lambda message: print('FAILED:', message),
+            procedure=self._handle_failure,
             )
         self.register_osc_callback(fail_callback)
 
         ### ALLOCATORS ###
 
         self._audio_bus_allocator = None
+        self._block_allocator_class = supriya.realtime.BlockAllocator
         self._buffer_allocator = None
         self._control_bus_allocator = None
         self._node_id_allocator = None
@@ -160,6 +165,12 @@ class Server(SupriyaObject):
         self._buffers = {}
         self._buffer_proxies = {}
         self._nodes = {}
+        self._node_tree_mirror = supriya.realtime.NodeTreeMirror(self)
+        self.register_response_callback(
+            self._node_tree_mirror.response_callback)
+        self._control_write_buffer = supriya.realtime.ControlWriteBuffer(
+            self)
+        self._synthdef_residency = supriya.realtime.SynthDefResidency(self)
         self._synthdefs = {}
 
         ### DEBUG ###
@@ -279,7 +290,13 @@ class Server(SupriyaObject):
             self._control_bus_proxies[bus_id] = control_bus_proxy
         return control_bus_proxy
 
+    def _handle_failure(self, message):
+        if self._synthdef_residency._is_probe_failure(message):
+            return
+        print('FAILED:', message)
+
     def _setup(self):
+        self._node_tree_mirror.clear()
         self._setup_notifications()
         self._setup_status_watcher()
         self._setup_allocators(self.server_options)
@@ -288,14 +305,15 @@ class Server(SupriyaObject):
 
     def _setup_allocators(self, server_options):
         import supriya.realtime
-        self._audio_bus_allocator = supriya.realtime.BlockAllocator(
+        block_allocator_class = self.block_allocator_class
+        self._audio_bus_allocator = block_allocator_class(
             heap_maximum=server_options.audio_bus_channel_count,
             heap_minimum=server_options.first_private_bus_id,
             )
-        self._buffer_allocator = supriya.realtime.BlockAllocator(
+        self._buffer_allocator = block_allocator_class(
             heap_maximum=server_options.buffer_count,
             )
-        self._control_bus_allocator = supriya.realtime.BlockAllocator(
+        self._control_bus_allocator = block_allocator_class(
             heap_maximum=server_options.control_bus_channel_count,
             )
         self._node_id_allocator = supriya.realtime.NodeIdAllocator(
@@ -354,6 +372,7 @@ class Server(SupriyaObject):
         self._sync_id = 0
 
     def _teardown_proxies(self):
+        self._control_write_buffer.stop()
         for set_ in tuple(self._audio_buses.values()):
             for x in tuple(set_):
                 x.free()
@@ -374,6 +393,8 @@ class Server(SupriyaObject):
         self._audio_input_bus_group = None
         self._audio_output_bus_group = None
         self._nodes.clear()
+        self._node_tree_mirror.clear()
+        self._synthdef_residency.clear()
         self._synthdefs.clear()
 
     def _teardown_status_watcher(self):
@@ -560,15 +581,15 @@ class Server(SupriyaObject):
             >>> server.quit()
             <Server: offline>
 
+        Queries subtrees separately, in parallel batches, when the whole
+        tree's reply would not fit the receive buffer. Groups too large for
+        one reply are then assembled from the server's node tree mirror,
+        reconciled first if stale. Their direct synths include controls
+        only if proxied locally.
+
         Returns server query-tree group response.
         """
-        import supriya.commands
-        request = supriya.commands.GroupQueryTreeRequest(
-            node_id=0,
-            include_controls=include_controls,
-            )
-        response = request.communicate(server=self)
-        return response.query_tree_group
+        return self._node_tree_mirror.query(include_controls=include_controls)
 
     def quit(self):
         import supriya.commands
@@ -577,6 +598,7 @@ class Server(SupriyaObject):
         PubSub.notify('server-quitting')
         if self.recorder.is_recording:
             self.recorder.stop()
+        self._control_write_buffer.stop()
         request = supriya.commands.QuitRequest()
         request.communicate(server=self)
         self._is_running = False
@@ -593,6 +615,68 @@ class Server(SupriyaObject):
     def register_response_callback(self, response_callback):
         self.response_dispatcher.register_callback(response_callback)
 
+    def reset(self):
+        """
+        Resets the server to its state just after booting, without
+        quitting it.
+
+        Frees all nodes, buffers and buses, clears scheduled bundles and
+        resets allocators, but keeps loaded SynthDefs.
+
+        ::
+
+            >>> import supriya.realtime
+            >>> server = supriya.realtime.Server().boot()
+            >>> group = supriya.realtime.Group().allocate()
+            >>> buffer_ = supriya.realtime.Buffer().allocate(frame_count=8)
+
+        ::
+
+            >>> server = server.reset()
+            >>> group.is_allocated, buffer_.is_allocated
+            (False, False)
+            >>> print(server.query_remote_nodes())
+            NODE TREE 0 group
+                1 group
+
+        ::
+
+            >>> server = server.quit()
+
+        Returns server.
+        """
+        import supriya.commands
+        if not self.is_running:
+            return self
+        self._control_write_buffer.stop()
+        for set_ in tuple(self._buffers.values()):
+            for x in tuple(set_):
+                x.free()
+        for set_ in tuple(self._audio_buses.values()):
+            for x in tuple(set_):
+                x.free()
+        for set_ in tuple(self._control_buses.values()):
+            for x in tuple(set_):
+                x.free()
+        # Forget nodes locally, then free them remotely in one message.
+        for node in tuple(self._nodes.values()):
+            if node is not self._root_node:
+                node._set_parent(None)
+                node._unregister_with_local_server()
+        self._nodes.clear()
+        self._buffer_proxies = {}
+        self._control_bus_proxies = {}
+        supriya.commands.RequestBundle(contents=[
+            supriya.commands.ClearScheduleRequest(),
+            supriya.commands.GroupFreeAllRequest(group_ids=0),
+            ]).communicate(server=self)
+        # Synchronize so no /n_end for a freed node reaches the new
+        # default group, which reuses its node ID.
+        self.sync()
+        self._setup_allocators(self.server_options)
+        self._setup_proxies()
+        return self
+
     def send_message(self, message):
         if not message or not self.is_running:
             return
@@ -628,6 +712,41 @@ class Server(SupriyaObject):
     def audio_output_bus_group(self):
         return self._audio_output_bus_group
 
+    @property
+    def block_allocator_class(self):
+        """
+        Gets and sets the class used for bus and buffer allocators.
+
+        Either :py:class:`~supriya.realtime.BlockAllocator.BlockAllocator`
+        or :py:class:`~supriya.realtime.TreeBlockAllocator.TreeBlockAllocator`,
+        which scales better to many thousands of blocks. Takes effect the
+        next time the server boots.
+
+        ::
+
+            >>> import supriya.realtime
+            >>> server = supriya.realtime.Server()
+            >>> server.block_allocator_class = supriya.realtime.TreeBlockAllocator
+            >>> server.block_allocator_class.__name__
+            'TreeBlockAllocator'
+
+        ::
+
+            >>> server.block_allocator_class = supriya.realtime.BlockAllocator
+
+        """
+        return self._block_allocator_class
+
+    @block_allocator_class.setter
+    def block_allocator_class(self, block_allocator_class):
+        import supriya.realtime
+        prototype = (
+            supriya.realtime.BlockAllocator,
+            supriya.realtime.TreeBlockAllocator,
+            )
+        assert issubclass(block_allocator_class, prototype)
+        self._block_allocator_class = block_allocator_class
+
     @property
     def buffer_allocator(self):
         return self._buffer_allocator
@@ -636,6 +755,10 @@ class Server(SupriyaObject):
     def control_bus_allocator(self):
         return self._control_bus_allocator
 
+    @property
+    def control_write_buffer(self):
+        return self._control_write_buffer
+
     @property
     def debug_osc(self):
         return self._debug_osc
@@ -696,10 +819,22 @@ class Server(SupriyaObject):
     def node_id_allocator(self):
         return self._node_id_allocator
 
+    @property
+    def node_tree_mirror(self):
+        return self._node_tree_mirror
+
     @property
     def port(self):
         return self._port
 
+    @property
+    def receive_buffer_size(self):
+        return self._osc_controller.receive_buffer_size
+
+    @receive_buffer_size.setter
+    def receive_buffer_size(self, expr):
+        self._osc_controller.receive_buffer_size = expr
+
     @property
     def recorder(self):
         return self._recorder
@@ -719,3 +854,7 @@ class Server(SupriyaObject):
     @property
     def status(self):
         return self._status
+
+    @property
+    def synthdef_residency(self):
+        return self._synthdef_residency
@@ -0,0 +1,258 @@
+import collections
+import os
+import threading
+import supriya.system
+from supriya import utils
+
+
+class ServerCluster(supriya.system.SupriyaObject):
+    """
+    A cluster of servers, one per processor core by default.
+
+    Places nodes allocated against the cluster, and patterns played on
+    it, on its least-loaded server. Each server keeps its own node IDs,
+    buses and buffers.
+
+    ::
+
+        >>> import supriya.realtime
+        >>> server_cluster = supriya.realtime.ServerCluster(server_count=2)
+        >>> server_cluster = server_cluster.boot()
+
+    ::
+
+        >>> group_a = supriya.realtime.Group().allocate(target_node=server_cluster)
+        >>> group_b = supriya.realtime.Group().allocate(target_node=server_cluster)
+        >>> group_a.server is not group_b.server
+        True
+
+    ::
+
+        >>> print(server_cluster)
+        <Server: udp://127.0.0.1:57752, 8i8o>
+            NODE TREE 0 group
+                1 group
+                    1000 group
+        <Server: udp://127.0.0.1:57753, 8i8o>
+            NODE TREE 0 group
+                1 group
+                    1000 group
+
+    ::
+
+        >>> server_cluster = server_cluster.quit()
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Main Classes'
+
+    __slots__ = (
+        '_lock',
+        '_placements',
+        '_server_options',
+        '_servers',
+        )
+
+    _minimum_placement_cpu_usage = 0.1
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        server_count=None,
+        initial_port=57752,
+        ip_address='127.0.0.1',
+        server_options=None,
+        **kwargs
+        ):
+        import supriya.realtime
+        server_count = int(server_count or os.cpu_count() or 1)
+        assert 0 < server_count
+        server_options = server_options or supriya.realtime.ServerOptions()
+        assert isinstance(server_options, supriya.realtime.ServerOptions)
+        if kwargs:
+            server_options = utils.new(server_options, **kwargs)
+        self._lock = threading.RLock()
+        self._placements = {}
+        self._server_options = server_options
+        self._servers = tuple(
+            supriya.realtime.Server(
+                ip_address=ip_address,
+                port=int(initial_port) + i,
+                )
+            for i in range(server_count)
+            )
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, expr):
+        if expr in self._servers:
+            return True
+        return any(expr in server for server in self._servers)
+
+    def __enter__(self):
+        return self.boot()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.quit()
+
+    def __getitem__(self, item):
+        return self._servers[item]
+
+    def __iter__(self):
+        return iter(self._servers)
+
+    def __len__(self):
+        return len(self._servers)
+
+    def __str__(self):
+        result = []
+        for server, query_tree_group in self.query_remote_nodes(True).items():
+            result.append(repr(server))
+            for line in str(query_tree_group).splitlines():
+                result.append('    ' + line)
+        return '\n'.join(result)
+
+    ### PRIVATE METHODS ###
+
+    def _as_node_target(self):
+        return self.select_server().default_group
+
+    def _get_load(self, server):
+        # Status arrives every 100ms or so, so count placements since the
+        # last status, each costing the average CPU usage per synth, rather
+        # than sending every allocation in between to the same server. Idle
+        # servers report no synths, so each placement costs at least a
+        # floor.
+        status = server.status
+        last_status, placement_count = self._placements.get(
+            server, (None, None))
+        if status is not last_status or placement_count is None:
+            placement_count = 0
+            self._placements[server] = (status, 0)
+        average_cpu_usage = peak_cpu_usage = 0.0
+        synth_count = 0
+        if status is not None:
+            average_cpu_usage = status.average_cpu_usage or 0.0
+            peak_cpu_usage = status.peak_cpu_usage or 0.0
+            synth_count = status.synth_count or 0
+        synth_cpu_usage = self._minimum_placement_cpu_usage
+        if synth_count:
+            synth_cpu_usage = max(
+                synth_cpu_usage, average_cpu_usage / synth_count)
+        return (
+            average_cpu_usage + placement_count * synth_cpu_usage,
+            peak_cpu_usage,
+            synth_count + placement_count,
+            )
+
+    ### PUBLIC METHODS ###
+
+    def boot(self):
+        """
+        Boots all servers in parallel.
+
+        Quits those which booted and re-raises if any server fails to boot.
+
+        Returns server cluster.
+        """
+        exceptions = []
+
+        def boot(server):
+            try:
+                server.boot(server_options=self.server_options)
+            except Exception as exception:
+                exceptions.append(exception)
+
+        threads = [
+            threading.Thread(target=boot, args=(server,))
+            for server in self._servers
+            if not server.is_running
+            ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if exceptions:
+            self.quit()
+            raise exceptions[0]
+        return self
+
+    def query_local_nodes(self, include_controls=False):
+        """
+        Queries all node proxies in Python, on all running servers.
+
+        Returns ordered dictionary of servers and their query-tree groups.
+        """
+        return collections.OrderedDict(
+            (server, server.query_local_nodes(include_controls))
+            for server in self._servers
+            if server.is_running
+            )
+
+    def query_remote_nodes(self, include_controls=False):
+        """
+        Queries all nodes on all running servers.
+
+        Returns ordered dictionary of servers and their query-tree groups.
+        """
+        return collections.OrderedDict(
+            (server, server.query_remote_nodes(include_controls))
+            for server in self._servers
+            if server.is_running
+            )
+
+    def quit(self):
+        """
+        Quits all servers.
+
+        Returns server cluster.
+        """
+        for server in self._servers:
+            server.quit()
+        with self._lock:
+            self._placements.clear()
+        return self
+
+    def select_server(self):
+        """
+        Selects the least-loaded running server, by average CPU usage, then
+        peak CPU usage, then synth count, and counts a placement on it.
+
+        Raises ``RuntimeError`` if no server is running.
+
+        Returns server.
+        """
+        with self._lock:
+            servers = [_ for _ in self._servers if _.is_running]
+            if not servers:
+                raise RuntimeError('No server running')
+            server = min(servers, key=self._get_load)
+            status, placement_count = self._placements[server]
+            self._placements[server] = (status, placement_count + 1)
+        return server
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def initial_port(self):
+        return self._servers[0].port
+
+    @property
+    def ip_address(self):
+        return self._servers[0].ip_address
+
+    @property
+    def server_count(self):
+        return len(self._servers)
+
+    @property
+    def server_options(self):
+        return self._server_options
+
+    @property
+    def servers(self):
+        return self._servers
+
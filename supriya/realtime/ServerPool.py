@@ -0,0 +1,289 @@
+import collections
+import threading
+import time
+import supriya.system
+from supriya import utils
+
+
+class ServerPool(supriya.system.SupriyaObject):
+    """
+    A pool of booted servers.
+
+    Boots servers ahead of time, in parallel and on consecutive ports, so
+    acquiring a server skips booting ``scsynth`` and loading SynthDefs.
+    Released servers are reset rather than quit, and keep the SynthDefs
+    they hold.
+
+    ::
+
+        >>> import supriya.realtime
+        >>> server_pool = supriya.realtime.ServerPool(server_count=2)
+        >>> server_pool = server_pool.start()
+
+    ::
+
+        >>> server = server_pool.acquire()
+        >>> server
+        <Server: udp://127.0.0.1:57752, 8i8o>
+
+    ::
+
+        >>> group = supriya.realtime.Group().allocate(target_node=server)
+        >>> server_pool.release(server)
+        >>> group.is_allocated
+        False
+
+    ::
+
+        >>> len(server_pool.boot_latencies)
+        2
+
+    ::
+
+        >>> server_pool = server_pool.stop()
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Main Classes'
+
+    __slots__ = (
+        '_acquire_latencies',
+        '_acquired_servers',
+        '_available_servers',
+        '_boot_latencies',
+        '_condition',
+        '_initial_port',
+        '_ip_address',
+        '_reset_latencies',
+        '_server_count',
+        '_server_options',
+        '_servers',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        server_count=4,
+        initial_port=57752,
+        ip_address='127.0.0.1',
+        server_options=None,
+        **kwargs
+        ):
+        import supriya.realtime
+        server_count = int(server_count)
+        assert 0 < server_count
+        server_options = server_options or supriya.realtime.ServerOptions()
+        assert isinstance(server_options, supriya.realtime.ServerOptions)
+        if kwargs:
+            server_options = utils.new(server_options, **kwargs)
+        self._acquire_latencies = []
+        self._acquired_servers = set()
+        self._available_servers = collections.deque()
+        self._boot_latencies = []
+        self._condition = threading.Condition()
+        self._initial_port = int(initial_port)
+        self._ip_address = ip_address
+        self._reset_latencies = []
+        self._server_count = server_count
+        self._server_options = server_options
+        self._servers = ()
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, server):
+        return server in self._servers
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def __iter__(self):
+        return iter(self._servers)
+
+    def __len__(self):
+        return len(self._servers)
+
+    ### PRIVATE METHODS ###
+
+    def _boot_server(self, server):
+        start_time = time.time()
+        server.boot(server_options=self.server_options)
+        with self._condition:
+            self._boot_latencies.append(time.time() - start_time)
+
+    ### PUBLIC METHODS ###
+
+    def acquire(self, timeout=None):
+        """
+        Acquires a booted server, waiting up to `timeout` seconds for one to
+        be released if none is available.
+
+        Raises ``RuntimeError`` if the pool is not started, or no server is
+        released in time.
+
+        Returns server.
+        """
+        start_time = time.time()
+        with self._condition:
+            if not self._servers:
+                raise RuntimeError('Server pool not started')
+            if not self._condition.wait_for(
+                lambda: self._available_servers or not self._servers,
+                timeout=timeout,
+                ):
+                raise RuntimeError('No server available')
+            if not self._servers:
+                raise RuntimeError('Server pool stopped')
+            server = self._available_servers.popleft()
+            self._acquired_servers.add(server)
+            self._acquire_latencies.append(time.time() - start_time)
+        return server
+
+    def release(self, server):
+        """
+        Resets `server` and returns it to the pool, rebooting it if it quit.
+
+        Ignores servers released after the pool stopped. Quits `server` and
+        drops it from the pool, then re-raises, if resetting or rebooting it
+        fails.
+        """
+        with self._condition:
+            if server not in self._acquired_servers:
+                if server in self._servers:
+                    raise ValueError('Server not acquired: {!r}'.format(server))
+                return
+        start_time = time.time()
+        try:
+            if server.is_running:
+                server.reset()
+                reset_latencies = self._reset_latencies
+            else:
+                server.boot(server_options=self.server_options)
+                reset_latencies = self._boot_latencies
+        except Exception:
+            with self._condition:
+                self._acquired_servers.discard(server)
+                self._servers = tuple(
+                    _ for _ in self._servers if _ is not server)
+                # Waiters raise if no server is left.
+                self._condition.notify_all()
+            server.quit()
+            raise
+        with self._condition:
+            reset_latencies.append(time.time() - start_time)
+            if server not in self._acquired_servers:
+                return
+            self._acquired_servers.remove(server)
+            self._available_servers.append(server)
+            self._condition.notify()
+
+    def start(self):
+        """
+        Boots all servers in parallel.
+
+        Quits those which booted and re-raises if any server fails to boot.
+
+        Returns server pool.
+        """
+        import supriya.realtime
+        if self._servers:
+            return self
+        servers = tuple(
+            supriya.realtime.Server(
+                ip_address=self.ip_address,
+                port=self.initial_port + i,
+                )
+            for i in range(self.server_count)
+            )
+        exceptions = []
+
+        def boot(server):
+            try:
+                self._boot_server(server)
+            except Exception as exception:
+                exceptions.append(exception)
+
+        threads = [
+            threading.Thread(target=boot, args=(server,))
+            for server in servers
+            ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if exceptions:
+            for server in servers:
+                server.quit()
+            raise exceptions[0]
+        with self._condition:
+            self._servers = servers
+            self._available_servers.extend(servers)
+        return self
+
+    def stop(self):
+        """
+        Quits all servers, acquired or not.
+
+        Returns server pool.
+        """
+        with self._condition:
+            servers = self._servers
+            self._servers = ()
+            self._acquired_servers.clear()
+            self._available_servers.clear()
+            self._condition.notify_all()
+        for server in servers:
+            server.quit()
+        return self
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def acquire_latencies(self):
+        """
+        Seconds each acquisition waited for an available server.
+        """
+        return tuple(self._acquire_latencies)
+
+    @property
+    def available_count(self):
+        return len(self._available_servers)
+
+    @property
+    def boot_latencies(self):
+        """
+        Seconds each server took to boot, including SynthDef loading.
+        """
+        return tuple(self._boot_latencies)
+
+    @property
+    def initial_port(self):
+        return self._initial_port
+
+    @property
+    def ip_address(self):
+        return self._ip_address
+
+    @property
+    def reset_latencies(self):
+        """
+        Seconds each released server took to reset.
+        """
+        return tuple(self._reset_latencies)
+
+    @property
+    def server_count(self):
+        return self._server_count
+
+    @property
+    def server_options(self):
+        return self._server_options
+
+    @property
+    def servers(self):
+        return self._servers
@@ -1,5 +1,7 @@
+import sys
 import threading
 import time
+import traceback
 import supriya.system
 
 
@@ -42,6 +44,7 @@ class StatusWatcher(threading.Thread):
         if response is None:
             return
         self._server._status = response
+        self._server.node_tree_mirror._handle_status(response)
         self._attempts = 0
         supriya.system.PubSub.notify(
             'server-status',
@@ -62,6 +65,13 @@ class StatusWatcher(threading.Thread):
             self.server.send_message(message)
             self._attempts += 1
             time.sleep(0.1)
+            if self._active and self.server.node_tree_mirror.is_stale:
+                try:
+                    self.server.node_tree_mirror.reconcile()
+                except Exception:
+                    # The server may quit mid-query; keep watching status.
+                    sys.stderr.write('Exception in node tree reconcile:\n')
+                    traceback.print_exc()
         self.server.unregister_response_callback(self.response_callback)
 
     ### PUBLIC PROPERTIES ###
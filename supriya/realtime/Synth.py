@@ -143,8 +143,7 @@ class Synth(Node):
             node_id_is_permanent=node_id_is_permanent,
             target_node=target_node,
             )
-        if not self.synthdef.is_allocated:
-            self.synthdef.allocate()
+        self.synthdef._allocate_synthdefs((self.synthdef,), self.server)
         self.controls._set(**kwargs)
         requests = []
         settings, map_requests = self.controls._make_synth_new_settings()
@@ -143,8 +143,18 @@ class SynthControl:
                 self.node,
                 **{self.name: self._value}
                 )
-        if self.node.is_allocated:
-            request.communicate(server=self.node.server)
+        if not self.node.is_allocated:
+            return self.get()
+        control_write_buffer = self.node.server.control_write_buffer
+        if control_write_buffer.is_running:
+            if isinstance(request, supriya.commands.NodeSetRequest):
+                control_write_buffer.write(
+                    self.node.node_id,
+                    **{self.name: self._value}
+                    )
+                return self.get()
+            control_write_buffer.discard(self.node.node_id, self.name)
+        request.communicate(server=self.node.server)
         return self.get()
 
     ### PUBLIC PROPERTIES ###
@@ -0,0 +1,342 @@
+import collections
+import os
+import shutil
+import tempfile
+import threading
+import supriya.system
+
+
+class SynthDefResidency(supriya.system.SupriyaObject):
+    """
+    Tracks which SynthDefs a server holds.
+
+    Maps SynthDef names to the anonymous names, or content hashes, of the
+    SynthDefs last sent under them. Allocating SynthDefs sends only those
+    the server does not already hold, packed into as few ``/d_recv``
+    requests as fit in a datagram, and synchronizes once after sending all
+    of them.
+
+    ::
+
+        >>> import supriya.realtime
+        >>> server = supriya.realtime.Server().boot()
+        >>> with supriya.synthdefs.SynthDefBuilder(frequency=440) as builder:
+        ...     sin_osc = supriya.ugens.SinOsc.ar(frequency=builder['frequency'])
+        ...     out = supriya.ugens.Out.ar(bus=0, source=sin_osc)
+        ...
+        >>> synthdef = builder.build()
+
+    ::
+
+        >>> server.synthdef_residency.allocate([synthdef, synthdef])
+        (<SynthDef: ...>,)
+        >>> synthdef in server.synthdef_residency
+        True
+        >>> server.synthdef_residency.allocate([synthdef])
+        ()
+
+    Querying probes the server for SynthDefs by name, so residency can be
+    verified after another client frees or sends SynthDefs:
+
+    ::
+
+        >>> server.synthdef_residency.verify()
+        >>> synthdef in server.synthdef_residency
+        True
+
+    ::
+
+        >>> server = server.quit()
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Server Internals'
+
+    __slots__ = (
+        '_loading_events',
+        '_lock',
+        '_probe_count',
+        '_resident_names',
+        '_server',
+        )
+
+    _maximum_datagram_size = 8192
+
+    ### INITIALIZER ###
+
+    def __init__(self, server):
+        self._loading_events = {}
+        self._lock = threading.RLock()
+        self._probe_count = 0
+        self._resident_names = {}
+        self._server = server
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, synthdef):
+        import supriya.synthdefs
+        if not isinstance(synthdef, supriya.synthdefs.SynthDef):
+            return False
+        with self._lock:
+            anonymous_name = self._resident_names.get(synthdef.actual_name)
+        return anonymous_name == synthdef.anonymous_name
+
+    def __len__(self):
+        with self._lock:
+            return len(self._resident_names)
+
+    ### PRIVATE METHODS ###
+
+    def _build_requests(self, synthdefs):
+        import supriya.commands
+        import supriya.synthdefs
+        synthdef_cache = supriya.synthdefs.SynthDefCache.get_default_cache()
+        sized_synthdefs = sorted(
+            (
+                (len(synthdef_cache.compile_synthdef(synthdef)), synthdef)
+                for synthdef in synthdefs
+                ),
+            key=lambda pair: (-pair[0], pair[1].actual_name),
+            )
+        # First-fit decreasing: pack each SynthDef, largest first, into the
+        # first /d_recv with room left, so sends take the fewest datagrams.
+        groups, totals, d_load_synthdefs = [], [], []
+        for size, synthdef in sized_synthdefs:
+            if self._maximum_datagram_size < size:
+                d_load_synthdefs.append(synthdef)
+                continue
+            for i, total in enumerate(totals):
+                if total + size < self._maximum_datagram_size:
+                    groups[i].append(synthdef)
+                    totals[i] += size
+                    break
+            else:
+                groups.append([synthdef])
+                totals.append(size)
+        requests = [
+            supriya.commands.SynthDefReceiveRequest(synthdefs=tuple(group))
+            for group in groups
+            ]
+        if synthdef_cache.directory_path is not None:
+            # Cached files persist, so each is written only once.
+            for synthdef in d_load_synthdefs:
+                requests.append(supriya.commands.SynthDefLoadRequest(
+                    synthdef_path=synthdef_cache.get_file_path(synthdef),
+                    ))
+            d_load_synthdefs = []
+        return requests, d_load_synthdefs
+
+    def _handle_probe_response(self, message, node_ids, names):
+        if message.address == '/n_go':
+            name = node_ids.get(message.contents[0])
+            if name is not None:
+                names.add(name)
+
+    def _is_probe_failure(self, message):
+        with self._lock:
+            if not self._probe_count:
+                return False
+        return tuple(message.contents[:2]) == ('/s_new', 'SynthDef not found')
+
+    def _load_temporary_files(self, synthdefs):
+        import supriya.commands
+        temp_directory_path = tempfile.mkdtemp()
+        try:
+            for synthdef in synthdefs:
+                file_name = '{}.scsyndef'.format(synthdef.actual_name)
+                file_path = os.path.join(temp_directory_path, file_name)
+                with open(file_path, 'wb') as file_pointer:
+                    file_pointer.write(synthdef.compile())
+            request = supriya.commands.SynthDefLoadDirectoryRequest(
+                directory_path=temp_directory_path,
+                )
+            request.communicate(server=self.server, sync=True)
+        finally:
+            shutil.rmtree(temp_directory_path)
+
+    ### PUBLIC METHODS ###
+
+    def allocate(self, synthdefs, sync=True, timeout=1.0):
+        """
+        Sends those of `synthdefs` the server does not hold yet.
+
+        Sends each SynthDef at most once, even when several threads allocate
+        it at once. Waits until the server has loaded all of `synthdefs` if
+        `sync` is true, including those other threads are still sending.
+        SynthDefs too large for a datagram, and not cached on disk, are
+        loaded from temporary files and always waited for.
+
+        Returns tuple of sent SynthDefs.
+        """
+        pending_synthdefs = collections.OrderedDict()
+        previous_names = {}
+        loading_events = set()
+        with self._lock:
+            for synthdef in synthdefs:
+                name = synthdef.actual_name
+                anonymous_name = synthdef.anonymous_name
+                if self._resident_names.get(name) == anonymous_name:
+                    if name in self._loading_events:
+                        loading_events.add(self._loading_events[name])
+                    continue
+                previous_names[name] = self._resident_names.get(name)
+                self._resident_names[name] = anonymous_name
+                pending_synthdefs[name] = synthdef
+            loading_event = threading.Event()
+            for name in pending_synthdefs:
+                self._loading_events[name] = loading_event
+        try:
+            if pending_synthdefs:
+                requests, d_load_synthdefs = self._build_requests(
+                    pending_synthdefs.values())
+                for request in requests:
+                    request.communicate(server=self.server, sync=False)
+                if d_load_synthdefs:
+                    self._load_temporary_files(d_load_synthdefs)
+                elif sync and requests:
+                    self.server.sync()
+        except Exception:
+            # Tracked before sending, so other threads wait rather than
+            # resend, but nothing unsent is resident.
+            with self._lock:
+                for name, synthdef in pending_synthdefs.items():
+                    anonymous_name = self._resident_names.get(name)
+                    if anonymous_name != synthdef.anonymous_name:
+                        continue
+                    elif previous_names[name] is None:
+                        del(self._resident_names[name])
+                    else:
+                        self._resident_names[name] = previous_names[name]
+            raise
+        finally:
+            with self._lock:
+                for name in pending_synthdefs:
+                    if self._loading_events.get(name) is loading_event:
+                        del(self._loading_events[name])
+            loading_event.set()
+        if sync and loading_events:
+            # Once other threads have sent, /sync also waits for their loads.
+            for loading_event in loading_events:
+                loading_event.wait(timeout)
+            self.server.sync()
+        return tuple(pending_synthdefs.values())
+
+    def clear(self):
+        """
+        Forgets all SynthDefs, as when the server quits.
+        """
+        with self._lock:
+            self._loading_events.clear()
+            self._resident_names.clear()
+
+    def discard(self, name):
+        """
+        Forgets the SynthDef named `name`, as when it is freed.
+        """
+        with self._lock:
+            self._resident_names.pop(name, None)
+
+    def query(self, names=None, timeout=1.0):
+        """
+        Queries the server for SynthDefs named `names`, or for all
+        SynthDefs tracked as resident if `names` is none.
+
+        Probes by creating one synth per name in a paused group, freed in
+        the same bundle, so no probe synth ever runs. The server's failure
+        replies for missing names are not printed.
+
+        Returns set of names the server holds.
+        """
+        import supriya.commands
+        import supriya.osc
+        import supriya.realtime
+        if names is None:
+            with self._lock:
+                names = sorted(self._resident_names)
+        names = list(names)
+        found_names = set()
+        if not names:
+            return found_names
+        node_id_allocator = self.server.node_id_allocator
+        group_id = node_id_allocator.allocate_node_id()
+        node_ids = {
+            node_id_allocator.allocate_node_id(): name
+            for name in names
+            }
+        requests = [
+            supriya.commands.GroupNewRequest(
+                add_action=supriya.realtime.AddAction.ADD_TO_TAIL,
+                node_id=group_id,
+                target_node_id=0,
+                ),
+            supriya.commands.NodeRunRequest(
+                node_id_run_flag_pairs=[(group_id, False)],
+                ),
+            ]
+        for node_id, name in node_ids.items():
+            requests.append(supriya.commands.SynthNewRequest(
+                add_action=supriya.realtime.AddAction.ADD_TO_TAIL,
+                node_id=node_id,
+                synthdef=name,
+                target_node_id=group_id,
+                ))
+        requests.append(supriya.commands.NodeFreeRequest(node_ids=[group_id]))
+        callback = supriya.osc.OscCallback(
+            address_pattern='/n_go',
+            procedure=lambda message: self._handle_probe_response(
+                message, node_ids, found_names),
+            )
+        self.server.register_osc_callback(callback)
+        with self._lock:
+            self._probe_count += 1
+        try:
+            supriya.commands.RequestBundle(contents=requests).communicate(
+                server=self.server)
+            sync_request = supriya.commands.SyncRequest(
+                sync_id=self.server.next_sync_id,
+                )
+            sync_request.communicate(server=self.server, timeout=timeout)
+        finally:
+            self.server.unregister_osc_callback(callback)
+            with self._lock:
+                self._probe_count -= 1
+        return found_names
+
+    def verify(self, synthdefs=None, timeout=1.0):
+        """
+        Queries the server, and forgets SynthDefs it no longer holds.
+
+        Also tracks those of `synthdefs` the server holds under their
+        anonymous names: such names identify their contents, so finding
+        them proves residency, even when sent by another client.
+        """
+        anonymous_synthdefs = {
+            synthdef.anonymous_name: synthdef
+            for synthdef in synthdefs or ()
+            if not synthdef.name
+            }
+        with self._lock:
+            names = set(self._resident_names)
+        names.update(anonymous_synthdefs)
+        found_names = self.query(sorted(names), timeout=timeout)
+        with self._lock:
+            for name in names.difference(found_names):
+                self._resident_names.pop(name, None)
+            for name in found_names.intersection(anonymous_synthdefs):
+                self._resident_names[name] = name
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def resident_names(self):
+        """
+        Names of the SynthDefs tracked as resident on the server.
+        """
+        with self._lock:
+            return frozenset(self._resident_names)
+
+    @property
+    def server(self):
+        return self._server
@@ -67,7 +67,7 @@ class SynthInterface(ControlInterface):
         synth_control_names = [x.name for x in synth_controls]
         settings = dict(zip(synth_control_names, values))
         messages = self._set(**settings)
-        if self.client.is_allocated:
+        if messages:
             message_bundler = supriya.realtime.MessageBundler(
                 server=self.client.server,
                 sync=False,
@@ -0,0 +1,259 @@
+import random
+import threading
+from supriya.system.SupriyaObject import SupriyaObject
+
+
+class TreeBlockAllocator(SupriyaObject):
+    """
+    A block allocator backed by a size-augmented balanced tree.
+
+    Behaves like :py:class:`~supriya.realtime.BlockAllocator.BlockAllocator`,
+    always allocating the lowest-addressed free block which fits, but keeps
+    free blocks in a treap ordered by start offset, with each node caching
+    the largest free block size in its subtree. Allocation and freeing take
+    logarithmic rather than linear time, and adjacent free blocks coalesce
+    on free.
+
+    ::
+
+        >>> import supriya.realtime
+        >>> allocator = supriya.realtime.TreeBlockAllocator(
+        ...     heap_maximum=16,
+        ...     )
+
+    ::
+
+        >>> allocator.allocate(4)
+        0
+
+    ::
+
+        >>> allocator.allocate(4)
+        4
+
+    ::
+
+        >>> allocator.allocate(4)
+        8
+
+    ::
+
+        >>> allocator.allocate(8) is None
+        True
+
+    ::
+
+        >>> allocator.free(8)
+        >>> allocator.allocate(8)
+        8
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Server Internals'
+
+    __slots__ = (
+        '_free_by_start',
+        '_free_by_stop',
+        '_heap_maximum',
+        '_heap_minimum',
+        '_lock',
+        '_random',
+        '_root',
+        '_used_blocks',
+        )
+
+    class Node(object):
+
+        __slots__ = (
+            'left',
+            'maximum_size',
+            'priority',
+            'right',
+            'start_offset',
+            'stop_offset',
+            )
+
+        def __init__(self, start_offset, stop_offset, priority):
+            self.left = None
+            self.right = None
+            self.priority = priority
+            self.start_offset = start_offset
+            self.stop_offset = stop_offset
+            self.maximum_size = stop_offset - start_offset
+
+        def update(self):
+            maximum_size = self.stop_offset - self.start_offset
+            if self.left is not None and maximum_size < self.left.maximum_size:
+                maximum_size = self.left.maximum_size
+            if (
+                self.right is not None and
+                maximum_size < self.right.maximum_size
+                ):
+                maximum_size = self.right.maximum_size
+            self.maximum_size = maximum_size
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        heap_maximum=None,
+        heap_minimum=0,
+        ):
+        self._heap_maximum = heap_maximum
+        self._heap_minimum = heap_minimum
+        self._lock = threading.Lock()
+        self._random = random.Random(0)
+        self._root = None
+        self._free_by_start = {}
+        self._free_by_stop = {}
+        self._used_blocks = {}
+        if heap_maximum is None:
+            heap_maximum = float('inf')
+        self._insert_free_block(heap_minimum, heap_maximum)
+
+    ### PRIVATE METHODS ###
+
+    def _find_first_fit(self, desired_block_size):
+        node = self._root
+        if node is None or node.maximum_size < desired_block_size:
+            return None
+        while True:
+            left = node.left
+            if left is not None and desired_block_size <= left.maximum_size:
+                node = left
+            elif desired_block_size <= node.stop_offset - node.start_offset:
+                return node
+            else:
+                node = node.right
+
+    def _find_floor(self, offset):
+        node, result = self._root, None
+        while node is not None:
+            if node.start_offset <= offset:
+                result = node
+                node = node.right
+            else:
+                node = node.left
+        return result
+
+    def _insert_free_block(self, start_offset, stop_offset):
+        node = self.Node(start_offset, stop_offset, self._random.random())
+        left, right = self._split(self._root, start_offset)
+        self._root = self._merge(self._merge(left, node), right)
+        self._free_by_start[start_offset] = stop_offset
+        self._free_by_stop[stop_offset] = start_offset
+
+    def _merge(self, left, right):
+        if left is None:
+            return right
+        elif right is None:
+            return left
+        elif right.priority < left.priority:
+            left.right = self._merge(left.right, right)
+            left.update()
+            return left
+        right.left = self._merge(left, right.left)
+        right.update()
+        return right
+
+    def _remove_free_block(self, start_offset):
+        stop_offset = self._free_by_start.pop(start_offset)
+        del(self._free_by_stop[stop_offset])
+        left, right = self._split(self._root, start_offset)
+        _, right = self._split(right, start_offset, inclusive=True)
+        self._root = self._merge(left, right)
+        return stop_offset
+
+    def _split(self, node, offset, inclusive=False):
+        """
+        Splits the subtree at `node` into nodes starting before `offset`
+        (or at it, when `inclusive`) and all other nodes.
+        """
+        if node is None:
+            return None, None
+        if (
+            node.start_offset < offset or
+            (inclusive and node.start_offset == offset)
+            ):
+            left, right = self._split(node.right, offset, inclusive)
+            node.right = left
+            node.update()
+            return node, right
+        left, right = self._split(node.left, offset, inclusive)
+        node.left = right
+        node.update()
+        return left, node
+
+    ### PUBLIC METHODS ###
+
+    def allocate(self, desired_block_size=1):
+        desired_block_size = int(desired_block_size)
+        assert 0 < desired_block_size
+        with self._lock:
+            node = self._find_first_fit(desired_block_size)
+            if node is None:
+                return None
+            start_offset = node.start_offset
+            stop_offset = self._remove_free_block(start_offset)
+            split_offset = start_offset + desired_block_size
+            if split_offset < stop_offset:
+                self._insert_free_block(split_offset, stop_offset)
+            self._used_blocks[start_offset] = split_offset
+        return start_offset
+
+    def allocate_at(self, index=None, desired_block_size=1):
+        index = int(index)
+        desired_block_size = int(desired_block_size)
+        start_offset = index
+        stop_offset = index + desired_block_size
+        with self._lock:
+            node = self._find_floor(start_offset)
+            if node is None or node.stop_offset < stop_offset:
+                return None
+            free_start_offset = node.start_offset
+            free_stop_offset = self._remove_free_block(free_start_offset)
+            if free_start_offset < start_offset:
+                self._insert_free_block(free_start_offset, start_offset)
+            if stop_offset < free_stop_offset:
+                self._insert_free_block(stop_offset, free_stop_offset)
+            self._used_blocks[start_offset] = stop_offset
+        return index
+
+    def free(self, block_id):
+        block_id = int(block_id)
+        with self._lock:
+            if block_id not in self._used_blocks:
+                # Freeing by an index inside a block is rare: scan for it.
+                block_ids = [
+                    start_offset
+                    for start_offset, stop_offset in self._used_blocks.items()
+                    if start_offset < block_id < stop_offset
+                    ]
+                assert len(block_ids) == 1
+                block_id = block_ids[0]
+            start_offset = block_id
+            stop_offset = self._used_blocks.pop(block_id)
+            if start_offset in self._free_by_stop:
+                start_offset = self._free_by_stop[start_offset]
+                self._remove_free_block(start_offset)
+            if stop_offset in self._free_by_start:
+                stop_offset = self._remove_free_block(stop_offset)
+            self._insert_free_block(start_offset, stop_offset)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def heap_maximum(self):
+        """
+        Maximum allocatable index.
+        """
+        return self._heap_maximum
+
+    @property
+    def heap_minimum(self):
+        """
+        Minimum allocatable index.
+        """
+        return self._heap_minimum
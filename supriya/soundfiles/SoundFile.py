@@ -1,60 +1,324 @@
 import os
+import struct
 from supriya.system.SupriyaObject import SupriyaObject
 
 
 class SoundFile(SupriyaObject):
+    """
+    A soundfile.
+
+    Reads frames through libsndfile by default, reopening the file for each
+    read.
+
+    Memory-mapped soundfiles instead map the sample data of PCM and
+    floating-point WAV and AIFF files into a NumPy array, decoding only the
+    frames read. They slice ranges of frames and channels, and compute peak
+    and RMS amplitudes per block, without reopening the file:
+
+    ::
+
+        >>> import supriya.soundfiles
+        >>> soundfile = supriya.soundfiles.SoundFile(
+        ...     'output.aiff', memory_map=True)  # doctest: +SKIP
+        >>> soundfile[44100:88200, 0]  # doctest: +SKIP
+        >>> soundfile.get_rms(block_size=1024)  # doctest: +SKIP
+
+    """
 
     ### CLASS VARIABLES ###
 
     __slots__ = (
+        '_bit_depth',
         '_channel_count',
         '_file_path',
         '_frame_count',
+        '_is_big_endian',
         '_sample_rate',
+        '_samples',
         )
 
+    _aiff_compression_types = {
+        b'NONE': ('>', 'i'),
+        b'twos': ('>', 'i'),
+        b'sowt': ('<', 'i'),
+        b'fl32': ('>', 'f'),
+        b'FL32': ('>', 'f'),
+        b'fl64': ('>', 'f'),
+        b'FL64': ('>', 'f'),
+        }
+
+    _chunk_frame_count = 65536
+
+    _wav_format_tags = {
+        0x0001: 'i',
+        0x0003: 'f',
+        }
+
     ### INITIALIZER ###
 
-    def __init__(self, file_path):
-        import wavefile
+    def __init__(self, file_path, memory_map=False):
         file_path = os.path.abspath(str(file_path))
         assert os.path.exists(file_path)
         self._file_path = file_path
+        self._bit_depth = None
+        self._is_big_endian = False
+        self._samples = None
+        if memory_map:
+            self._map_samples()
+            return
+        import wavefile
         with wavefile.WaveReader(self.file_path) as reader:
             self._frame_count = reader.frames
             self._channel_count = reader.channels
             self._sample_rate = reader.samplerate
 
-    ### PUBLIC METHODS ###
+    ### SPECIAL METHODS ###
 
-    def at_frame(self, frames):
+    def __getitem__(self, item):
+        """
+        Gets frames, and optionally channels, of a memory-mapped soundfile
+        as 32-bit floats between -1 and 1.
+
+        Returns NumPy array.
+        """
+        if self._samples is None:
+            raise ValueError('Soundfile is not memory-mapped.')
+        return self._decode(self._samples[item])
+
+    ### PRIVATE METHODS ###
+
+    def _decode(self, samples):
+        import numpy
+        if samples.dtype.kind == 'f':
+            return samples.astype(numpy.float32)
+        elif self._bit_depth == 24:
+            # Packed 24-bit samples: shift each into the top of an int32.
+            if self._is_big_endian:
+                samples = samples[..., ::-1]
+            integers = (
+                samples[..., 0].astype(numpy.int32) << 8 |
+                samples[..., 1].astype(numpy.int32) << 16 |
+                samples[..., 2].astype(numpy.int32) << 24
+                )
+            return integers.astype(numpy.float32) / 2 ** 31
+        elif samples.dtype.kind == 'u':
+            # 8-bit WAV samples are offset binary.
+            return (samples.astype(numpy.float32) - 128) / 128
+        scale = 2 ** (samples.dtype.itemsize * 8 - 1)
+        return samples.astype(numpy.float32) / scale
+
+    def _iterate_blocks(self, block_size):
+        """
+        Iterates over the frames of a memory-mapped soundfile in arrays of
+        consecutive blocks, decoding a bounded number of frames at a time.
+        The last block may be short.
+        """
+        import numpy
+        block_size = int(block_size or self._chunk_frame_count)
+        assert 0 < block_size
+        chunk_frame_count = block_size * max(
+            1, self._chunk_frame_count // block_size)
+        for start_frame in range(0, self.frame_count, chunk_frame_count):
+            frames = self[start_frame:start_frame + chunk_frame_count]
+            whole_frame_count = len(frames) - len(frames) % block_size
+            if whole_frame_count:
+                yield frames[:whole_frame_count].reshape(
+                    -1, block_size, self.channel_count)
+            if whole_frame_count < len(frames):
+                yield frames[whole_frame_count:][numpy.newaxis]
+
+    def _map_samples(self):
+        import numpy
+        with open(self.file_path, 'rb') as file_pointer:
+            header = file_pointer.read(12)
+            if header[:4] == b'RIFF' and header[8:] == b'WAVE':
+                result = self._read_wav_header(file_pointer)
+            elif header[:4] == b'FORM' and header[8:] in (b'AIFF', b'AIFC'):
+                result = self._read_aiff_header(file_pointer, header[8:])
+            else:
+                raise ValueError(
+                    'Cannot memory-map {}: not a WAV or AIFF file.'.format(
+                        self.file_path))
+        data_offset, data_size, byte_order, kind, bit_depth = result
+        if kind == 'f' and bit_depth not in (32, 64):
+            raise ValueError('Unsupported float bit depth: {}'.format(
+                bit_depth))
+        elif kind == 'i' and bit_depth not in (8, 16, 24, 32):
+            raise ValueError('Unsupported integer bit depth: {}'.format(
+                bit_depth))
+        elif kind == 'i' and bit_depth == 8 and byte_order == '<':
+            kind = 'u'
+        self._bit_depth = bit_depth
+        self._is_big_endian = byte_order == '>'
+        data_frame_count = data_size // (bit_depth // 8 * self._channel_count)
+        if self._frame_count is None:
+            self._frame_count = data_frame_count
+        self._frame_count = min(self._frame_count, data_frame_count)
+        shape = (self._frame_count, self._channel_count)
+        if bit_depth == 24:
+            # NumPy has no 24-bit integers: map each sample's three bytes.
+            dtype = numpy.dtype(numpy.uint8)
+            shape += (3,)
+        else:
+            dtype = numpy.dtype('{}{}{}'.format(
+                byte_order, kind, bit_depth // 8))
+        if not self._frame_count:
+            self._samples = numpy.zeros(shape, dtype=dtype)
+            return
+        self._samples = numpy.memmap(
+            self.file_path,
+            dtype=dtype,
+            mode='r',
+            offset=data_offset,
+            shape=shape,
+            )
+
+    def _read_aiff_header(self, file_pointer, form_type):
+        byte_order, kind, bit_depth = '>', 'i', None
+        data_offset = data_size = None
+        while True:
+            chunk_header = file_pointer.read(8)
+            if len(chunk_header) < 8:
+                break
+            chunk_id, chunk_size = struct.unpack('>4sI', chunk_header)
+            chunk_start = file_pointer.tell()
+            if chunk_id == b'COMM':
+                chunk = file_pointer.read(chunk_size)
+                channel_count, frame_count, bit_depth = struct.unpack(
+                    '>hIh', chunk[:8])
+                exponent, mantissa = struct.unpack('>HQ', chunk[8:18])
+                sample_rate = mantissa * 2.0 ** (
+                    (exponent & 0x7FFF) - 16383 - 63)
+                if form_type == b'AIFC':
+                    compression_type = chunk[18:22]
+                    if compression_type not in self._aiff_compression_types:
+                        raise ValueError(
+                            'Unsupported AIFF compression: {!r}'.format(
+                                compression_type))
+                    byte_order, kind = self._aiff_compression_types[
+                        compression_type]
+                    if compression_type in (b'fl64', b'FL64'):
+                        bit_depth = 64
+                    elif kind == 'f':
+                        bit_depth = 32
+                self._channel_count = channel_count
+                self._frame_count = frame_count
+                self._sample_rate = int(round(sample_rate))
+            elif chunk_id == b'SSND':
+                offset, _ = struct.unpack('>II', file_pointer.read(8))
+                data_offset = chunk_start + 8 + offset
+                data_size = chunk_size - 8 - offset
+            file_pointer.seek(chunk_start + chunk_size + chunk_size % 2)
+        if bit_depth is None or data_offset is None:
+            raise ValueError('Malformed AIFF file: {}'.format(self.file_path))
+        return data_offset, data_size, byte_order, kind, bit_depth
+
+    def _read_wav_header(self, file_pointer):
+        kind = bit_depth = data_offset = data_size = None
+        while True:
+            chunk_header = file_pointer.read(8)
+            if len(chunk_header) < 8:
+                break
+            chunk_id, chunk_size = struct.unpack('<4sI', chunk_header)
+            chunk_start = file_pointer.tell()
+            if chunk_id == b'fmt ':
+                chunk = file_pointer.read(chunk_size)
+                format_tag, channel_count, sample_rate = struct.unpack(
+                    '<HHI', chunk[:8])
+                bit_depth, = struct.unpack('<H', chunk[14:16])
+                if format_tag == 0xFFFE:
+                    # WAVE_FORMAT_EXTENSIBLE: the subformat GUID begins
+                    # with the actual format tag.
+                    format_tag, = struct.unpack('<H', chunk[24:26])
+                if format_tag not in self._wav_format_tags:
+                    raise ValueError('Unsupported WAV format: {:#x}'.format(
+                        format_tag))
+                kind = self._wav_format_tags[format_tag]
+                self._channel_count = channel_count
+                self._frame_count = None
+                self._sample_rate = sample_rate
+            elif chunk_id == b'data':
+                data_offset = chunk_start
+                data_size = chunk_size
+                # Stop here: streamed WAVs may not know their data size.
+                break
+            file_pointer.seek(chunk_start + chunk_size + chunk_size % 2)
+        if kind is None or data_offset is None:
+            raise ValueError('Malformed WAV file: {}'.format(self.file_path))
+        file_size = os.path.getsize(self.file_path)
+        data_size = min(data_size, file_size - data_offset)
+        return data_offset, data_size, '<', kind, bit_depth
+
+    def _read_frame(self, frame):
+        if self._samples is not None:
+            return self[int(frame)].tolist()
         import wavefile
-        assert 0 <= frames <= self.frame_count
         with wavefile.WaveReader(self.file_path) as reader:
-            reader.seek(frames)
+            reader.seek(frame)
             iterator = reader.read_iter(size=1)
             frame = next(iterator)
             return frame.transpose().tolist()[0]
 
+    ### PUBLIC METHODS ###
+
+    def at_frame(self, frames):
+        assert 0 <= frames <= self.frame_count
+        return self._read_frame(frames)
+
     def at_percent(self, percent):
-        import wavefile
         assert 0 <= percent <= 1
         frames = int(self.frame_count * percent)
-        with wavefile.WaveReader(self.file_path) as reader:
-            reader.seek(frames)
-            iterator = reader.read_iter(size=1)
-            frame = next(iterator)
-            return frame.transpose().tolist()[0]
+        return self._read_frame(frames)
 
     def at_second(self, second):
-        import wavefile
         assert 0 <= second <= self.seconds
         frames = second * self.sample_rate
-        with wavefile.WaveReader(self.file_path) as reader:
-            reader.seek(frames)
-            iterator = reader.read_iter(size=1)
-            frame = next(iterator)
-            return frame.transpose().tolist()[0]
+        return self._read_frame(frames)
+
+    def get_peak(self, block_size=None):
+        """
+        Gets the peak absolute amplitude of each channel of a
+        memory-mapped soundfile.
+
+        Gets one peak per channel for each block of `block_size` frames if
+        `block_size` is not none, otherwise one peak per channel for the
+        whole soundfile.
+
+        Returns NumPy array.
+        """
+        import numpy
+        peaks = [
+            numpy.abs(blocks).max(axis=1)
+            for blocks in self._iterate_blocks(block_size)
+            ]
+        peaks = numpy.concatenate(
+            peaks or [numpy.zeros((0, self.channel_count))])
+        peaks = peaks.astype(numpy.float64)
+        if block_size is None:
+            return peaks.max(axis=0, initial=0.)
+        return peaks
+
+    def get_rms(self, block_size=None):
+        """
+        Gets the root-mean-square amplitude of each channel of a
+        memory-mapped soundfile.
+
+        Gets one RMS amplitude per channel for each block of `block_size`
+        frames if `block_size` is not none, otherwise one per channel for
+        the whole soundfile.
+
+        Returns NumPy array.
+        """
+        import numpy
+        sums, sizes = [], []
+        for blocks in self._iterate_blocks(block_size):
+            sums.append(numpy.square(blocks, dtype=numpy.float64).sum(axis=1))
+            sizes.extend([blocks.shape[1]] * len(blocks))
+        sums = numpy.concatenate(sums or [numpy.zeros((0, self.channel_count))])
+        sizes = numpy.array(sizes, dtype=numpy.float64)
+        if block_size is None:
+            return numpy.sqrt(sums.sum(axis=0) / max(1, self.frame_count))
+        return numpy.sqrt(sums / sizes[:, numpy.newaxis])
 
     ### PUBLIC PROPERTIES ###
 
@@ -74,6 +338,10 @@ class SoundFile(SupriyaObject):
     def frame_count(self):
         return self._frame_count
 
+    @property
+    def is_memory_mapped(self):
+        return self._samples is not None
+
     @property
     def sample_rate(self):
         return self._sample_rate
@@ -1,9 +1,5 @@
 import collections
 import copy
-import hashlib
-import os
-import shutil
-import tempfile
 import yaml
 from supriya.realtime.ServerObjectProxy import ServerObjectProxy
 
@@ -90,6 +86,8 @@ class SynthDef(ServerObjectProxy):
         assert all(isinstance(_, supriya.ugens.UGen) for _ in ugens)
         ugens = self._cleanup_pv_chains(ugens)
         ugens = self._cleanup_local_bufs(ugens)
+        if 1 < optimize:
+            ugens = self._simplify_ugen_graph(ugens)
         if optimize:
             ugens = self._optimize_ugen_graph(ugens)
         ugens = self._sort_ugens_topologically(ugens)
@@ -311,52 +309,13 @@ class SynthDef(ServerObjectProxy):
     ### PRIVATE METHODS ###
 
     @staticmethod
-    def _allocate_synthdefs(synthdefs, server):
-        import supriya.commands
-        d_recv_synthdef_groups = []
-        d_recv_synth_group = []
-        current_total = 0
-        d_load_synthdefs = []
-        if synthdefs:
-            for synthdef in synthdefs:
+    def _allocate_synthdefs(synthdefs, server, sync=True):
+        import supriya.realtime
+        server = server or supriya.realtime.Server.get_default_server()
+        for synthdef in synthdefs:
+            if synthdef.server is None:
                 synthdef._register_with_local_server(server=server)
-                compiled = synthdef.compile()
-                if 8192 < len(compiled):
-                    d_load_synthdefs.append(synthdef)
-                elif current_total + len(compiled) < 8192:
-                    d_recv_synth_group.append(synthdef)
-                    current_total += len(compiled)
-                else:
-                    d_recv_synthdef_groups.append(d_recv_synth_group)
-                    d_recv_synth_group = [synthdef]
-                    current_total = len(compiled)
-        else:
-            return
-        if d_recv_synth_group:
-            d_recv_synthdef_groups.append(d_recv_synth_group)
-        for d_recv_synth_group in d_recv_synthdef_groups:
-            d_recv_request = supriya.commands.SynthDefReceiveRequest(
-                synthdefs=tuple(d_recv_synth_group),
-                )
-            d_recv_request.communicate(
-                server=server,
-                sync=True,
-                )
-        if d_load_synthdefs:
-            temp_directory_path = tempfile.mkdtemp()
-            for synthdef in d_load_synthdefs:
-                file_name = '{}.scsyndef'.format(synthdef.actual_name)
-                file_path = os.path.join(temp_directory_path, file_name)
-                with open(file_path, 'wb') as file_pointer:
-                    file_pointer.write(synthdef.compile())
-            d_load_dir_request = supriya.commands.SynthDefLoadDirectoryRequest(
-                directory_path=temp_directory_path,
-                )
-            d_load_dir_request.communicate(
-                server=server,
-                sync=True,
-                )
-            shutil.rmtree(temp_directory_path)
+        server.synthdef_residency.allocate(synthdefs, sync=sync)
 
     @staticmethod
     def _build_control_mapping(parameters):
@@ -506,13 +465,12 @@ class SynthDef(ServerObjectProxy):
 
     @staticmethod
     def _collect_constants(ugens):
-        constants = []
+        constants = collections.OrderedDict()
         for ugen in ugens:
             for input_ in ugen._inputs:
                 if not isinstance(input_, float):
                     continue
-                if input_ not in constants:
-                    constants.append(input_)
+                constants.setdefault(input_, None)
         return tuple(constants)
 
     @staticmethod
@@ -550,6 +508,32 @@ class SynthDef(ServerObjectProxy):
             parameters.extend(control_ugen._parameters)
         return parameters
 
+    @staticmethod
+    def _eliminate_common_subexpressions(ugens):
+        import supriya.synthdefs
+        import supriya.ugens
+
+        def rewrite(ugen):
+            if not isinstance(ugen, prototype) or ugen._has_done_action:
+                return ugen
+            elif ugen.special_index in getattr(ugen, '_random_operators', ()):
+                return ugen
+            signature = [
+                type(ugen),
+                ugen.calculation_rate,
+                ugen.special_index,
+                len(ugen),
+                ]
+            for input_ in ugen.inputs:
+                if isinstance(input_, supriya.synthdefs.OutputProxy):
+                    input_ = (id(input_.source), input_.output_index)
+                signature.append(input_)
+            return signatures.setdefault(tuple(signature), ugen)
+
+        prototype = (supriya.ugens.PureUGen, supriya.ugens.PureMultiOutUGen)
+        signatures = {}
+        return SynthDef._rewrite_ugen_graph(ugens, rewrite)
+
     @staticmethod
     def _extract_parameters(ugens):
         import supriya.synthdefs
@@ -563,36 +547,92 @@ class SynthDef(ServerObjectProxy):
 
     @staticmethod
     def _flatten_ugens(ugens):
+        def append(ugen):
+            # Parameters compare by value, everything else by identity:
+            # track identities in a set rather than scanning the list.
+            if id(ugen) in flattened_ids:
+                return False
+            elif not isinstance(ugen, supriya.ugens.UGen) and \
+                ugen in flattened_ugens:
+                return False
+            flattened_ids.add(id(ugen))
+            flattened_ugens.append(ugen)
+            return True
+
         def recurse(ugen):
-            if ugen not in flattened_ugens:
-                flattened_ugens.append(ugen)
+            append(ugen)
             if isinstance(ugen, supriya.synthdefs.Parameter):
                 return
             elif isinstance(ugen, supriya.synthdefs.OutputProxy):
-                source = ugen.source
-                if source not in flattened_ugens:
-                    flattened_ugens.append(source)
-                    recurse(source)
+                if append(ugen.source):
+                    recurse(ugen.source)
                 return
             for input_ in ugen.inputs:
                 if isinstance(input_, supriya.synthdefs.Parameter):
-                    if input_ not in flattened_ugens:
-                        flattened_ugens.append(input_)
+                    append(input_)
                 elif isinstance(input_, supriya.synthdefs.OutputProxy):
-                    if input_.source not in flattened_ugens:
-                        flattened_ugens.append(input_.source)
+                    if append(input_.source):
                         recurse(input_.source)
                 elif isinstance(input_, supriya.ugens.UGen):
-                    if input_ not in flattened_ugens:
-                        flattened_ugens.append(input_)
+                    if append(input_):
                         recurse(input_)
         import supriya.synthdefs
         import supriya.ugens
+        flattened_ids = set()
         flattened_ugens = []
         for ugen in ugens:
             recurse(ugen)
         return flattened_ugens
 
+    @staticmethod
+    def _fuse_mul_adds(ugens):
+        import supriya.synthdefs
+        import supriya.ugens
+
+        def rewrite(ugen):
+            if not isinstance(ugen, supriya.ugens.BinaryOpUGen) or \
+                ugen.special_index != BinaryOperator.ADDITION:
+                return ugen
+            for product, addend in (ugen.inputs, reversed(ugen.inputs)):
+                if not isinstance(product, supriya.synthdefs.OutputProxy):
+                    continue
+                multiplication = product.source
+                if not isinstance(
+                    multiplication, supriya.ugens.BinaryOpUGen) or \
+                    multiplication.special_index != \
+                    BinaryOperator.MULTIPLICATION or \
+                    reference_counts[multiplication] != 1:
+                    continue
+                for source, multiplier in (
+                    multiplication.inputs,
+                    reversed(multiplication.inputs),
+                    ):
+                    if not supriya.ugens.MulAdd._inputs_are_valid(
+                        source, multiplier, addend):
+                        continue
+                    # Construct outside of any builder, then adopt the
+                    # inputs and scope of the addition being replaced.
+                    with supriya.synthdefs.SynthDefBuilder():
+                        mul_add = supriya.ugens.MulAdd(
+                            addend=0.0,
+                            calculation_rate=ugen.calculation_rate,
+                            multiplier=1.0,
+                            source=0.0,
+                            )
+                    mul_add._inputs = (source, multiplier, addend)
+                    mul_add._uuid = ugen._uuid
+                    return mul_add
+            return ugen
+
+        BinaryOperator = supriya.synthdefs.BinaryOperator
+        reference_counts = collections.Counter(
+            input_.source
+            for ugen in ugens
+            for input_ in ugen.inputs
+            if isinstance(input_, supriya.synthdefs.OutputProxy)
+            )
+        return SynthDef._rewrite_ugen_graph(ugens, rewrite)
+
     def _handle_response(self, response):
         import supriya.commands
         if isinstance(response, supriya.commands.SynthDefRemovedResponse):
@@ -613,12 +653,7 @@ class SynthDef(ServerObjectProxy):
             if isinstance(ugen, supriya.ugens.WidthFirstUGen):
                 width_first_antecedents.append(ugen)
         for ugen in ugens:
-            sort_bundle = sort_bundles[ugen]
-            sort_bundle._initialize_topological_sort(sort_bundles)
-            sort_bundle.descendants[:] = sorted(
-                sort_bundles[ugen].descendants,
-                key=lambda x: ugens.index(ugen),
-                )
+            sort_bundles[ugen]._initialize_topological_sort(sort_bundles)
         return sort_bundles
 
     @staticmethod
@@ -646,17 +681,114 @@ class SynthDef(ServerObjectProxy):
                     inputs[i] = output_proxy
             ugen._inputs = tuple(inputs)
 
+    @staticmethod
+    def _rewrite_ugen_graph(ugens, rewrite):
+        # Visits topologically sorted ugens, so each ugen's inputs are
+        # rewritten before the ugen itself. `rewrite` returns the ugen,
+        # another ugen to replace it with, or a tuple of replacement
+        # outputs, constants or output proxies.
+        import supriya.synthdefs
+        import supriya.ugens
+        replacements = {}
+        rewritten_ugens = []
+        rewritten_ids = set()
+        for ugen in ugens:
+            inputs = list(ugen.inputs)
+            for i, input_ in enumerate(inputs):
+                if isinstance(input_, supriya.synthdefs.OutputProxy) and \
+                    input_.source in replacements:
+                    inputs[i] = \
+                        replacements[input_.source][input_.output_index]
+            ugen._inputs = tuple(inputs)
+            replacement = rewrite(ugen)
+            if isinstance(replacement, supriya.ugens.UGen):
+                if id(replacement) not in rewritten_ids:
+                    rewritten_ids.add(id(replacement))
+                    rewritten_ugens.append(replacement)
+                if replacement is ugen:
+                    continue
+                replacement = tuple(
+                    replacement[i] for i in range(len(replacement)))
+            replacements[ugen] = replacement
+        return rewritten_ugens
+
+    @staticmethod
+    def _simplify_operators(ugens):
+        import supriya.synthdefs
+        import supriya.ugens
+
+        def rewrite(ugen):
+            if isinstance(ugen, supriya.ugens.UnaryOpUGen):
+                source, = ugen.inputs
+                function = ugen._constant_operators.get(
+                    int(ugen.special_index))
+                if function is not None and isinstance(source, float):
+                    return (float(function(source)),)
+                return ugen
+            elif not isinstance(ugen, supriya.ugens.BinaryOpUGen):
+                return ugen
+            left, right = ugen.inputs
+            function = ugen._constant_operators.get(int(ugen.special_index))
+            if function is not None and \
+                isinstance(left, float) and isinstance(right, float):
+                try:
+                    return (float(function(left, right)),)
+                except ZeroDivisionError:
+                    return ugen
+            special_index = ugen.special_index
+            if special_index == BinaryOperator.MULTIPLICATION:
+                if left == 0.0 or right == 0.0:
+                    return (0.0,)
+                if left == 1.0:
+                    return (right,)
+                if right == 1.0:
+                    return (left,)
+            elif special_index == BinaryOperator.ADDITION:
+                if left == 0.0:
+                    return (right,)
+                if right == 0.0:
+                    return (left,)
+            elif special_index == BinaryOperator.SUBTRACTION:
+                if right == 0.0:
+                    return (left,)
+            elif special_index == BinaryOperator.FLOAT_DIVISION:
+                if right == 1.0:
+                    return (left,)
+            return ugen
+
+        BinaryOperator = supriya.synthdefs.BinaryOperator
+        return SynthDef._rewrite_ugen_graph(ugens, rewrite)
+
+    @staticmethod
+    def _simplify_ugen_graph(ugens):
+        ugens = SynthDef._sort_ugens_topologically(ugens)
+        ugens = SynthDef._simplify_operators(ugens)
+        ugens = SynthDef._eliminate_common_subexpressions(ugens)
+        ugens = SynthDef._fuse_mul_adds(ugens)
+        return ugens
+
     @staticmethod
     def _sort_ugens_topologically(ugens):
+        # Kahn's algorithm, counting each ugen's unscheduled antecedents
+        # rather than removing them from lists: linear in ugens and edges.
         sort_bundles = SynthDef._initialize_topological_sort(ugens)
-        available_ugens = []
-        for ugen in reversed(ugens):
-            sort_bundles[ugen]._make_available(available_ugens)
+        antecedent_counts = {
+            ugen: len(sort_bundle.antecedents)
+            for ugen, sort_bundle in sort_bundles.items()
+            }
+        available_ugens = [
+            ugen for ugen in reversed(ugens)
+            if not antecedent_counts[ugen]
+            ]
         out_stack = []
         while available_ugens:
             available_ugen = available_ugens.pop()
-            sort_bundles[available_ugen]._schedule(
-                available_ugens, out_stack, sort_bundles)
+            for descendant in reversed(
+                sort_bundles[available_ugen].descendants):
+                antecedent_counts[descendant] -= 1
+                if not antecedent_counts[descendant]:
+                    available_ugens.append(descendant)
+            out_stack.append(available_ugen)
         return out_stack
 
     ### PUBLIC METHODS ###
@@ -669,18 +801,18 @@ class SynthDef(ServerObjectProxy):
         return self
 
     def compile(self, use_anonymous_name=False):
-        from supriya.synthdefs import SynthDefCompiler
-        synthdefs = [self]
-        result = SynthDefCompiler.compile_synthdefs(
-            synthdefs,
-            use_anonymous_names=use_anonymous_name,
+        from supriya.synthdefs import SynthDefCache
+        synthdef_cache = SynthDefCache.get_default_cache()
+        return synthdef_cache.compile_synthdef(
+            self,
+            use_anonymous_name=use_anonymous_name,
             )
-        return result
 
     def free(self):
         import supriya.commands
         synthdef_name = self.actual_name
         del(self.server._synthdefs[synthdef_name])
+        self.server.synthdef_residency.discard(synthdef_name)
         request = supriya.commands.SynthDefFreeRequest(
             synthdef=self,
             )
@@ -820,10 +952,9 @@ class SynthDef(ServerObjectProxy):
 
     @property
     def anonymous_name(self):
-        md5 = hashlib.md5()
-        md5.update(self._compiled_ugen_graph)
-        anonymous_name = md5.hexdigest()
-        return anonymous_name
+        from supriya.synthdefs import SynthDefCache
+        synthdef_cache = SynthDefCache.get_default_cache()
+        return synthdef_cache.get_anonymous_name(self)
 
     @property
     def audio_channel_count(self):
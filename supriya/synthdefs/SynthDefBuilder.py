@@ -54,6 +54,7 @@ class SynthDefBuilder(SupriyaObject):
     __slots__ = (
         '_name',
         '_parameters',
+        '_ugen_ids',
         '_ugens',
         '_uuid',
         )
@@ -68,6 +69,7 @@ class SynthDefBuilder(SupriyaObject):
         self._name = name
         self._uuid = uuid.uuid4()
         self._parameters = collections.OrderedDict()
+        self._ugen_ids = set()
         self._ugens = []
         for key, value in kwargs.items():
             self._add_parameter(key, value)
@@ -101,8 +103,14 @@ class SynthDefBuilder(SupriyaObject):
             if isinstance(ugen, supriya.synthdefs.OutputProxy):
                 ugen = ugen.source
             assert ugen._uuid == self._uuid
-            if ugen not in self._ugens:
-                self._ugens.append(ugen)
+            if isinstance(ugen, supriya.synthdefs.Parameter):
+                # Parameters compare by value, ugens by identity.
+                if ugen in self._ugens:
+                    continue
+            elif id(ugen) in self._ugen_ids:
+                continue
+            self._ugen_ids.add(id(ugen))
+            self._ugens.append(ugen)
 
     def _add_parameter(self, *args):
         import supriya.synthdefs
@@ -153,25 +161,78 @@ class SynthDefBuilder(SupriyaObject):
     ### PUBLIC METHODS ###
 
     def build(self, name=None, optimize=True):
+        """
+        Builds a SynthDef from the builder's parameters and ugens.
+
+        `optimize` selects how far to optimize the ugen graph:
+
+        - ``0`` or ``False`` keeps every ugen
+        - ``1`` or ``True`` removes pure ugens whose outputs go unused
+        - ``2`` also folds operators on constants and identities such as
+          ``x * 1`` and ``x + 0``, merges pure ugens with the same type,
+          rate and inputs, and fuses ``a * b + c`` into ``MulAdd``
+
+        ::
+
+            >>> with supriya.synthdefs.SynthDefBuilder(frequency=440) as builder:
+            ...     left = supriya.ugens.SinOsc.ar(frequency=builder['frequency']) * 0.5
+            ...     right = supriya.ugens.SinOsc.ar(frequency=builder['frequency']) * 0.5
+            ...     source = left * supriya.ugens.LFNoise1.kr() + right
+            ...     out = supriya.ugens.Out.ar(bus=0, source=source)
+            ...
+
+        ::
+
+            >>> print(builder.build(optimize=2))
+            synthdef:
+                name: ...
+                ugens:
+                -   Control.kr: null
+                -   SinOsc.ar:
+                        frequency: Control.kr[0:frequency]
+                        phase: 0.0
+                -   BinaryOpUGen(MULTIPLICATION).ar:
+                        left: SinOsc.ar[0]
+                        right: 0.5
+                -   LFNoise1.kr:
+                        frequency: 500.0
+                -   MulAdd.ar:
+                        addend: BinaryOpUGen(MULTIPLICATION).ar[0]
+                        multiplier: LFNoise1.kr[0]
+                        source: BinaryOpUGen(MULTIPLICATION).ar[0]
+                -   Out.ar:
+                        bus: 0.0
+                        source[0]: MulAdd.ar[0]
+
+        Returns SynthDef.
+        """
         import supriya.synthdefs
         name = self.name or name
-        with self:
-            ugens = list(self._parameters.values()) + list(self._ugens)
-            ugens = copy.deepcopy(ugens)
-            ugens = supriya.synthdefs.SynthDef._flatten_ugens(ugens)
-            ugens, parameters = supriya.synthdefs.SynthDef._extract_parameters(ugens)
-            (
-                control_ugens,
-                control_mapping,
-                indexed_parameters,
-                ) = supriya.synthdefs.SynthDef._build_control_mapping(parameters)
-            supriya.synthdefs.SynthDef._remap_controls(ugens, control_mapping)
-            ugens = control_ugens + ugens
-            synthdef = supriya.synthdefs.SynthDef(
-                ugens,
-                name=name,
-                optimize=optimize,
-                )
+        ugen_count = len(self._ugens)
+        try:
+            with self:
+                ugens = list(self._parameters.values()) + list(self._ugens)
+                ugens = copy.deepcopy(ugens)
+                ugens = supriya.synthdefs.SynthDef._flatten_ugens(ugens)
+                ugens, parameters = supriya.synthdefs.SynthDef._extract_parameters(ugens)
+                (
+                    control_ugens,
+                    control_mapping,
+                    indexed_parameters,
+                    ) = supriya.synthdefs.SynthDef._build_control_mapping(parameters)
+                supriya.synthdefs.SynthDef._remap_controls(ugens, control_mapping)
+                ugens = control_ugens + ugens
+                synthdef = supriya.synthdefs.SynthDef(
+                    ugens,
+                    name=name,
+                    optimize=optimize,
+                    )
+        finally:
+            # Forget ugens built for the SynthDef, such as its controls, so
+            # building again builds the same SynthDef.
+            for ugen in self._ugens[ugen_count:]:
+                self._ugen_ids.discard(id(ugen))
+            del(self._ugens[ugen_count:])
         return synthdef
 
     def poll_ugen(
@@ -0,0 +1,239 @@
+import collections
+import hashlib
+import os
+import pathlib
+import threading
+from supriya.system.SupriyaObject import SupriyaObject
+
+
+class SynthDefCache(SupriyaObject):
+    """
+    A process-wide cache of compiled SynthDefs.
+
+    Entries are keyed on each SynthDef's compiled ugen graph, so equal
+    SynthDefs, however often they are rebuilt, share one anonymous name and
+    one compiled file per name. The cache evicts the least-recently-used
+    entries once it outgrows `maximum_size` bytes.
+
+    ::
+
+        >>> import pathlib, tempfile
+        >>> import supriya.synthdefs
+        >>> synthdef_cache = supriya.synthdefs.SynthDefCache(
+        ...     directory_path=pathlib.Path(tempfile.mkdtemp()) / 'synthdefs',
+        ...     )
+        >>> with supriya.synthdefs.SynthDefBuilder(frequency=440) as builder:
+        ...     sin_osc = supriya.ugens.SinOsc.ar(frequency=builder['frequency'])
+        ...     out = supriya.ugens.Out.ar(bus=0, source=sin_osc)
+        ...
+        >>> synthdef = builder.build(name='test')
+
+    ::
+
+        >>> compiled = synthdef_cache.compile_synthdef(synthdef)
+        >>> compiled == synthdef.compile()
+        True
+        >>> synthdef in synthdef_cache
+        True
+
+    ::
+
+        >>> file_path = synthdef_cache.get_file_path(synthdef)
+        >>> file_path.read_bytes() == compiled
+        True
+
+    SynthDef caches with a directory path also write each compiled SynthDef
+    once to a ``.scsyndef`` file there, named by its content, for loading
+    via ``/d_load``. Such files persist between sessions.
+
+    The default SynthDef cache is configured by the ``synthdef_cache_path``
+    and ``synthdef_cache_size`` options in the ``core`` section of supriya's
+    configuration file, and keeps no files when no path is configured.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'SynthDef Internals'
+
+    __slots__ = (
+        '_directory_path',
+        '_entries',
+        '_lock',
+        '_maximum_size',
+        '_size',
+        )
+
+    _default_cache = None
+
+    _default_maximum_size = 2 ** 24
+
+    ### INITIALIZER ###
+
+    def __init__(self, directory_path=None, maximum_size=None):
+        if directory_path is not None:
+            directory_path = pathlib.Path(directory_path)
+            directory_path = directory_path.expanduser().absolute()
+            directory_path.mkdir(parents=True, exist_ok=True)
+        if maximum_size is None:
+            maximum_size = self._default_maximum_size
+        maximum_size = int(maximum_size)
+        assert 0 < maximum_size
+        self._directory_path = directory_path
+        self._entries = collections.OrderedDict()
+        self._lock = threading.RLock()
+        self._maximum_size = maximum_size
+        self._size = 0
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, synthdef):
+        with self._lock:
+            return synthdef._compiled_ugen_graph in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    ### PRIVATE METHODS ###
+
+    def _evict(self):
+        while 1 < len(self._entries) and self.maximum_size < self._size:
+            key, (_, compiled_synthdefs) = self._entries.popitem(last=False)
+            self._size -= self._get_entry_size(key, compiled_synthdefs)
+
+    def _get_entry(self, synthdef):
+        # Callers hold the lock.
+        key = synthdef._compiled_ugen_graph
+        entry = self._entries.get(key)
+        if entry is None:
+            anonymous_name = hashlib.md5(key).hexdigest()
+            entry = self._entries[key] = (anonymous_name, {})
+            self._size += self._get_entry_size(key, {})
+            self._evict()
+        else:
+            self._entries.move_to_end(key)
+        return entry
+
+    @staticmethod
+    def _get_entry_size(key, compiled_synthdefs):
+        return len(key) + sum(
+            len(name) + len(compiled)
+            for name, compiled in compiled_synthdefs.items()
+            )
+
+    ### PUBLIC METHODS ###
+
+    def clear(self):
+        """
+        Removes all in-memory entries from the SynthDef cache.
+
+        Leaves files in the cache directory untouched.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def compile_synthdef(self, synthdef, use_anonymous_name=False):
+        """
+        Compiles `synthdef` into a SynthDef file, compiling each SynthDef
+        and name at most once while cached.
+
+        Returns bytes.
+        """
+        import supriya.synthdefs
+        with self._lock:
+            anonymous_name, compiled_synthdefs = self._get_entry(synthdef)
+            name = synthdef.name
+            if not name or use_anonymous_name:
+                name = anonymous_name
+            compiled = compiled_synthdefs.get(name)
+            if compiled is None:
+                compiler = supriya.synthdefs.SynthDefCompiler
+                compiled = compiled_synthdefs[name] = b''.join([
+                    b'SCgf',
+                    compiler.encode_unsigned_int_32bit(2),
+                    compiler.encode_unsigned_int_16bit(1),
+                    compiler.compile_synthdef(synthdef, name),
+                    ])
+                self._size += len(name) + len(compiled)
+                self._evict()
+            return compiled
+
+    def get_anonymous_name(self, synthdef):
+        """
+        Gets the anonymous name of `synthdef`: the MD5 hex digest of its
+        compiled ugen graph.
+
+        Returns string.
+        """
+        with self._lock:
+            return self._get_entry(synthdef)[0]
+
+    @classmethod
+    def get_default_cache(cls):
+        """
+        Gets the process-wide SynthDef cache, creating it from supriya's
+        configuration file on first use.
+
+        Returns SynthDef cache.
+        """
+        if cls._default_cache is None:
+            import supriya
+            directory_path = supriya.config.get(
+                'core', 'synthdef_cache_path', fallback=None) or None
+            maximum_size = supriya.config.get(
+                'core', 'synthdef_cache_size', fallback=None) or None
+            cls._default_cache = cls(
+                directory_path=directory_path,
+                maximum_size=maximum_size,
+                )
+        return cls._default_cache
+
+    def get_file_path(self, synthdef, use_anonymous_name=False):
+        """
+        Gets the path of `synthdef`'s compiled file in the cache directory,
+        writing the file if it does not exist yet.
+
+        Returns path.
+        """
+        if self.directory_path is None:
+            raise ValueError('SynthDef cache has no directory path.')
+        compiled = self.compile_synthdef(
+            synthdef, use_anonymous_name=use_anonymous_name)
+        file_name = '{}.scsyndef'.format(hashlib.md5(compiled).hexdigest())
+        file_path = self.directory_path / file_name
+        if not file_path.exists():
+            # Write-and-rename so concurrent loaders never see partial files.
+            temporary_path = file_path.with_suffix('.{}'.format(os.getpid()))
+            temporary_path.write_bytes(compiled)
+            os.replace(str(temporary_path), str(file_path))
+        return file_path
+
+    @classmethod
+    def set_default_cache(cls, synthdef_cache):
+        """
+        Sets the process-wide SynthDef cache.
+
+        Resets the default SynthDef cache from supriya's configuration file
+        on next use if `synthdef_cache` is none.
+        """
+        assert isinstance(synthdef_cache, (cls, type(None)))
+        cls._default_cache = synthdef_cache
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory_path(self):
+        return self._directory_path
+
+    @property
+    def maximum_size(self):
+        return self._maximum_size
+
+    @property
+    def size(self):
+        """
+        Approximate size of cached entries, in bytes.
+        """
+        with self._lock:
+            return self._size
@@ -27,34 +27,25 @@ class UGenSortBundle(SupriyaObject):
     def _initialize_topological_sort(self, sort_bundles):
         import supriya.synthdefs
         import supriya.ugens
+        # Only this bundle links itself to its antecedents, so a set of
+        # antecedents guards both lists against duplicates.
+        antecedents = set(self.antecedents)
         for input_ in self.ugen.inputs:
             if isinstance(input_, supriya.synthdefs.OutputProxy):
                 input_ = input_.source
             elif not isinstance(input_, supriya.ugens.UGen):
                 continue
-            input_sort_bundle = sort_bundles[input_]
-            if input_ not in self.antecedents:
-                self.antecedents.append(input_)
-            if self.ugen not in input_sort_bundle.descendants:
-                input_sort_bundle.descendants.append(self.ugen)
+            if input_ in antecedents:
+                continue
+            antecedents.add(input_)
+            self.antecedents.append(input_)
+            sort_bundles[input_].descendants.append(self.ugen)
         for input_ in self.width_first_antecedents:
-            input_sort_bundle = sort_bundles[input_]
-            if input_ not in self.antecedents:
-                self.antecedents.append(input_)
-            if self.ugen not in input_sort_bundle.descendants:
-                input_sort_bundle.descendants.append(self.ugen)
-
-    def _make_available(self, available_ugens):
-        if not self.antecedents:
-            if self.ugen not in available_ugens:
-                available_ugens.append(self.ugen)
-
-    def _schedule(self, available_ugens, out_stack, sort_bundles):
-        for ugen in reversed(self.descendants):
-            sort_bundle = sort_bundles[ugen]
-            sort_bundle.antecedents.remove(self.ugen)
-            sort_bundle._make_available(available_ugens)
-        out_stack.append(self.ugen)
+            if input_ in antecedents:
+                continue
+            antecedents.add(input_)
+            self.antecedents.append(input_)
+            sort_bundles[input_].descendants.append(self.ugen)
 
     ### PUBLIC METHODS ###
 
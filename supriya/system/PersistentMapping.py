@@ -0,0 +1,187 @@
+import collections.abc
+
+
+class PersistentMapping(collections.abc.MutableMapping):
+    """
+    A mutable mapping whose copies share structure.
+
+    Keys hash into a fixed, two-level trie of small dictionaries. Copying
+    takes constant time, and writes copy only the path down to the one
+    dictionary they touch, so many slightly different copies of a large
+    mapping cost little more memory than one. Comparing copies skips
+    shared dictionaries.
+
+    ::
+
+        >>> import supriya.system
+        >>> mapping = supriya.system.PersistentMapping({'a': 1, 'b': 2})
+        >>> copied_mapping = mapping.copy()
+        >>> copied_mapping['c'] = 3
+        >>> del(copied_mapping['a'])
+
+    ::
+
+        >>> sorted(mapping.items())
+        [('a', 1), ('b', 2)]
+
+    ::
+
+        >>> sorted(copied_mapping.items())
+        [('b', 2), ('c', 3)]
+
+    ::
+
+        >>> mapping == {'a': 1, 'b': 2}
+        True
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        '_branches',
+        '_length',
+        '_owned',
+        )
+
+    _bits = 5
+
+    _mask = 31
+
+    _width = 32
+
+    ### INITIALIZER ###
+
+    def __init__(self, items=None):
+        self._branches = [None] * self._width
+        self._length = 0
+        # IDs of the branches and leaves no copy shares: safe to mutate.
+        self._owned = set()
+        if items is not None:
+            self.update(items)
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, key):
+        hash_ = hash(key)
+        branch = self._branches[hash_ & self._mask]
+        if branch is None:
+            return False
+        leaf = branch[(hash_ >> self._bits) & self._mask]
+        return leaf is not None and key in leaf
+
+    def __delitem__(self, key):
+        hash_ = hash(key)
+        leaf = None
+        branch = self._branches[hash_ & self._mask]
+        if branch is not None:
+            leaf = branch[(hash_ >> self._bits) & self._mask]
+        if leaf is None or key not in leaf:
+            raise KeyError(key)
+        if id(leaf) not in self._owned:
+            leaf = self._get_writable_leaf(hash_)
+        del(leaf[key])
+        self._length -= 1
+
+    def __eq__(self, expr):
+        if isinstance(expr, type(self)):
+            if self._length != expr._length:
+                return False
+            empty_branch = [None] * self._width
+            for branch_one, branch_two in zip(self._branches, expr._branches):
+                if branch_one is branch_two:
+                    continue
+                for leaf_one, leaf_two in zip(
+                    branch_one or empty_branch,
+                    branch_two or empty_branch,
+                    ):
+                    if leaf_one is leaf_two:
+                        continue
+                    elif (leaf_one or {}) != (leaf_two or {}):
+                        return False
+            return True
+        elif isinstance(expr, collections.abc.Mapping):
+            return dict(self.items()) == dict(expr.items())
+        return NotImplemented
+
+    def __getitem__(self, key):
+        hash_ = hash(key)
+        branch = self._branches[hash_ & self._mask]
+        if branch is not None:
+            leaf = branch[(hash_ >> self._bits) & self._mask]
+            if leaf is not None:
+                return leaf[key]
+        raise KeyError(key)
+
+    def __iter__(self):
+        for branch in self._branches:
+            if branch is None:
+                continue
+            for leaf in branch:
+                if leaf:
+                    yield from leaf
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, dict(self.items()))
+
+    def __setitem__(self, key, value):
+        hash_ = hash(key)
+        leaf = None
+        branch = self._branches[hash_ & self._mask]
+        if branch is not None:
+            leaf = branch[(hash_ >> self._bits) & self._mask]
+        if leaf is None or id(leaf) not in self._owned:
+            leaf = self._get_writable_leaf(hash_)
+        if key not in leaf:
+            self._length += 1
+        leaf[key] = value
+
+    ### PRIVATE METHODS ###
+
+    def _get_writable_leaf(self, hash_):
+        # An owned leaf always sits on an owned branch.
+        branch_index = hash_ & self._mask
+        leaf_index = (hash_ >> self._bits) & self._mask
+        branch = self._branches[branch_index]
+        if branch is None:
+            branch = [None] * self._width
+        elif id(branch) not in self._owned:
+            branch = list(branch)
+        self._branches[branch_index] = branch
+        self._owned.add(id(branch))
+        leaf = branch[leaf_index]
+        if leaf is None:
+            leaf = {}
+        elif id(leaf) not in self._owned:
+            leaf = dict(leaf)
+        branch[leaf_index] = leaf
+        self._owned.add(id(leaf))
+        return leaf
+
+    ### PUBLIC METHODS ###
+
+    def copy(self):
+        """
+        Copies the mapping in constant time.
+
+        The mapping and its copy share all branches and leaves until
+        either writes to them.
+        """
+        mapping = type(self).__new__(type(self))
+        mapping._branches = list(self._branches)
+        mapping._length = self._length
+        mapping._owned = set()
+        self._owned.clear()
+        return mapping
+
+    def get(self, key, default=None):
+        hash_ = hash(key)
+        branch = self._branches[hash_ & self._mask]
+        if branch is not None:
+            leaf = branch[(hash_ >> self._bits) & self._mask]
+            if leaf is not None:
+                return leaf.get(key, default)
+        return default
@@ -0,0 +1,192 @@
+import bisect
+import collections.abc
+import itertools
+
+
+class SortedList(collections.abc.Sequence):
+    """
+    A sorted list.
+
+    Keeps its items in a list of sorted blocks, each holding at most a few
+    hundred items, indexed by their largest items. Adding, removing and
+    finding neighbouring items bisect the index, then one block, so take
+    logarithmic time plus a short copy within one block, however long the
+    list grows.
+
+    ::
+
+        >>> import supriya.system
+        >>> sorted_list = supriya.system.SortedList([3, 1, 2])
+        >>> sorted_list.add(2.5)
+        >>> sorted_list
+        SortedList([1, 2, 2.5, 3])
+
+    ::
+
+        >>> sorted_list.lower(2.5), sorted_list.higher(2.5)
+        (2, 3)
+
+    ::
+
+        >>> list(sorted_list.irange(2, 3))
+        [2, 2.5, 3]
+
+    ::
+
+        >>> sorted_list.remove(2)
+        >>> sorted_list == [1, 2.5, 3]
+        True
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        '_blocks',
+        '_length',
+        '_maxima',
+        )
+
+    _load = 256
+
+    ### INITIALIZER ###
+
+    def __init__(self, items=None):
+        items = sorted(items or ())
+        self._blocks = [
+            items[i:i + self._load]
+            for i in range(0, len(items), self._load)
+            ]
+        self._maxima = [block[-1] for block in self._blocks]
+        self._length = len(items)
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, item):
+        block_index = bisect.bisect_left(self._maxima, item)
+        if block_index == len(self._maxima):
+            return False
+        block = self._blocks[block_index]
+        return block[bisect.bisect_left(block, item)] == item
+
+    def __eq__(self, expr):
+        if isinstance(expr, collections.abc.Sequence):
+            return len(self) == len(expr) and list(self) == list(expr)
+        return NotImplemented
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        for block in self._blocks:
+            if index < len(block):
+                return block[index]
+            index -= len(block)
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self._blocks)
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, list(self))
+
+    def __reversed__(self):
+        for block in reversed(self._blocks):
+            yield from reversed(block)
+
+    ### PUBLIC METHODS ###
+
+    def add(self, item):
+        """
+        Adds `item`, keeping the list sorted.
+        """
+        self._length += 1
+        if not self._blocks:
+            self._blocks.append([item])
+            self._maxima.append(item)
+            return
+        block_index = bisect.bisect_left(self._maxima, item)
+        if block_index == len(self._maxima):
+            block_index -= 1
+            self._maxima[block_index] = item
+        block = self._blocks[block_index]
+        bisect.insort(block, item)
+        if 2 * self._load < len(block):
+            self._blocks[block_index:block_index + 1] = [
+                block[:self._load],
+                block[self._load:],
+                ]
+            self._maxima.insert(block_index, block[self._load - 1])
+
+    def higher(self, item):
+        """
+        Gets the smallest item greater than `item`.
+
+        Returns item or none.
+        """
+        block_index = bisect.bisect_right(self._maxima, item)
+        if block_index == len(self._maxima):
+            return None
+        block = self._blocks[block_index]
+        return block[bisect.bisect_right(block, item)]
+
+    def irange(self, minimum, maximum):
+        """
+        Iterates over items from `minimum` through `maximum` inclusive.
+        """
+        block_index = bisect.bisect_left(self._maxima, minimum)
+        if block_index == len(self._maxima):
+            return
+        block = self._blocks[block_index]
+        item_index = bisect.bisect_left(block, minimum)
+        for block in self._blocks[block_index:]:
+            for item in block[item_index:]:
+                if maximum < item:
+                    return
+                yield item
+            item_index = 0
+
+    def lower(self, item):
+        """
+        Gets the largest item less than `item`.
+
+        Returns item or none.
+        """
+        block_index = bisect.bisect_left(self._maxima, item)
+        if block_index == len(self._maxima):
+            block_index -= 1
+        if block_index < 0:
+            return None
+        block = self._blocks[block_index]
+        item_index = bisect.bisect_left(block, item)
+        if item_index:
+            return block[item_index - 1]
+        elif block_index:
+            return self._blocks[block_index - 1][-1]
+        return None
+
+    def remove(self, item):
+        """
+        Removes `item`.
+
+        Raises value error if `item` is missing.
+        """
+        block_index = bisect.bisect_left(self._maxima, item)
+        if block_index == len(self._maxima):
+            raise ValueError(item)
+        block = self._blocks[block_index]
+        item_index = bisect.bisect_left(block, item)
+        if block[item_index] != item:
+            raise ValueError(item)
+        del(block[item_index])
+        self._length -= 1
+        if not block:
+            del(self._blocks[block_index])
+            del(self._maxima[block_index])
+        else:
+            self._maxima[block_index] = block[-1]
@@ -1,3 +1,4 @@
+import operator
 from supriya.ugens.PureUGen import PureUGen
 
 
@@ -27,11 +28,31 @@ class BinaryOpUGen(PureUGen):
 
     __slots__ = ()
 
+    _constant_operators = {
+        0: operator.add,  # ADDITION
+        1: operator.sub,  # SUBTRACTION
+        2: operator.mul,  # MULTIPLICATION
+        4: operator.truediv,  # FLOAT_DIVISION
+        12: min,  # MINIMUM
+        13: max,  # MAXIMUM
+        34: lambda a, b: a * a - b * b,  # DIFFERENCE_OF_SQUARES
+        35: lambda a, b: a * a + b * b,  # SUM_OF_SQUARES
+        36: lambda a, b: (a + b) ** 2,  # SQUARE_OF_SUM
+        37: lambda a, b: (a - b) ** 2,  # SQUARE_OF_DIFFERENCE
+        38: lambda a, b: abs(a - b),  # ABSOLUTE_DIFFERENCE
+        }
+
     _ordered_input_names = (
         'left',
         'right',
         )
 
+    # Each evaluation draws anew, so equal inputs do not make equal outputs.
+    _random_operators = frozenset([
+        47,  # RANDRANGE
+        48,  # EXPRANDRANGE
+        ])
+
     ### INITIALIZER ###
 
     def __init__(
@@ -61,6 +82,17 @@ class BinaryOpUGen(PureUGen):
         import supriya.synthdefs
         a = kwargs['left']
         b = kwargs['right']
+        function = cls._constant_operators.get(int(special_index))
+        if (
+            function is not None and
+            isinstance(a, (int, float)) and
+            isinstance(b, (int, float))
+            ):
+            # Fold operators on constants into constants.
+            try:
+                return float(function(a, b))
+            except ZeroDivisionError:
+                pass
         if special_index == supriya.synthdefs.BinaryOperator.MULTIPLICATION:
             if a == 0:
                 return 0
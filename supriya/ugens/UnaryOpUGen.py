@@ -25,10 +25,27 @@ class UnaryOpUGen(PureUGen):
 
     __slots__ = ()
 
+    _constant_operators = {
+        0: lambda x: -x,  # NEGATIVE
+        5: abs,  # ABSOLUTE_VALUE
+        12: lambda x: x * x,  # SQUARED
+        13: lambda x: x * x * x,  # CUBED
+        }
+
     _ordered_input_names = (
         'source',
         )
 
+    # Each evaluation draws anew, so equal inputs do not make equal outputs.
+    _random_operators = frozenset([
+        37,  # RAND
+        38,  # RAND2
+        39,  # LINRAND
+        40,  # BILINRAND
+        41,  # SUM3RAND
+        44,  # COIN
+        ])
+
     ### INITIALIZER ###
 
     def __init__(
@@ -44,6 +61,27 @@ class UnaryOpUGen(PureUGen):
             special_index=special_index,
             )
 
+    ### PRIVATE METHODS ###
+
+    @classmethod
+    def _new_single(
+        cls,
+        calculation_rate=None,
+        special_index=None,
+        **kwargs
+        ):
+        source = kwargs['source']
+        function = cls._constant_operators.get(int(special_index))
+        if function is not None and isinstance(source, (int, float)):
+            # Fold operators on constants into constants.
+            return float(function(source))
+        ugen = cls(
+            calculation_rate=calculation_rate,
+            special_index=special_index,
+            source=source,
+            )
+        return ugen
+
     ### PUBLIC PROPERTIES ###
 
     @property
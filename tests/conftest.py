@@ -47,6 +47,20 @@ def cli_paths(tmpdir):
             del(sys.modules[path])
 
 
+@pytest.fixture
+def forget_servers():
+    # Servers are cached per address, so forget those the test creates.
+    server_keys = set(supriya.realtime.Server._servers)
+    async_server_keys = set(supriya.realtime.AsyncServer._servers)
+    yield
+    for cls, keys in (
+        (supriya.realtime.Server, server_keys),
+        (supriya.realtime.AsyncServer, async_server_keys),
+        ):
+        for key in set(cls._servers) - keys:
+            cls._servers.pop(key)
+
+
 @pytest.fixture
 def nonrealtime_paths(tmpdir):
     test_directory_path = pathlib.Path(tmpdir)
@@ -99,6 +113,31 @@ def server():
     server.quit()
 
 
+@pytest.fixture
+def server_log(monkeypatch):
+    server_log = []
+
+    def boot(server, server_options=None):
+        server_log.append(('boot', server.port))
+        server._is_running = True
+        return server
+
+    def quit(server):
+        if server.is_running:
+            server_log.append(('quit', server.port))
+        server._is_running = False
+        return server
+
+    def reset(server):
+        server_log.append(('reset', server.port))
+        return server
+
+    monkeypatch.setattr(supriya.realtime.Server, 'boot', boot)
+    monkeypatch.setattr(supriya.realtime.Server, 'quit', quit)
+    monkeypatch.setattr(supriya.realtime.Server, 'reset', reset)
+    return server_log
+
+
 ### DATA ###
 
 
@@ -273,6 +312,16 @@ def build_multiplier_synthdef(channel_count=1):
     return builder.build()
 
 
+@pytest.helpers.register
+def build_sin_osc_synthdef(ugen_count=1, name=None):
+    with supriya.synthdefs.SynthDefBuilder(frequency=440) as builder:
+        source = builder['frequency']
+        for i in range(ugen_count):
+            source = supriya.ugens.SinOsc.ar(frequency=source + i)
+        supriya.ugens.Out.ar(bus=0, source=source)
+    return builder.build(name=name)
+
+
 @pytest.helpers.register
 def compare_path_contents(path_to_search, expected_files, test_path):
     actual_files = sorted(
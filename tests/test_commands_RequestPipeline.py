@@ -0,0 +1,88 @@
+import asyncio
+import supriya.assets.synthdefs
+import supriya.commands
+import supriya.osc
+import supriya.realtime
+
+
+class SyncEchoProtocol(asyncio.DatagramProtocol):
+    """
+    Answers every ``/sync`` in every received bundle with ``/synced``.
+    """
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.datagram_count = 0
+
+    def datagram_received(self, data, address):
+        self.datagram_count += 1
+        bundle = supriya.osc.OscBundle.from_datagram(data)
+        for message in bundle.contents:
+            sync_id = message.contents[-1]
+            reply = supriya.osc.OscMessage('/synced', sync_id)
+            self.transport.sendto(reply.to_datagram(), address)
+
+
+def test_pack_01():
+    pipeline = supriya.commands.RequestPipeline(
+        supriya.commands.NodeQueryRequest(node_id)
+        for node_id in range(500)
+        )
+    osc_bundles = pipeline.to_osc_bundles()
+    assert len(pipeline) == 500
+    assert sum(len(x.contents) for x in osc_bundles) == 500
+    assert all(
+        len(x.to_datagram()) <= pipeline.maximum_datagram_size
+        for x in osc_bundles
+        )
+    assert len(osc_bundles) < 10
+
+
+def test_pack_02():
+    """
+    Oversized messages still travel, alone in their own bundle.
+    """
+    pipeline = supriya.commands.RequestPipeline(
+        [
+            supriya.commands.NodeQueryRequest(1000),
+            supriya.commands.SynthDefReceiveRequest(
+                synthdefs=[supriya.assets.synthdefs.default],
+                ),
+            supriya.commands.NodeQueryRequest(1001),
+            ],
+        maximum_datagram_size=64,
+        )
+    osc_bundles = pipeline.to_osc_bundles()
+    assert [len(x.contents) for x in osc_bundles] == [1, 1, 1]
+
+
+def test_communicate_01(forget_servers, monkeypatch):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    transport, protocol = loop.run_until_complete(
+        loop.create_datagram_endpoint(
+            SyncEchoProtocol,
+            local_addr=('127.0.0.1', 0),
+            ))
+    port = transport.get_extra_info('sockname')[1]
+    async_server = supriya.realtime.AsyncServer(port=port)
+    monkeypatch.setattr(async_server.server, '_is_running', True)
+    pipeline = supriya.commands.RequestPipeline(
+        supriya.commands.SyncRequest(sync_id=i)
+        for i in range(200)
+        )
+
+    async def main():
+        await async_server.connect()
+        futures = pipeline.communicate(server=async_server)
+        return await asyncio.wait_for(asyncio.gather(*futures), 1)
+
+    try:
+        responses = loop.run_until_complete(main())
+    finally:
+        async_server.disconnect()
+        transport.close()
+        loop.close()
+        asyncio.set_event_loop(asyncio.new_event_loop())
+    assert [response.sync_id for response in responses] == list(range(200))
+    assert protocol.datagram_count == len(pipeline.to_osc_bundles())
@@ -0,0 +1,156 @@
+import multiprocessing
+import pathlib
+import pytest
+import supriya.nonrealtime
+import supriya.realtime
+
+
+def write_file(path, size):
+    path.write_bytes(b'x' * size)
+    return path
+
+
+def test_lru_eviction(tmpdir):
+    directory_path = pathlib.Path(str(tmpdir))
+    render_cache = supriya.nonrealtime.RenderCache(
+        directory_path / 'cache',
+        maximum_size=250,
+        )
+    for name in 'abc':
+        render_cache.store(name, write_file(directory_path / name, 100))
+    assert 'a' not in render_cache
+    assert 'b' in render_cache and 'c' in render_cache
+    assert render_cache.restore('b', directory_path / 'restored')
+    render_cache.store('d', write_file(directory_path / 'd', 100))
+    assert sorted(
+        key for key in 'abcd' if key in render_cache
+        ) == ['b', 'd']
+    assert render_cache.size == 200
+
+
+def test_index_persists(tmpdir):
+    directory_path = pathlib.Path(str(tmpdir))
+    render_cache = supriya.nonrealtime.RenderCache(directory_path / 'cache')
+    render_cache.store('a', write_file(directory_path / 'a', 10))
+    render_cache = supriya.nonrealtime.RenderCache(directory_path / 'cache')
+    assert len(render_cache) == 1
+    render_cache.clear()
+    assert len(render_cache) == 0
+    assert not render_cache.restore('a', directory_path / 'restored')
+
+
+def store_files(directory_path, prefix):
+    render_cache = supriya.nonrealtime.RenderCache(directory_path / 'cache')
+    for i in range(20):
+        name = '{}-{}'.format(prefix, i)
+        render_cache.store(name, write_file(directory_path / name, 10))
+
+
+def test_concurrent_processes(tmpdir):
+    """
+    Processes sharing a render cache keep each other's index entries.
+    """
+    directory_path = pathlib.Path(str(tmpdir))
+    processes = [
+        multiprocessing.Process(
+            target=store_files, args=(directory_path, prefix))
+        for prefix in 'abcd'
+        ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    render_cache = supriya.nonrealtime.RenderCache(directory_path / 'cache')
+    assert len(render_cache) == 80
+    assert render_cache.size == 800
+
+
+def test_missing_entries(monkeypatch, tmpdir):
+    """
+    Entries removed by another process are skipped.
+    """
+    directory_path = pathlib.Path(str(tmpdir))
+    render_cache = supriya.nonrealtime.RenderCache(
+        directory_path / 'cache',
+        maximum_size=150,
+        )
+    render_cache.store('a', write_file(directory_path / 'a', 100))
+    index = render_cache._read_index()
+    render_cache._get_entry_path('a').unlink()
+    # As if another process removed the file just after reading the index.
+    monkeypatch.setattr(
+        supriya.nonrealtime.RenderCache,
+        '_read_index',
+        lambda self: dict(index),
+        )
+    assert not render_cache.restore('a', directory_path / 'restored')
+    render_cache.store('b', write_file(directory_path / 'b', 100))
+    render_cache.clear()
+    monkeypatch.undo()
+    assert len(render_cache) == 0
+
+
+def test_session_render(monkeypatch, nonrealtime_paths):
+    """
+    Identical sessions in different render directories render only once.
+    """
+    rendered_paths = []
+
+    def render_datagram(self, session, input_file_path, output_file_path,
+        session_osc_file_path, **kwargs):
+        rendered_paths.append(output_file_path)
+        output_file_path.write_bytes(b'rendered')
+        return 0
+
+    monkeypatch.setattr(
+        supriya.nonrealtime.SessionRenderer,
+        '_render_datagram',
+        render_datagram,
+        )
+    render_cache = supriya.nonrealtime.RenderCache(
+        nonrealtime_paths.test_directory_path / 'cache',
+        )
+    transcripts = []
+    for name in ('one', 'two'):
+        render_directory_path = nonrealtime_paths.render_directory_path / name
+        render_directory_path.mkdir()
+        session = pytest.helpers.make_test_session()
+        exit_code, output_file_path = session.render(
+            render_cache=render_cache,
+            render_directory_path=render_directory_path,
+            )
+        assert exit_code == 0
+        assert output_file_path.read_bytes() == b'rendered'
+        transcripts.append(session.transcript)
+    assert len(rendered_paths) == 1
+    assert len(render_cache) == 1
+    assert 'Stored {} in render cache.'.format(
+        output_file_path.name) in transcripts[0]
+    assert 'Restored {} from render cache.'.format(
+        output_file_path.name) in transcripts[1]
+
+
+def test_scsynth_version(monkeypatch, tmpdir):
+    """
+    Cache keys carry the version of the scsynth which renders.
+    """
+    directory_path = pathlib.Path(str(tmpdir))
+    renderer = supriya.nonrealtime.SessionRenderer(
+        pytest.helpers.make_test_session())
+    monkeypatch.setattr(
+        supriya.nonrealtime.RenderCache, '_scsynth_versions', {})
+    keys = []
+    for version in ('3.9.3', '3.10.0'):
+        bin_path = directory_path / version
+        bin_path.mkdir()
+        scsynth_path = bin_path / 'scsynth'
+        scsynth_path.write_text(
+            '#!/bin/sh\necho scsynth {}\n'.format(version))
+        scsynth_path.chmod(0o755)
+        monkeypatch.setenv('PATH', str(bin_path))
+        keys.append(renderer._build_render_cache_key(
+            directory_path / 'session-abc',
+            server_options=supriya.realtime.ServerOptions(),
+            ))
+    assert 'scsynth 3.9.3' in keys[0]
+    assert 'scsynth 3.10.0' in keys[1]
@@ -0,0 +1,241 @@
+import pathlib
+import threading
+import time
+import pytest
+import supriya.nonrealtime
+
+
+def build_sessions():
+    """
+    Two independent inner sessions feeding one outer session.
+    """
+    diskin_synthdef = pytest.helpers.build_diskin_synthdef(channel_count=8)
+    inner_sessions = [
+        pytest.helpers.make_test_session(multiplier=multiplier)
+        for multiplier in (0.25, 0.5)
+        ]
+    outer_session = supriya.nonrealtime.Session(name='outer-session')
+    with outer_session.at(0):
+        for inner_session in inner_sessions:
+            buffer_ = outer_session.cue_soundfile(inner_session, duration=10)
+            outer_session.add_synth(
+                synthdef=diskin_synthdef,
+                buffer_id=buffer_,
+                duration=10,
+                )
+    return inner_sessions, outer_session
+
+
+class FakeRender:
+
+    def __init__(self, failing_session=None):
+        self.active_sessions = set()
+        self.failing_session = failing_session
+        self.lock = threading.Lock()
+        self.log = []
+
+    def __call__(self, session, input_file_path, output_file_path,
+        session_osc_file_path, progress_bar_position=None, **kwargs):
+        with self.lock:
+            self.active_sessions.add(session)
+            self.log.append(('start', session, set(self.active_sessions)))
+        time.sleep(0.2)
+        with self.lock:
+            self.active_sessions.remove(session)
+            self.log.append(('stop', session, None))
+            if session is self.failing_session:
+                self.failing_session = None
+                raise RuntimeError
+        output_file_path.write_bytes(b'rendered')
+        return 0
+
+
+def test_parallel(monkeypatch, nonrealtime_paths):
+    inner_sessions, outer_session = build_sessions()
+    fake_render = FakeRender()
+    monkeypatch.setattr(
+        supriya.nonrealtime.SessionRenderer,
+        '_render_datagram',
+        lambda renderer, *args, **kwargs: fake_render(*args, **kwargs),
+        )
+    exit_code, output_file_path = outer_session.render(
+        render_directory_path=nonrealtime_paths.render_directory_path,
+        worker_count=4,
+        )
+    assert exit_code == 0
+    assert output_file_path.exists()
+    starts = [entry for entry in fake_render.log if entry[0] == 'start']
+    assert len(starts) == 3
+    assert starts[1][2] == set(inner_sessions)
+    assert fake_render.log[-2] == ('start', outer_session, {outer_session})
+
+
+def test_parallel_fallback(monkeypatch, nonrealtime_paths):
+    inner_sessions, outer_session = build_sessions()
+    fake_render = FakeRender(failing_session=inner_sessions[1])
+    monkeypatch.setattr(
+        supriya.nonrealtime.SessionRenderer,
+        '_render_datagram',
+        lambda renderer, *args, **kwargs: fake_render(*args, **kwargs),
+        )
+    exit_code, output_file_path = outer_session.render(
+        render_directory_path=nonrealtime_paths.render_directory_path,
+        worker_count=4,
+        )
+    assert exit_code == 0
+    assert output_file_path.exists()
+    assert 'Falling back to serial rendering.' in outer_session.transcript
+    sessions = [entry[1] for entry in fake_render.log if entry[0] == 'start']
+    assert sessions[2:] == [inner_sessions[1], outer_session]
+
+
+def build_segmentable_session():
+    """
+    A session which falls silent at 3 and 6, inside one long-lived group.
+    """
+    session = supriya.nonrealtime.Session()
+    with session.at(0):
+        group = session.add_group()
+    for offset in (0, 3, 6):
+        with session.at(offset):
+            group.add_synth(duration=2)
+        with session.at(offset + 1):
+            session.add_synth(duration=2)
+    return session
+
+
+def test_segments_01():
+    session = build_segmentable_session()
+    renderer = supriya.nonrealtime.SessionRenderer(session)
+    assert renderer._find_segment_offsets(session, 8, 1) == [3, 6]
+    assert renderer._find_segment_offsets(session, 8, 4) == [6]
+    assert renderer._find_segment_offsets(session, 8, 8) == []
+
+
+def test_segments_02():
+    session = build_segmentable_session()
+    renderer = supriya.nonrealtime.SessionRenderer(session)
+    osc_bundles = renderer.to_osc_bundles()
+    segments = renderer._build_segments(
+        session, osc_bundles, [6], segment_overlap=0.5)
+    assert [start_offset for start_offset, _ in segments] == [0, 6]
+    assert [
+        [x.address for x in osc_bundle.contents]
+        for osc_bundle in segments[0][1][-2:]
+        ] == [['/n_set'], [0]]
+    assert [x.timestamp for x in segments[0][1][-2:]] == [6, 6.5]
+    setup_bundle = segments[1][1][0]
+    assert setup_bundle.timestamp == 0
+    assert [x.address for x in setup_bundle.contents] == [
+        '/d_recv', '/g_new', '/s_new']
+    assert setup_bundle.contents[1].contents == (1000, 1, 0)
+    assert [x.timestamp for x in segments[1][1]] == [0, 1, 2, 3]
+
+
+def test_segmented(monkeypatch, nonrealtime_paths):
+    session = build_segmentable_session()
+    lock = threading.Lock()
+    rendered_paths, stitched_offsets = [], []
+
+    def fake_render(renderer, session, input_file_path, output_file_path,
+        *args, **kwargs):
+        with lock:
+            rendered_paths.append(output_file_path)
+        output_file_path.write_bytes(b'rendered')
+        return 0
+
+    def fake_stitch(renderer, output_file_path, start_offsets, *args):
+        stitched_offsets.append(start_offsets)
+        output_file_path.write_bytes(b'stitched')
+
+    monkeypatch.setattr(
+        supriya.nonrealtime.SessionRenderer, '_render_datagram', fake_render)
+    monkeypatch.setattr(
+        supriya.nonrealtime.SessionRenderer, '_stitch_segments', fake_stitch)
+    exit_code, output_file_path = session.render(
+        render_directory_path=nonrealtime_paths.render_directory_path,
+        segment_duration=2,
+        worker_count=3,
+        )
+    assert exit_code == 0
+    assert output_file_path.read_bytes() == b'stitched'
+    assert stitched_offsets == [[0, 3, 6]]
+    assert len(set(rendered_paths)) == 3
+    assert all('.partial.' in path.name for path in rendered_paths)
+    assert not any(path.exists() for path in rendered_paths)
+    # Completed segments survive an interrupted render.
+    output_file_path.unlink()
+    exit_code, output_file_path = session.render(
+        render_directory_path=nonrealtime_paths.render_directory_path,
+        segment_duration=2,
+        )
+    assert stitched_offsets == [[0, 3, 6], [0, 3, 6]]
+    assert len(rendered_paths) == 3
+
+
+def test_streamed_score(monkeypatch, nonrealtime_paths):
+    session = build_segmentable_session()
+    osc_file_paths = []
+
+    def fake_render(renderer, session, input_file_path, output_file_path,
+        session_osc_file_path, *args, **kwargs):
+        osc_file_paths.append(session_osc_file_path)
+        output_file_path.write_bytes(b'rendered')
+        return 0
+
+    monkeypatch.setattr(
+        supriya.nonrealtime.SessionRenderer, '_render_datagram', fake_render)
+    exit_code, output_file_path = session.render(
+        render_directory_path=nonrealtime_paths.render_directory_path,
+        )
+    osc_file_path = output_file_path.with_suffix('.osc')
+    assert osc_file_paths == [pathlib.Path(osc_file_path.name)]
+    assert osc_file_path.read_bytes() == session.to_datagram()
+    assert not osc_file_path.with_suffix('.partial.osc').exists()
+    # Content-addressed scores are skipped without being read.
+    output_file_path.unlink()
+    osc_file_path.write_bytes(b'unread')
+    session.render(
+        render_directory_path=nonrealtime_paths.render_directory_path,
+        )
+    assert osc_file_path.read_bytes() == b'unread'
+    assert '    Skipped {}. File already exists.'.format(
+        osc_file_path.name) in session.transcript
+
+
+def test_segmented_render_cache(monkeypatch, nonrealtime_paths):
+    session = build_segmentable_session()
+
+    def fake_render(renderer, session, input_file_path, output_file_path,
+        *args, **kwargs):
+        output_file_path.write_bytes(b'rendered')
+        return 0
+
+    def fake_stitch(renderer, output_file_path, start_offsets, *args):
+        output_file_path.write_bytes(b'stitched')
+
+    monkeypatch.setattr(
+        supriya.nonrealtime.SessionRenderer, '_render_datagram', fake_render)
+    monkeypatch.setattr(
+        supriya.nonrealtime.SessionRenderer, '_stitch_segments', fake_stitch)
+    render_cache = supriya.nonrealtime.RenderCache(
+        nonrealtime_paths.test_directory_path / 'cache',
+        )
+    contents = []
+    for name, kwargs in (
+        ('segmented', dict(segment_duration=2)),
+        ('whole', {}),
+        ('overlapped', dict(segment_duration=2, segment_overlap=0.5)),
+        ):
+        render_directory_path = nonrealtime_paths.render_directory_path / name
+        render_directory_path.mkdir()
+        exit_code, output_file_path = session.render(
+            render_cache=render_cache,
+            render_directory_path=render_directory_path,
+            **kwargs
+            )
+        assert exit_code == 0
+        contents.append(output_file_path.read_bytes())
+    # Stitched segments are not restored in place of whole renders.
+    assert contents == [b'stitched', b'rendered', b'stitched']
+    assert len(render_cache) == 3
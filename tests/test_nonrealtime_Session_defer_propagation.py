@@ -0,0 +1,94 @@
+import contextlib
+import pytest
+import random
+import supriya.nonrealtime
+
+
+def build_session(defer, seed=0):
+    random.seed(seed)
+    session = supriya.nonrealtime.Session()
+    with session.defer_propagation() if defer else contextlib.ExitStack():
+        with session.at(0):
+            groups = [session.add_group(duration=20) for _ in range(3)]
+        for _ in range(40):
+            offset = random.randint(0, 15)
+            with session.at(offset):
+                target = random.choice(groups + [session])
+                node = target.add_synth(
+                    add_action=random.choice(
+                        ['ADD_TO_HEAD', 'ADD_TO_TAIL']),
+                    duration=random.randint(1, 5),
+                    )
+            with session.at(random.randint(offset, node.stop_offset - 1)):
+                random.choice(groups).move_node(node)
+        with session.at(5):
+            groups[0].move_node(groups[1], add_action='ADD_TO_TAIL')
+        with session.at(10):
+            groups[2].split()
+        groups[0].set_duration(12)
+    return session
+
+
+def test_01():
+    """
+    Deferred propagation builds the same session.
+    """
+    for seed in range(3):
+        session_one = build_session(False, seed=seed)
+        session_two = build_session(True, seed=seed)
+        assert session_one.offsets == session_two.offsets
+        assert session_one.to_strings() == session_two.to_strings()
+        assert session_one.to_lists() == session_two.to_lists()
+
+
+def test_02():
+    """
+    Propagation waits for the outermost context manager.
+    """
+    session = supriya.nonrealtime.Session()
+    with session.defer_propagation():
+        with session.defer_propagation():
+            with session.at(0):
+                group = session.add_group(duration=10)
+            with session.at(5):
+                synth = group.add_synth(duration=10)
+        assert synth not in session.states[5.0].nodes_to_parents
+        assert session._deferred_offsets
+    assert session._deferred_offsets is None
+    assert session.states[5.0].nodes_to_parents[synth] is group
+
+
+def test_03():
+    """
+    Reading node trees inside the context manager propagates first.
+    """
+    session = supriya.nonrealtime.Session()
+    with session.defer_propagation():
+        with session.at(0):
+            group = session.add_group(duration=10)
+        with session.at(5):
+            synth = group.add_synth(duration=10)
+        assert synth.get_parentage(offset=7) == [
+            synth, group, session.root_node]
+        assert session.states[5.0].nodes_to_parents[synth] is group
+
+
+@pytest.mark.parametrize('defer', [False, True])
+@pytest.mark.parametrize('move_offset', [0, 5])
+def test_cycle(defer, move_offset):
+    """
+    Moving a group into its own child fails whether or not deferred, and
+    leaves the session intact.
+    """
+    expected_session = supriya.nonrealtime.Session()
+    with expected_session.at(0):
+        expected_session.add_group(duration=10).add_group(duration=10)
+    session = supriya.nonrealtime.Session()
+    with session.defer_propagation() if defer else contextlib.ExitStack():
+        with session.at(0):
+            parent = session.add_group(duration=10)
+            child = parent.add_group(duration=10)
+        with session.at(move_offset):
+            with pytest.raises(ValueError):
+                child.move_node(parent)
+    assert session.to_strings() == expected_session.to_strings()
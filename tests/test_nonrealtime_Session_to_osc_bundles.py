@@ -0,0 +1,75 @@
+import supriya.nonrealtime
+
+
+def build_session():
+    session = supriya.nonrealtime.Session(0, 2)
+    synths = []
+    for i in range(20):
+        with session.at(i):
+            synths.append(session.add_synth(duration=2, frequency=440 + i))
+    return session, synths
+
+
+def compiled_bundles(session):
+    return {
+        offset: compiled_offset[-1]
+        for offset, compiled_offset in session._compiled_offsets.items()
+        }
+
+
+def recompile(session):
+    session._compiled_offsets.clear()
+    return session.to_lists()
+
+
+def test_01():
+    """
+    Appending a synth recompiles only the offsets it touches.
+    """
+    session, _ = build_session()
+    session.to_lists()
+    old_bundles = compiled_bundles(session)
+    with session.at(20):
+        session.add_synth(duration=2, frequency=1000)
+    result = session.to_lists()
+    new_bundles = compiled_bundles(session)
+    reused_offsets = [
+        offset for offset, bundle in new_bundles.items()
+        if old_bundles.get(offset) is bundle
+        ]
+    assert sorted(reused_offsets) == [float(_) for _ in range(20)]
+    assert result == recompile(session)
+
+
+def test_02():
+    """
+    Node settings, moves and deletions invalidate their offsets.
+    """
+    session, synths = build_session()
+    session.to_lists()
+    with session.at(5.5):
+        synths[5]['frequency'] = 880
+    assert session.to_lists() == recompile(session)
+    with session.at(7):
+        session.move_node(synths[6], add_action='ADD_TO_TAIL')
+    assert session.to_lists() == recompile(session)
+    synths[10].delete()
+    assert session.to_lists() == recompile(session)
+    synths[12].set_duration(5)
+    assert session.to_lists() == recompile(session)
+    assert session.to_lists(duration=30) == recompile(session)
+
+
+def test_03():
+    """
+    Buffer and bus events invalidate their offsets.
+    """
+    session, _ = build_session()
+    with session.at(0):
+        buffer_ = session.add_buffer(duration=10, frame_count=16)
+        bus = session.add_bus()
+    session.to_lists()
+    with session.at(3):
+        buffer_.zero()
+        bus.set_(0.5)
+    assert session.to_lists() == recompile(session)
@@ -0,0 +1,85 @@
+import asyncio
+import struct
+import supriya.commands
+import supriya.osc
+import supriya.realtime
+
+
+class EchoProtocol(asyncio.DatagramProtocol):
+    """
+    Answers every datagram with ``/synced``, echoing its trailing integer.
+    """
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, address):
+        sync_id = struct.unpack('>i', data[-4:])[0]
+        reply = supriya.osc.OscMessage('/synced', sync_id)
+        self.transport.sendto(reply.to_datagram(), address)
+
+
+def make_echo_endpoint(loop):
+    transport, _ = loop.run_until_complete(loop.create_datagram_endpoint(
+        EchoProtocol,
+        local_addr=('127.0.0.1', 0),
+        ))
+    return transport, transport.get_extra_info('sockname')[1]
+
+
+def test_01(forget_servers):
+    """
+    Received datagrams are dispatched to the server's OSC callbacks.
+    """
+    loop = asyncio.new_event_loop()
+    transport, port = make_echo_endpoint(loop)
+    server = supriya.realtime.Server(port=port)
+    controller = supriya.osc.AsyncOscController(server=server)
+    loop.run_until_complete(controller.boot(loop=loop))
+    messages = []
+    callback = supriya.osc.OscCallback(
+        address_pattern='/synced',
+        procedure=messages.append,
+        )
+    server.register_osc_callback(callback)
+    try:
+        controller.send(('/sync', 23))
+        loop.run_until_complete(asyncio.sleep(0.1))
+    finally:
+        server.unregister_osc_callback(callback)
+        controller.quit()
+        transport.close()
+        loop.close()
+    assert messages == [supriya.osc.OscMessage('/synced', 23)]
+    assert not controller.is_running
+
+
+def test_02(forget_servers, monkeypatch):
+    """
+    Many requests resolve concurrently on one event loop.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    transport, port = make_echo_endpoint(loop)
+    async_server = supriya.realtime.AsyncServer(port=port)
+    monkeypatch.setattr(async_server.server, '_is_running', True)
+
+    async def main():
+        await async_server.connect()
+        requests = [
+            supriya.commands.SyncRequest(sync_id=i)
+            for i in range(100)
+            ]
+        return await asyncio.gather(*[
+            request.communicate_async(server=async_server)
+            for request in requests
+            ])
+
+    try:
+        responses = loop.run_until_complete(main())
+    finally:
+        async_server.disconnect()
+        transport.close()
+        loop.close()
+        asyncio.set_event_loop(asyncio.new_event_loop())
+    assert [response.sync_id for response in responses] == list(range(100))
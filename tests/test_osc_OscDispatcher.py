@@ -0,0 +1,88 @@
+import supriya.osc
+
+
+def make_callback(calls, name, address_pattern, **kwargs):
+    return supriya.osc.OscCallback(
+        address_pattern=address_pattern,
+        procedure=lambda message: calls.append((name, message.address)),
+        **kwargs
+        )
+
+
+def test_01():
+    """
+    Literal, wildcard and regex patterns all match, in registration order.
+    """
+    calls = []
+    dispatcher = supriya.osc.OscDispatcher()
+    for name, address_pattern in [
+        ('a', '/n_go'),
+        ('b', '/n_*'),
+        ('c', '/*'),
+        ('d', '/n_(go|end)'),
+        ('e', '/n_end'),
+        ('f', '/*/*'),
+        ]:
+        dispatcher.register_callback(
+            make_callback(calls, name, address_pattern))
+    dispatcher(supriya.osc.OscMessage('/n_go', 1000))
+    dispatcher(supriya.osc.OscMessage('/n_end', 1000))
+    dispatcher(supriya.osc.OscMessage('/status.reply', 1))
+    dispatcher(supriya.osc.OscMessage('/levels/input', 1))
+    assert calls == [
+        ('a', '/n_go'),
+        ('b', '/n_go'),
+        ('c', '/n_go'),
+        ('d', '/n_go'),
+        ('b', '/n_end'),
+        ('c', '/n_end'),
+        ('d', '/n_end'),
+        ('e', '/n_end'),
+        ('c', '/status.reply'),
+        ('f', '/levels/input'),
+        ]
+
+
+def test_02():
+    """
+    Argument templates filter by prefix.
+    """
+    calls = []
+    dispatcher = supriya.osc.OscDispatcher()
+    for name, template in [
+        ('a', (1000,)),
+        ('b', (1001,)),
+        ('c', (1000, 7)),
+        ('d', None),
+        ('e', ([1000],)),
+        ]:
+        dispatcher.register_callback(make_callback(
+            calls, name, '/tr', argument_template=template))
+    dispatcher(supriya.osc.OscMessage('/tr', 1000, 7, 0.5))
+    dispatcher(supriya.osc.OscMessage('/tr', 1001, 8, 0.5))
+    dispatcher(supriya.osc.OscMessage('/tr', 1000))
+    assert [name for name, _ in calls] == ['a', 'c', 'd', 'b', 'd', 'a', 'c', 'd']
+
+
+def test_03():
+    """
+    Unregistering and one-shot callbacks leave no residue.
+    """
+    calls = []
+    dispatcher = supriya.osc.OscDispatcher()
+    callbacks = [
+        make_callback(calls, 'a', '/n_*/x'),
+        make_callback(calls, 'b', '/n_go', is_one_shot=True),
+        make_callback(calls, 'c', '/n_(go)', argument_template=[1]),
+        ]
+    for callback in callbacks:
+        dispatcher.register_callback(callback)
+    dispatcher(supriya.osc.OscMessage('/n_go', 1))
+    dispatcher(supriya.osc.OscMessage('/n_go', 1))
+    assert [name for name, _ in calls] == ['b', 'c', 'c']
+    for callback in callbacks:
+        dispatcher.unregister_callback(callback)
+    assert not dispatcher._address_map
+    assert not dispatcher._literal_map
+    assert not dispatcher._regex_map
+    assert dispatcher._pattern_trie == dispatcher._new_trie_node()
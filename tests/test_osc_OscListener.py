@@ -0,0 +1,23 @@
+import types
+import supriya.osc
+
+
+def test_buffer_replaced_while_receiving():
+    datagram = supriya.osc.OscMessage('/status.reply', 1).to_datagram()
+
+    def recvfrom_into(buffer):
+        # The receive buffer size changes while this call blocks.
+        listener.buffer = bytearray(len(datagram))
+        buffer[:len(datagram)] = datagram
+        return len(datagram), ('127.0.0.1', 57110)
+
+    listener = supriya.osc.OscListener(
+        client=types.SimpleNamespace(
+            socket_instance=types.SimpleNamespace(
+                recvfrom_into=recvfrom_into,
+                ),
+            ),
+        receive_buffer_size=1024,
+        )
+    assert listener.get_message() == supriya.osc.OscMessage(
+        '/status.reply', 1)
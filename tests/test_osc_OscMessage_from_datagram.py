@@ -0,0 +1,58 @@
+import pytest
+import supriya.osc
+
+
+messages = [
+    supriya.osc.OscMessage('/g_new', 0, 0),
+    supriya.osc.OscMessage('/levels/input', 1000, 1, 0.5, 0.25, 0.125),
+    supriya.osc.OscMessage('/n_set', 1000, 'frequency', 440.0),
+    supriya.osc.OscMessage('/flags', True, False, None, 'abcd', -3),
+    supriya.osc.OscMessage('/d_recv', bytearray(b'abcde'), bytearray(b'')),
+    supriya.osc.OscMessage('/array', [1, 2.5, ['a', 'bb']], 'c'),
+    supriya.osc.OscMessage('/empty'),
+    ]
+
+
+@pytest.mark.parametrize('message', messages)
+def test_01(message):
+    """
+    The compiled codec matches the generic codec byte-for-byte.
+    """
+    datagram = message.to_datagram()
+    assert datagram == message._to_datagram_generic()
+    assert supriya.osc.OscMessage.from_datagram(datagram) == message
+    assert supriya.osc.OscMessage._from_datagram_generic(datagram) == message
+
+
+@pytest.mark.parametrize('message', messages)
+def test_02(message):
+    """
+    Decoding works in place from a memoryview over a larger buffer.
+    """
+    datagram = message.to_datagram()
+    buffer = bytearray(datagram) + bytearray(64)
+    view = memoryview(buffer)[:len(datagram)]
+    assert supriya.osc.OscMessage.from_datagram(view) == message
+
+
+def test_03():
+    """
+    Integer command addresses round-trip.
+    """
+    message = supriya.osc.OscMessage(52, 23)
+    datagram = message.to_datagram()
+    assert supriya.osc.OscMessage.from_datagram(datagram) == message
+
+
+def test_04():
+    bundle = supriya.osc.OscBundle(
+        timestamp=1401557034.5,
+        contents=[
+            messages[0],
+            supriya.osc.OscBundle(contents=messages[1:4]),
+            messages[4],
+            ],
+        )
+    datagram = bundle.to_datagram()
+    assert supriya.osc.OscBundle.from_datagram(datagram) == bundle
+    assert supriya.osc.OscBundle.from_datagram(memoryview(datagram)) == bundle
@@ -1,5 +1,6 @@
 import time
 import uuid
+import supriya.osc
 import supriya.patterns
 
 
@@ -205,3 +206,81 @@ def test_13():
     assert [(round(x - now, 6), round(y - now, 6)) for x, y in manifest] == [
         (0.0, 0.0), (0.001, 0.001), (0.002, 0.002), (0.003, 0.003)
         ]
+
+
+def test_14():
+    """
+    Lookahead calls procedures early, with unchanged scheduled times.
+    """
+    manifest = []
+    event = Event(manifest, delta=0.1, save_execution_time=True)
+    clock = supriya.patterns.Clock(lookahead=0.05)
+    now = clock.schedule(event, 0.1)
+    time.sleep(0.1)
+    assert [round(y - now, 6) for x, y in manifest] == [0.1]
+    time.sleep(0.4)
+    assert [round(y - now, 6) for x, y in manifest] == [0.1, 0.2, 0.3, 0.4]
+    assert clock.event_count == 4
+    assert clock.maximum_lateness < 0.05
+    assert 0 <= clock.mean_lateness <= clock.maximum_lateness
+
+
+def test_15():
+    """
+    Messages sent during one tick are bundled per server and timestamp.
+    """
+
+    class Server:
+
+        def __init__(self):
+            self.messages = []
+
+        def send_message(self, message):
+            self.messages.append(message)
+
+    def procedure(execution_time, scheduled_time):
+        for i in range(3):
+            osc_bundle = supriya.osc.OscBundle(
+                timestamp=scheduled_time,
+                contents=[supriya.osc.OscMessage('/n_set', i)],
+                )
+            clock.send_message(osc_bundle, server)
+
+    server = Server()
+    clock = supriya.patterns.Clock()
+    now = clock.schedule(procedure, 0.05)
+    time.sleep(0.2)
+    assert server.messages == [
+        supriya.osc.OscBundle(
+            timestamp=now + 0.05,
+            contents=[
+                supriya.osc.OscMessage('/n_set', 0),
+                supriya.osc.OscMessage('/n_set', 1),
+                supriya.osc.OscMessage('/n_set', 2),
+                ],
+            ),
+        ]
+
+
+def test_16(capsys):
+    """
+    A failing procedure stops, but other procedures keep running.
+    """
+
+    def failing_procedure(execution_time, scheduled_time):
+        raise Exception('Failure')
+
+    manifest = []
+    event = Event(manifest, delta=0.1)
+    clock = supriya.patterns.Clock()
+    now = clock.schedule(event, 0.1)
+    clock.schedule(failing_procedure, 0.05)
+    time.sleep(0.5)
+    assert [round(_ - now, 6) for _ in manifest] == [0.1, 0.2, 0.3, 0.4]
+    assert 'Exception in clock procedure' in capsys.readouterr().err
+    # The scheduler thread stops once idle, and restarts when scheduling.
+    manifest[:] = []
+    event.count = 0
+    now = clock.schedule(event, 0.05)
+    time.sleep(0.2)
+    assert [round(_ - now, 6) for _ in manifest][:2] == [0.05, 0.15]
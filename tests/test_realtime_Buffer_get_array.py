@@ -0,0 +1,76 @@
+import numpy
+import supriya.commands
+import supriya.osc
+import supriya.realtime
+import supriya.soundfiles
+
+
+def test_01(server):
+    buffer_ = supriya.realtime.Buffer()
+    buffer_.allocate(channel_count=2, frame_count=10000, sync=True)
+    array = numpy.random.RandomState(0).uniform(-1, 1, (10000, 2))
+    buffer_.set_array(array, use_staging=False)
+    assert numpy.allclose(buffer_.get_array(use_staging=False), array)
+    assert numpy.allclose(
+        buffer_.get_array(starting_frame=10, frame_count=5, use_staging=False),
+        array[10:15],
+        )
+    buffer_.free()
+
+
+def test_02(server):
+    buffer_ = supriya.realtime.Buffer()
+    buffer_.allocate(channel_count=2, frame_count=100000, sync=True)
+    array = numpy.random.RandomState(0).uniform(-1, 1, (100000, 2))
+    buffer_.set_array(array, use_staging=True)
+    assert numpy.allclose(buffer_.get_array(use_staging=True), array)
+    assert numpy.allclose(buffer_.get_array(use_staging=False), array)
+    buffer_.free()
+
+
+def test_chunks():
+    buffer_ = supriya.realtime.Buffer(3)
+    samples = numpy.arange(1000, dtype=numpy.float32)
+    requests = buffer_._build_set_contiguous_requests(50, samples, 512)
+    assert all(
+        len(supriya.osc.OscBundle(contents=[
+            request.to_osc_message()]).to_datagram()) <= 512
+        for request in requests
+        )
+    assert [
+        value
+        for request in requests
+        for _, values in request.index_values_pairs
+        for value in values
+        ] == samples.tolist()
+    requests = buffer_._build_get_contiguous_requests(50, 1000, 512)
+    assert requests[0].index_count_pairs == ((50, 92),)
+    assert sum(
+        count
+        for request in requests
+        for _, count in request.index_count_pairs
+        ) == 1000
+
+
+def test_pipelined_responses():
+    """
+    Pipelined requests for one buffer each match only their own reply.
+    """
+    buffer_ = supriya.realtime.Buffer(3)
+    requests = buffer_._build_get_contiguous_requests(0, 200, 512)
+    response = supriya.commands.ResponseManager.handle_message(
+        supriya.osc.OscMessage('/b_setn', 3, 92, 92, *[0.5] * 92))
+    assert [
+        request.response_callback.matches(response)
+        for request in requests
+        ] == [False, True, False]
+
+
+def test_staging_file(tmpdir):
+    file_path = str(tmpdir / 'buffer.wav')
+    samples = numpy.random.RandomState(0).uniform(-1, 1, 3000)
+    supriya.realtime.Buffer._write_staging_file(file_path, samples, 3, 48000)
+    soundfile = supriya.soundfiles.SoundFile(file_path, memory_map=True)
+    assert soundfile.channel_count == 3
+    assert soundfile.sample_rate == 48000
+    assert numpy.allclose(soundfile[:], samples.reshape(1000, 3))
@@ -0,0 +1,118 @@
+import threading
+import types
+import pytest
+import supriya.osc
+import supriya.realtime
+
+
+@pytest.fixture
+def log():
+    return []
+
+
+@pytest.fixture
+def control_write_buffer(log):
+    pseudo_server = types.SimpleNamespace(send_message=log.append)
+    control_write_buffer = supriya.realtime.ControlWriteBuffer(pseudo_server)
+    yield control_write_buffer
+    control_write_buffer.stop()
+
+
+def test_coalescing(log, control_write_buffer):
+    for i in range(10):
+        control_write_buffer.write(1000, frequency=440 + i, amplitude=0.1)
+    control_write_buffer.write(1001, frequency=220)
+    assert len(control_write_buffer) == 3
+    assert control_write_buffer.write_count == 21
+    assert control_write_buffer.elided_count == 18
+    assert control_write_buffer.flush() == tuple(log)
+    assert len(log) == 1
+    assert isinstance(log[0], supriya.osc.OscBundle)
+    assert [tuple(_.contents) for _ in log[0].contents] == [
+        (1000, 'amplitude', 0.1, 'frequency', 449.0),
+        (1001, 'frequency', 220.0),
+        ]
+    assert len(control_write_buffer) == 0
+    assert control_write_buffer.flush() == ()
+    control_write_buffer.write(1000, frequency=440)
+    control_write_buffer.flush()
+    assert log[-1] == supriya.osc.OscMessage(15, 1000, 'frequency', 440.0)
+
+
+def test_discard(log, control_write_buffer):
+    control_write_buffer.write(1000, frequency=440, amplitude=0.1)
+    control_write_buffer.write(1001, frequency=220)
+    control_write_buffer.discard(1000, 'amplitude')
+    control_write_buffer.discard(1001)
+    control_write_buffer.flush()
+    assert log == [supriya.osc.OscMessage(15, 1000, 'frequency', 440.0)]
+
+
+def test_datagram_size(log, control_write_buffer):
+    for node_id in range(1000, 1500):
+        control_write_buffer.write(node_id, frequency=440)
+    control_write_buffer.flush()
+    assert 1 < len(log)
+    assert all(len(_.to_datagram()) <= 8192 for _ in log)
+    assert sum(len(_.contents) for _ in log) == 500
+
+
+def test_start_stop(log, control_write_buffer):
+    flushed = threading.Event()
+    control_write_buffer.server.send_message = lambda message: (
+        log.append(message), flushed.set())
+    control_write_buffer.start(flush_interval=0.01)
+    assert control_write_buffer.is_running
+    assert control_write_buffer.flush_interval == 0.01
+    control_write_buffer.write(1000, frequency=440)
+    assert flushed.wait(1)
+    assert log == [supriya.osc.OscMessage(15, 1000, 'frequency', 440.0)]
+    control_write_buffer.write(1000, frequency=550)
+    control_write_buffer.stop()
+    assert not control_write_buffer.is_running
+    assert control_write_buffer.flush_interval is None
+    assert log[-1] == supriya.osc.OscMessage(15, 1000, 'frequency', 550.0)
+
+
+def test_default_flush_interval(control_write_buffer):
+    control_write_buffer.server.server_options = \
+        supriya.realtime.ServerOptions(block_size=64, sample_rate=48000)
+    control_write_buffer.server.status = None
+    control_write_buffer.start()
+    # Eight 64-sample blocks at 48kHz.
+    assert control_write_buffer.flush_interval == pytest.approx(
+        8 * 64 / 48000.)
+
+
+def test_send_failure(capsys, log, control_write_buffer):
+    failed, flushed = threading.Event(), threading.Event()
+
+    def send_message(message):
+        if not failed.is_set():
+            failed.set()
+            raise OSError
+        log.append(message)
+        flushed.set()
+
+    control_write_buffer.server.send_message = send_message
+    control_write_buffer.start(flush_interval=0.01)
+    control_write_buffer.write(1000, frequency=440)
+    assert failed.wait(1)
+    # The failed flush is reported, and later writes still flush.
+    control_write_buffer.write(1000, frequency=550)
+    assert flushed.wait(1)
+    assert control_write_buffer.is_running
+    assert log[-1] == supriya.osc.OscMessage(15, 1000, 'frequency', 550.0)
+    assert 'Exception in control write buffer' in capsys.readouterr().err
+
+
+def test_group_then_child(log, control_write_buffer):
+    control_write_buffer.write(1000, frequency=2)
+    control_write_buffer.write(1001, frequency=1)
+    control_write_buffer.write(1000, frequency=3)
+    control_write_buffer.flush()
+    # The group's last write reaches its child after the child's own.
+    assert [tuple(_.contents) for _ in log[0].contents] == [
+        (1001, 'frequency', 1.0),
+        (1000, 'frequency', 3.0),
+        ]
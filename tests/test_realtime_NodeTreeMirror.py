@@ -0,0 +1,297 @@
+import supriya.commands
+import supriya.osc
+import supriya.realtime
+
+
+def handle(mirror, address, *contents):
+    message = supriya.osc.OscMessage(address, *contents)
+    response = supriya.commands.ResponseManager.handle_message(message)
+    mirror.response_callback(response)
+
+
+def make_mirror():
+    server = supriya.realtime.Server(port=58400)
+    mirror = supriya.realtime.NodeTreeMirror(server)
+    handle(mirror, '/n_go', 1, 0, -1, -1, 1, -1, -1)
+    handle(mirror, '/n_go', 1000, 1, -1, -1, 1, -1, -1)
+    handle(mirror, '/n_go', 1001, 1, -1, 1000, 0)
+    handle(mirror, '/n_go', 1002, 1000, -1, -1, 0)
+    handle(mirror, '/n_go', 1003, 1, 1000, -1, 0)
+    return mirror
+
+
+def test_notifications():
+    mirror = make_mirror()
+    assert str(mirror.to_query_tree_group()) == '\n'.join([
+        'NODE TREE 0 group',
+        '    1 group',
+        '        1001 None',
+        '        1000 group',
+        '            1002 None',
+        '        1003 None',
+        ])
+    assert not mirror.is_stale
+    assert len(mirror) == 6
+    assert mirror[1000].head_node_id == 1002
+    assert mirror[1000].previous_node_id == 1001
+    assert mirror[1000].next_node_id == 1003
+    handle(mirror, '/n_move', 1003, 1000, 1002, -1, 0)
+    handle(mirror, '/n_move', 1001, 1, 1000, -1, 0)
+    handle(mirror, '/n_off', 1002, 1000, -1, 1003, 0)
+    assert str(mirror.to_query_tree_group()) == '\n'.join([
+        'NODE TREE 0 group',
+        '    1 group',
+        '        1000 group',
+        '            1002 None',
+        '            1003 None',
+        '        1001 None',
+        ])
+    # Freeing a group ends its children after it.
+    handle(mirror, '/n_end', 1000, 1, -1, 1001, 1, 1002, 1003)
+    handle(mirror, '/n_end', 1002, -1, -1, -1, 0)
+    assert 1003 not in mirror
+    assert str(mirror.to_query_tree_group()) == '\n'.join([
+        'NODE TREE 0 group',
+        '    1 group',
+        '        1001 None',
+        ])
+    assert not mirror.is_stale
+
+
+def test_gaps():
+    mirror = make_mirror()
+    # The /n_go for 1004 went missing.
+    handle(mirror, '/n_go', 1005, 1, 1004, -1, 0)
+    assert mirror.is_stale
+    assert mirror[1005].previous_node_id == 1003
+    mirror = make_mirror()
+    handle(mirror, '/n_move', 1004, 1, -1, -1, 0)
+    assert mirror.is_stale
+    mirror = make_mirror()
+    status = supriya.commands.StatusResponse(group_count=3, synth_count=3)
+    mirror._handle_status(status)
+    assert not mirror.is_stale
+    status = supriya.commands.StatusResponse(group_count=3, synth_count=4)
+    mirror._handle_status(status)
+    assert not mirror.is_stale
+    mirror._handle_status(status)
+    assert mirror.is_stale
+
+
+def query_tree_reply(*contents):
+    message = supriya.osc.OscMessage('/g_queryTree.reply', *contents)
+    return supriya.commands.ResponseManager.handle_message(message)
+
+
+def test_reconcile(monkeypatch):
+    mirror = make_mirror()
+    handle(mirror, '/n_go', 1005, 1, 1004, -1, 0)
+    assert mirror.is_stale
+
+    def communicate(mirror, requests, timeout):
+        # Notifications may arrive before or after the reply reflects them.
+        handle(mirror, '/n_go', 1005, 1, 1004, -1, 0)
+        handle(mirror, '/n_go', 1006, 1, 1005, -1, 0)
+        assert [_.node_id for _ in requests] == [0]
+        response = query_tree_reply(
+            0, 0, 1, 1, 3, 1004, -1, 'a', 1005, -1, 'b', 1000, 0)
+        return {(type(response), 0): response}
+
+    monkeypatch.setattr(mirror.server, '_is_running', True)
+    monkeypatch.setattr(
+        supriya.realtime.NodeTreeMirror, '_communicate', communicate)
+    assert mirror.reconcile()
+    assert not mirror.is_stale
+    assert mirror.reconciliation_count == 1
+    assert str(mirror.to_query_tree_group()) == '\n'.join([
+        'NODE TREE 0 group',
+        '    1 group',
+        '        1004 a',
+        '        1005 b',
+        '        1006 None',
+        '        1000 group',
+        ])
+
+
+def test_query_chunks(monkeypatch):
+    mirror = make_mirror()
+    for i in range(1010, 1020):
+        handle(mirror, '/n_go', i, 1000, -1, i - 1 if 1010 < i else 1002, 0)
+    handle(mirror, '/n_go', 1020, 1, 1003, -1, 1, -1, -1)
+    handle(mirror, '/n_go', 1021, 1020, -1, -1, 0)
+    assert not mirror.is_stale
+    sent_requests = []
+
+    def communicate(mirror, requests, timeout):
+        sent_requests.extend(requests)
+        responses = {}
+        for response in (
+            query_tree_reply(0, 1000, 11, *[
+                _ for i in reversed(range(1010, 1020))
+                for _ in (i, -1, 'a')] + [1002, -1, 'b']),
+            query_tree_reply(0, 1020, 1, 1021, -1, 'c'),
+            ):
+            responses[type(response), response.node_id] = response
+        return responses
+
+    monkeypatch.setattr(mirror.server, '_is_running', True)
+    monkeypatch.setattr(mirror.server, 'receive_buffer_size', 1200)
+    monkeypatch.setattr(
+        supriya.realtime.NodeTreeMirror, '_communicate', communicate)
+    query_tree_group = mirror.query()
+    # Groups 0 and 1 are too large for one reply, so the synths directly in
+    # group 1 come from the mirror, and its subgroups are queried apart.
+    assert sorted(_.node_id for _ in sent_requests) == [1000, 1020]
+    assert str(query_tree_group) == '\n'.join([
+        'NODE TREE 0 group',
+        '    1 group',
+        '        1001 None',
+        '        1000 group',
+        ] + [
+        '            {} a'.format(i) for i in reversed(range(1010, 1020))
+        ] + [
+        '            1002 b',
+        '        1003 None',
+        '        1020 group',
+        '            1021 c',
+        ])
+
+
+def test_diff(monkeypatch):
+    mirror = make_mirror()
+    message = supriya.osc.OscMessage(
+        '/g_queryTree.reply', 0, 0, 1, 1, 3,
+        1000, 1, 1002, -1, 'a', 1001, -1, 'b', 1004, -1, 'c',
+        )
+    local_tree = supriya.commands.ResponseManager.handle_message(
+        message).query_tree_group
+    monkeypatch.setattr(
+        supriya.realtime.Server,
+        'query_local_nodes',
+        lambda server, include_controls=False: local_tree,
+        )
+    assert mirror.diff() == {
+        'local_only': (1004,),
+        'moved': (1000, 1001),
+        'remote_only': (1003,),
+        }
+
+
+def test_communicate_failures(monkeypatch):
+    import time
+    mirror = make_mirror()
+
+    def send_message(server, message):
+        node_id = message.contents[0]
+        if node_id == 1000:
+            # Freed before the query arrived.
+            reply = supriya.osc.OscMessage(
+                '/fail', '/g_queryTree', 'Group not found')
+        else:
+            reply = supriya.osc.OscMessage(
+                '/g_queryTree.reply', 0, node_id, 0)
+        server._response_dispatcher(reply)
+
+    monkeypatch.setattr(supriya.realtime.Server, 'send_message', send_message)
+    requests = [
+        supriya.commands.GroupQueryTreeRequest(node_id=node_id)
+        for node_id in (1000, 1020)
+        ]
+    start_time = time.time()
+    responses = mirror._communicate(requests, timeout=5)
+    # A failure completes its request, rather than waiting for a reply.
+    assert time.time() - start_time < 1
+    assert list(responses) == [(supriya.commands.QueryTreeResponse, 1020)]
+
+
+def test_reconcile_freed_group(monkeypatch):
+    mirror = make_mirror()
+    handle(mirror, '/n_go', 1020, 1, 1003, -1, 1, -1, -1)
+    handle(mirror, '/n_go', 1021, 1020, -1, -1, 0)
+    mirror._stale = True
+
+    def communicate(mirror, requests, timeout):
+        # Group 1020 is freed before its query arrives, which fails.
+        handle(mirror, '/n_end', 1021, 1020, -1, -1, 0)
+        handle(mirror, '/n_end', 1020, 1, 1003, -1, 1, -1, -1)
+        response = query_tree_reply(0, 1000, 1, 1002, -1, 'b')
+        return {(type(response), 1000): response}
+
+    monkeypatch.setattr(mirror.server, '_is_running', True)
+    monkeypatch.setattr(mirror.server, 'receive_buffer_size', 400)
+    monkeypatch.setattr(
+        supriya.realtime.NodeTreeMirror, '_communicate', communicate)
+    assert mirror.reconcile()
+    assert str(mirror.to_query_tree_group()) == '\n'.join([
+        'NODE TREE 0 group',
+        '    1 group',
+        '        1001 None',
+        '        1000 group',
+        '            1002 b',
+        '        1003 None',
+        ])
+
+
+def test_query_stale(monkeypatch):
+    mirror = make_mirror()
+    handle(mirror, '/n_go', 1005, 1, 1004, -1, 0)
+    assert mirror.is_stale
+    sent_requests = []
+
+    def communicate(mirror, requests, timeout):
+        sent_requests.append([_.node_id for _ in requests])
+        response = query_tree_reply(
+            0, 0, 1, 1, 3, 1004, -1, 'a', 1005, -1, 'b', 1000, 0)
+        return {(type(response), 0): response}
+
+    monkeypatch.setattr(mirror.server, '_is_running', True)
+    monkeypatch.setattr(
+        supriya.realtime.NodeTreeMirror, '_communicate', communicate)
+    # A stale mirror is reconciled before planning from it.
+    query_tree_group = mirror.query()
+    assert sent_requests == [[0], [0]]
+    assert not mirror.is_stale
+    assert mirror.reconciliation_count == 1
+    assert str(query_tree_group) == str(mirror.to_query_tree_group())
+    # Queries fail if reconciling does.
+    mirror._stale = True
+    monkeypatch.setattr(
+        supriya.realtime.NodeTreeMirror, '_communicate',
+        lambda mirror, requests, timeout: {})
+    assert mirror.query() is None
+    assert mirror.is_stale
+
+
+def test_query_array_controls(monkeypatch):
+    import supriya.synthdefs
+    import supriya.ugens
+    mirror = make_mirror()
+    with supriya.synthdefs.SynthDefBuilder(
+        amplitude=0.1, frequencies=[1, 2, 3]) as builder:
+        supriya.ugens.Out.ar(bus=0, source=supriya.ugens.SinOsc.ar(
+            frequency=builder['frequencies']) * builder['amplitude'])
+    synth = supriya.realtime.Synth(builder.build())
+    sent_requests = []
+
+    def communicate(mirror, requests, timeout):
+        sent_requests.extend(requests)
+        response = supriya.commands.ResponseManager.handle_message(
+            supriya.osc.OscMessage(
+                '/n_setn', 1002, 0, 1, 0.5, 1, 3, 4.0, 5.0, 6.0))
+        return {(type(response), 1002): response}
+
+    monkeypatch.setattr(mirror.server, '_is_running', True)
+    monkeypatch.setattr(mirror.server, '_nodes', {1002: synth})
+    monkeypatch.setattr(mirror.server, 'receive_buffer_size', 200)
+    monkeypatch.setattr(
+        supriya.realtime.NodeTreeMirror, '_communicate', communicate)
+    query_tree_group = mirror.query(include_controls=True)
+    # Each array control is queried whole.
+    synth_requests = [
+        _ for _ in sent_requests
+        if isinstance(_, supriya.commands.SynthGetContiguousRequest)
+        ]
+    assert [tuple(_.index_count_pairs) for _ in synth_requests] == [
+        ((0, 1), (1, 3))]
+    assert 'amplitude: 0.5, frequencies: 4.0, 2: 5.0, 3: 6.0' in str(
+        query_tree_group)
@@ -0,0 +1,69 @@
+import pytest
+import supriya.commands
+import supriya.realtime
+
+
+def make_status(average_cpu_usage, peak_cpu_usage, synth_count):
+    return supriya.commands.StatusResponse(
+        average_cpu_usage=average_cpu_usage,
+        peak_cpu_usage=peak_cpu_usage,
+        synth_count=synth_count,
+        )
+
+
+def test_boot_quit(server_log):
+    server_cluster = supriya.realtime.ServerCluster(
+        server_count=3, initial_port=58200)
+    assert [_.port for _ in server_cluster] == [58200, 58201, 58202]
+    with pytest.raises(RuntimeError):
+        server_cluster.select_server()
+    with server_cluster:
+        assert sorted(server_log) == [
+            ('boot', 58200), ('boot', 58201), ('boot', 58202)]
+        assert server_cluster[1] in server_cluster
+    assert sorted(server_log[-3:]) == [
+        ('quit', 58200), ('quit', 58201), ('quit', 58202)]
+
+
+def test_select_server(server_log):
+    server_cluster = supriya.realtime.ServerCluster(
+        server_count=2, initial_port=58210)
+    server_a, server_b = server_cluster
+    with server_cluster:
+        server_a._status = make_status(10.0, 20.0, 5)
+        server_b._status = make_status(20.0, 25.0, 10)
+        # Each placement on a server counts one more synth's worth of CPU
+        # until its next status arrives.
+        selected = [server_cluster.select_server() for _ in range(7)]
+        assert selected == [server_a] * 6 + [server_b]
+        # A new status resets the placement count.
+        server_a._status = make_status(30.0, 40.0, 16)
+        assert server_cluster.select_server() is server_b
+        # Peak CPU usage breaks ties.
+        server_a._status = make_status(20.0, 30.0, 10)
+        server_b._status = make_status(20.0, 25.0, 10)
+        assert server_cluster.select_server() is server_b
+        # Servers which quit are skipped.
+        server_b.quit()
+        assert server_cluster.select_server() is server_a
+
+
+def test_select_server_without_status(server_log):
+    server_cluster = supriya.realtime.ServerCluster(
+        server_count=2, initial_port=58220)
+    with server_cluster:
+        selected = [server_cluster.select_server() for _ in range(4)]
+        assert selected == list(server_cluster) * 2
+
+
+def test_select_idle_server(server_log):
+    server_cluster = supriya.realtime.ServerCluster(
+        server_count=2, initial_port=58230)
+    server_a, server_b = server_cluster
+    with server_cluster:
+        server_a._status = make_status(0.1, 0.2, 0)
+        server_b._status = make_status(0.1, 0.25, 0)
+        # Placements on idle servers still count, so they alternate rather
+        # than all going to the server with the lowest peak.
+        selected = [server_cluster.select_server() for _ in range(4)]
+        assert selected == [server_a, server_b] * 2
@@ -0,0 +1,89 @@
+import threading
+import pytest
+import supriya.realtime
+
+
+def test_acquire_release(server_log):
+    server_pool = supriya.realtime.ServerPool(
+        server_count=2, initial_port=58100)
+    with pytest.raises(RuntimeError):
+        server_pool.acquire()
+    with server_pool:
+        assert sorted(server_log) == [('boot', 58100), ('boot', 58101)]
+        assert len(server_pool.boot_latencies) == 2
+        server_a = server_pool.acquire()
+        server_b = server_pool.acquire()
+        assert [server_a.port, server_b.port] == [58100, 58101]
+        assert server_pool.available_count == 0
+        with pytest.raises(RuntimeError):
+            server_pool.acquire(timeout=0.01)
+        server_pool.release(server_a)
+        assert server_log[-1] == ('reset', 58100)
+        assert server_pool.acquire() is server_a
+        # Servers which quit are rebooted.
+        server_a.quit()
+        server_pool.release(server_a)
+        assert server_log[-2:] == [('quit', 58100), ('boot', 58100)]
+        assert len(server_pool.boot_latencies) == 3
+        assert len(server_pool.reset_latencies) == 1
+        with pytest.raises(ValueError):
+            server_pool.release(server_a)
+    assert sorted(server_log[-2:]) == [('quit', 58100), ('quit', 58101)]
+    assert not server_pool.servers
+    # Releasing after stopping is harmless.
+    server_pool.release(server_b)
+
+
+def test_waiting(server_log):
+    server_pool = supriya.realtime.ServerPool(
+        server_count=1, initial_port=58110)
+    with server_pool:
+        server = server_pool.acquire()
+        result = []
+        waiter = threading.Thread(
+            target=lambda: result.append(server_pool.acquire(timeout=5)))
+        waiter.start()
+        waiter.join(0.05)
+        assert waiter.is_alive()
+        server_pool.release(server)
+        waiter.join(5)
+        assert result == [server]
+        assert 0.05 <= server_pool.acquire_latencies[-1]
+
+
+def test_failed_boot(server_log, monkeypatch):
+    def boot(server, server_options=None):
+        if server.port == 58121:
+            raise Exception('Address already in use')
+        server_log.append(('boot', server.port))
+        server._is_running = True
+        return server
+
+    monkeypatch.setattr(supriya.realtime.Server, 'boot', boot)
+    server_pool = supriya.realtime.ServerPool(
+        server_count=2, initial_port=58120)
+    with pytest.raises(Exception):
+        server_pool.start()
+    assert server_log == [('boot', 58120), ('quit', 58120)]
+    assert not server_pool.servers
+
+
+def test_failed_reset(server_log, monkeypatch):
+
+    def reset(server):
+        raise OSError
+
+    server_pool = supriya.realtime.ServerPool(
+        server_count=2, initial_port=58130)
+    with server_pool:
+        server = server_pool.acquire()
+        monkeypatch.setattr(supriya.realtime.Server, 'reset', reset)
+        with pytest.raises(OSError):
+            server_pool.release(server)
+        # The failed server is dropped, rather than held as acquired.
+        assert server_log[-1] == ('quit', server.port)
+        assert server not in server_pool
+        assert len(server_pool) == 1
+        assert server_pool.acquire() is not server
+        with pytest.raises(RuntimeError):
+            server_pool.acquire(timeout=0)
@@ -0,0 +1,30 @@
+import types
+import supriya.realtime
+
+
+def test_reconcile_failure(capsys):
+    reconciliations = []
+
+    def reconcile():
+        reconciliations.append(None)
+        raise AssertionError
+
+    pseudo_server = types.SimpleNamespace(
+        node_tree_mirror=types.SimpleNamespace(
+            is_stale=True,
+            reconcile=reconcile,
+            ),
+        quit=lambda: None,
+        register_response_callback=lambda callback: None,
+        send_message=lambda message: None,
+        unregister_response_callback=lambda callback: None,
+        )
+    status_watcher = supriya.realtime.StatusWatcher(pseudo_server)
+    status_watcher.max_attempts = 3
+    status_watcher.start()
+    status_watcher.join(5)
+    # Failed reconciliations are reported, and status requests continue.
+    assert not status_watcher.is_alive()
+    assert status_watcher.attempts == 3
+    assert len(reconciliations) == 3
+    assert 'Exception in node tree reconcile' in capsys.readouterr().err
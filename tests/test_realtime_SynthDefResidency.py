@@ -0,0 +1,163 @@
+import threading
+import types
+import pytest
+import supriya.commands
+import supriya.patterns
+import supriya.realtime
+
+
+build_synthdef = pytest.helpers.build_sin_osc_synthdef
+
+
+@pytest.fixture
+def log(monkeypatch):
+    log = []
+    monkeypatch.setattr(
+        supriya.commands.Request,
+        'communicate',
+        lambda request, server=None, sync=True: log.append(request),
+        )
+    return log
+
+
+@pytest.fixture
+def synthdef_residency(log):
+    pseudo_server = types.SimpleNamespace(sync=lambda: log.append('sync'))
+    return supriya.realtime.SynthDefResidency(pseudo_server)
+
+
+def test_deduplication(log, synthdef_residency):
+    synthdef_a = build_synthdef(name='a')
+    synthdef_b = build_synthdef(ugen_count=2, name='b')
+    assert synthdef_residency.allocate(
+        [synthdef_a, synthdef_b, build_synthdef(name='a')]) == \
+        (synthdef_a, synthdef_b)
+    assert [type(x) for x in log] == [
+        supriya.commands.SynthDefReceiveRequest, str]
+    assert synthdef_a in synthdef_residency
+    assert synthdef_residency.resident_names == {'a', 'b'}
+    # Resident synthdefs are not resent.
+    assert synthdef_residency.allocate([synthdef_b]) == ()
+    assert len(log) == 2
+    # Redefinitions under a resident name are.
+    synthdef_b_prime = build_synthdef(ugen_count=3, name='b')
+    assert synthdef_b_prime not in synthdef_residency
+    assert synthdef_residency.allocate([synthdef_b_prime], sync=False) == \
+        (synthdef_b_prime,)
+    assert len(log) == 3
+    assert synthdef_b not in synthdef_residency
+    synthdef_residency.discard('a')
+    assert synthdef_a not in synthdef_residency
+    synthdef_residency.clear()
+    assert len(synthdef_residency) == 0
+
+
+def test_batching(log, synthdef_residency):
+    synthdefs = [
+        build_synthdef(ugen_count=count, name='synthdef-{}'.format(i))
+        for i, count in enumerate((10, 50, 60, 40, 50))
+        ]
+    sizes = {x: len(x.compile()) for x in synthdefs}
+    assert all(size < 8192 for size in sizes.values())
+    synthdef_residency.allocate(synthdefs)
+    requests = log[:-1]
+    assert log[-1] == 'sync'
+    assert all(
+        isinstance(x, supriya.commands.SynthDefReceiveRequest)
+        for x in requests
+        )
+    assert sorted(
+        x.actual_name for request in requests for x in request.synthdefs
+        ) == sorted(x.actual_name for x in synthdefs)
+    totals = [sum(sizes[x] for x in request.synthdefs) for request in requests]
+    assert all(total < 8192 for total in totals)
+    assert len(requests) == -(-sum(sizes.values()) // 8192)
+
+
+def test_concurrent_allocation(monkeypatch, synthdef_residency):
+    started, release = threading.Event(), threading.Event()
+    requests = []
+
+    def communicate(request, server=None, sync=True):
+        requests.append(request)
+        started.set()
+        release.wait(5)
+
+    monkeypatch.setattr(supriya.commands.Request, 'communicate', communicate)
+    synthdef = build_synthdef(name='shared')
+    thread = threading.Thread(
+        target=synthdef_residency.allocate, args=([synthdef],))
+    thread.start()
+    started.wait(5)
+    result = []
+    waiter = threading.Thread(
+        target=lambda: result.append(synthdef_residency.allocate([synthdef])))
+    waiter.start()
+    waiter.join(0.1)
+    # The second caller waits on the first caller's send.
+    assert waiter.is_alive()
+    release.set()
+    thread.join(5)
+    waiter.join(5)
+    assert result == [()]
+    assert len(requests) == 1
+
+
+def test_pattern_playback(log, synthdef_residency):
+    synthdef = build_synthdef(name='pattern')
+    pattern = supriya.patterns.Pbind(
+        synthdef=synthdef,
+        duration=1.0,
+        frequency=supriya.patterns.Pseq([440, 660], 1),
+        )
+    player = supriya.patterns.RealtimeEventPlayer(
+        pattern,
+        server=types.SimpleNamespace(
+            node_id_allocator=supriya.realtime.NodeIdAllocator(),
+            synthdef_residency=synthdef_residency,
+            ),
+        )
+    bundle, _ = player(10, 10, communicate=False)
+    player._allocate_synthdefs(bundle.contents)
+    player._allocate_synthdefs(bundle.contents)
+    assert [type(x) for x in log] == [supriya.commands.SynthDefReceiveRequest]
+    assert synthdef in synthdef_residency
+
+
+def test_failed_send(monkeypatch, synthdef_residency):
+    synthdef_a = build_synthdef(name='a')
+    synthdef_residency.allocate([synthdef_a], sync=False)
+    synthdef_a_prime = build_synthdef(ugen_count=2, name='a')
+    synthdef_b = build_synthdef(name='b')
+
+    def communicate(request, server=None, sync=True):
+        raise OSError
+
+    monkeypatch.setattr(supriya.commands.Request, 'communicate', communicate)
+    with pytest.raises(OSError):
+        synthdef_residency.allocate([synthdef_a_prime, synthdef_b])
+    # Nothing unsent is tracked as resident.
+    assert synthdef_a in synthdef_residency
+    assert synthdef_residency.resident_names == {'a'}
+
+
+def test_probe_failures(monkeypatch, synthdef_residency):
+    import supriya.osc
+    failure = supriya.osc.OscMessage('/fail', '/s_new', 'SynthDef not found')
+    suppressed = []
+
+    def communicate(request, server=None, sync=True, timeout=1.0):
+        suppressed.append(synthdef_residency._is_probe_failure(failure))
+
+    monkeypatch.setattr(supriya.commands.Request, 'communicate', communicate)
+    monkeypatch.setattr(
+        supriya.commands.RequestBundle, 'communicate', communicate)
+    synthdef_residency.server.node_id_allocator = \
+        supriya.realtime.NodeIdAllocator()
+    synthdef_residency.server.next_sync_id = 0
+    synthdef_residency.server.register_osc_callback = lambda callback: None
+    synthdef_residency.server.unregister_osc_callback = lambda callback: None
+    assert synthdef_residency.query(['missing']) == set()
+    # Failures for probe synths are only recognized while probing.
+    assert suppressed == [True, True]
+    assert not synthdef_residency._is_probe_failure(failure)
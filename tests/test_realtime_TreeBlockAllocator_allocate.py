@@ -0,0 +1,79 @@
+import random
+import supriya.realtime
+
+
+def test_01():
+
+    allocator = supriya.realtime.TreeBlockAllocator(
+        heap_minimum=0,
+        heap_maximum=16,
+        )
+
+    assert allocator.allocate(4) == 0
+    assert allocator.allocate(4) == 4
+    assert allocator.allocate(4) == 8
+    assert allocator.allocate(4) == 12
+    assert allocator.allocate(4) is None
+
+    allocator.free(0)
+    allocator.free(4)
+    allocator.free(8)
+    allocator.free(12)
+
+    assert allocator.allocate(20) is None
+
+    assert allocator.allocate_at(4, 2) == 4
+    assert allocator.allocate(4) == 0
+    assert allocator.allocate(4) == 6
+
+    allocator.free(4)
+
+    assert allocator.allocate(1) == 4
+    assert allocator.allocate(1) == 5
+
+
+def test_02():
+    """
+    Matches BlockAllocator under a fragmentation-heavy random workload.
+    """
+    rng = random.Random(1)
+    block_allocator = supriya.realtime.BlockAllocator(
+        heap_minimum=16,
+        heap_maximum=1024,
+        )
+    tree_block_allocator = supriya.realtime.TreeBlockAllocator(
+        heap_minimum=16,
+        heap_maximum=1024,
+        )
+    allocated = []
+    for _ in range(2000):
+        if allocated and rng.random() < 0.45:
+            block_id = allocated.pop(rng.randrange(len(allocated)))
+            block_allocator.free(block_id)
+            tree_block_allocator.free(block_id)
+        elif rng.random() < 0.1:
+            index, size = rng.randrange(16, 1024), rng.randint(1, 8)
+            try:
+                expected = block_allocator.allocate_at(index, size)
+            except AssertionError:  # range lies entirely in used blocks
+                expected = None
+            assert tree_block_allocator.allocate_at(index, size) == expected
+            if expected is not None:
+                allocated.append(expected)
+        else:
+            size = rng.randint(1, 16)
+            expected = block_allocator.allocate(size)
+            assert tree_block_allocator.allocate(size) == expected
+            if expected is not None:
+                allocated.append(expected)
+
+
+def test_03():
+    """
+    Unbounded heaps never run out.
+    """
+    allocator = supriya.realtime.TreeBlockAllocator()
+    assert [allocator.allocate(8) for _ in range(4)] == [0, 8, 16, 24]
+    allocator.free(8)
+    assert allocator.allocate(16) == 32
+    assert allocator.allocate(8) == 8
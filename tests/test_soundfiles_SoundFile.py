@@ -0,0 +1,131 @@
+import aifc
+import struct
+import wave
+import numpy
+import pytest
+import supriya.soundfiles
+
+
+def build_samples(frame_count=1000, channel_count=2):
+    samples = numpy.zeros((frame_count, channel_count))
+    for channel in range(channel_count):
+        samples[:, channel] = numpy.linspace(
+            -0.5, 0.5, frame_count) * (channel + 1) / channel_count
+    return samples
+
+
+def write_pcm(file_path, samples, sample_width, module=wave):
+    scale = 2 ** (sample_width * 8 - 1)
+    integers = numpy.round(samples * scale).astype('<i4')
+    if module is wave and sample_width == 1:
+        frames = (integers + 128).astype('u1').tobytes()
+    else:
+        frames = integers.astype('<i4').view('u1').reshape(
+            samples.shape + (4,))[..., :sample_width]
+        if module is aifc:
+            frames = frames[..., ::-1]
+        frames = frames.tobytes()
+    writer = module.open(str(file_path), 'wb')
+    writer.setnchannels(samples.shape[1])
+    writer.setsampwidth(sample_width)
+    writer.setframerate(44100)
+    writer.writeframes(frames)
+    writer.close()
+
+
+def write_float_wav(file_path, samples):
+    data = samples.astype('<f4').tobytes()
+    fmt = struct.pack(
+        '<HHIIHH', 3, samples.shape[1], 48000, 48000 * 4 * samples.shape[1],
+        4 * samples.shape[1], 32)
+    with open(str(file_path), 'wb') as file_pointer:
+        file_pointer.write(b'RIFF' + struct.pack('<I', 4 + 24 + 8 + len(data)))
+        file_pointer.write(b'WAVE')
+        file_pointer.write(b'fmt ' + struct.pack('<I', len(fmt)) + fmt)
+        file_pointer.write(b'data' + struct.pack('<I', len(data)) + data)
+
+
+@pytest.mark.parametrize('module, suffix, sample_width', [
+    (wave, '.wav', 1),
+    (wave, '.wav', 2),
+    (wave, '.wav', 3),
+    (wave, '.wav', 4),
+    (aifc, '.aiff', 1),
+    (aifc, '.aiff', 2),
+    (aifc, '.aiff', 3),
+    (aifc, '.aiff', 4),
+    ])
+def test_memory_map_pcm(tmpdir, module, suffix, sample_width):
+    samples = build_samples()
+    file_path = tmpdir / 'test{}'.format(suffix)
+    write_pcm(file_path, samples, sample_width, module=module)
+    soundfile = supriya.soundfiles.SoundFile(file_path, memory_map=True)
+    assert soundfile.is_memory_mapped
+    assert soundfile.channel_count == 2
+    assert soundfile.frame_count == 1000
+    assert soundfile.sample_rate == 44100
+    tolerance = 1.0 / 2 ** (sample_width * 8 - 2)
+    assert numpy.allclose(soundfile[:], samples, atol=tolerance)
+    assert numpy.allclose(soundfile[10:20, 1], samples[10:20, 1],
+        atol=tolerance)
+    assert numpy.allclose(soundfile.at_percent(0.5), samples[500],
+        atol=tolerance)
+
+
+def test_memory_map_float(tmpdir):
+    samples = build_samples(frame_count=100001, channel_count=3)
+    file_path = tmpdir / 'test.wav'
+    write_float_wav(file_path, samples)
+    soundfile = supriya.soundfiles.SoundFile(file_path, memory_map=True)
+    assert soundfile.sample_rate == 48000
+    assert soundfile.frame_count == 100001
+    assert numpy.allclose(soundfile[-5:], samples[-5:])
+    assert numpy.allclose(
+        soundfile.get_peak(), numpy.abs(samples).max(axis=0))
+    assert numpy.allclose(
+        soundfile.get_rms(), numpy.sqrt(numpy.square(samples).mean(axis=0)))
+    peaks = soundfile.get_peak(block_size=1000)
+    assert peaks.shape == (101, 3)
+    assert numpy.allclose(peaks[:-1], numpy.abs(
+        samples[:100000]).reshape(100, 1000, 3).max(axis=1))
+    assert numpy.allclose(peaks[-1], numpy.abs(samples[-1]))
+    rms = soundfile.get_rms(block_size=1000)
+    assert rms.shape == (101, 3)
+    assert numpy.allclose(rms[:-1], numpy.sqrt(numpy.square(
+        samples[:100000]).reshape(100, 1000, 3).mean(axis=1)))
+
+
+def test_not_memory_mapped(tmpdir):
+    file_path = tmpdir / 'test.txt'
+    file_path.write('text')
+    with pytest.raises(ValueError):
+        supriya.soundfiles.SoundFile(file_path, memory_map=True)
+
+
+def test_memory_map_at_percent(tmpdir):
+    samples = numpy.linspace(0.0, 1.0, 44101).reshape(-1, 1)
+    file_path = tmpdir / 'test.wav'
+    write_float_wav(file_path, samples)
+    soundfile = supriya.soundfiles.SoundFile(file_path, memory_map=True)
+    for i in range(1, 100):
+        value = round(float(i) / 100, 2)
+        assert round(soundfile.at_percent(value)[0], 2) == value
+
+
+@pytest.mark.parametrize('module, suffix, sample_width', [
+    (wave, '.wav', 2),
+    (aifc, '.aiff', 3),
+    ])
+def test_memory_map_matches_default(tmpdir, module, suffix, sample_width):
+    samples = build_samples()
+    file_path = tmpdir / 'test{}'.format(suffix)
+    write_pcm(file_path, samples, sample_width, module=module)
+    mapped = supriya.soundfiles.SoundFile(file_path, memory_map=True)
+    default = supriya.soundfiles.SoundFile(file_path)
+    assert not default.is_memory_mapped
+    assert mapped.channel_count == default.channel_count
+    assert mapped.frame_count == default.frame_count
+    assert mapped.sample_rate == default.sample_rate
+    for percent in (0.0, 0.21, 0.41, 0.61, 0.81, 0.99):
+        assert numpy.allclose(
+            mapped.at_percent(percent), default.at_percent(percent))
@@ -0,0 +1,95 @@
+import pytest
+import types
+import supriya.commands
+import supriya.realtime
+import supriya.synthdefs
+
+
+build_synthdef = pytest.helpers.build_sin_osc_synthdef
+
+
+@pytest.fixture
+def synthdef_cache(tmpdir):
+    synthdef_cache = supriya.synthdefs.SynthDefCache(
+        directory_path=str(tmpdir.join('synthdefs')))
+    supriya.synthdefs.SynthDefCache.set_default_cache(synthdef_cache)
+    yield synthdef_cache
+    supriya.synthdefs.SynthDefCache.set_default_cache(None)
+
+
+def test_compile(synthdef_cache):
+    synthdef = build_synthdef(name='test')
+    compiler = supriya.synthdefs.SynthDefCompiler
+    assert synthdef.compile() == compiler.compile_synthdefs([synthdef])
+    assert synthdef.compile(use_anonymous_name=True) == \
+        compiler.compile_synthdefs([synthdef], use_anonymous_names=True)
+    assert synthdef in synthdef_cache
+    assert len(synthdef_cache) == 1
+    # Rebuilt synthdefs share their entry.
+    assert synthdef_cache.compile_synthdef(build_synthdef(name='test')) is \
+        synthdef.compile()
+    assert len(synthdef_cache) == 1
+
+
+def test_anonymous_name(synthdef_cache):
+    synthdef = build_synthdef()
+    assert synthdef.anonymous_name == \
+        synthdef_cache.get_anonymous_name(build_synthdef(name='named'))
+    assert synthdef.actual_name == synthdef.anonymous_name
+    assert synthdef.compile() == synthdef.compile(use_anonymous_name=True)
+
+
+def test_eviction():
+    synthdefs = [build_synthdef(ugen_count=i + 1) for i in range(4)]
+    maximum_size = sum(len(x._compiled_ugen_graph) for x in synthdefs[1:])
+    synthdef_cache = supriya.synthdefs.SynthDefCache(
+        maximum_size=maximum_size)
+    for synthdef in synthdefs:
+        synthdef_cache.get_anonymous_name(synthdef)
+    assert synthdefs[0] not in synthdef_cache
+    assert all(synthdef in synthdef_cache for synthdef in synthdefs[1:])
+    assert synthdef_cache.size <= maximum_size
+    # Lookups refresh entries.
+    synthdef_cache.get_anonymous_name(synthdefs[1])
+    synthdef_cache.compile_synthdef(synthdefs[0])
+    assert synthdefs[1] in synthdef_cache
+    assert synthdefs[2] not in synthdef_cache
+    synthdef_cache.clear()
+    assert len(synthdef_cache) == 0
+    assert synthdef_cache.size == 0
+
+
+def test_file_path(synthdef_cache):
+    synthdef = build_synthdef(name='test')
+    file_path = synthdef_cache.get_file_path(synthdef)
+    assert file_path.parent == synthdef_cache.directory_path
+    assert file_path.read_bytes() == synthdef.compile()
+    modified_time = file_path.stat().st_mtime_ns
+    synthdef_cache.clear()
+    assert synthdef_cache.get_file_path(synthdef) == file_path
+    assert file_path.stat().st_mtime_ns == modified_time
+    assert synthdef_cache.get_file_path(
+        synthdef, use_anonymous_name=True) != file_path
+    with pytest.raises(ValueError):
+        supriya.synthdefs.SynthDefCache().get_file_path(synthdef)
+
+
+def test_allocate(monkeypatch, synthdef_cache):
+    requests = []
+    monkeypatch.setattr(
+        supriya.commands.Request,
+        'communicate',
+        lambda request, server=None, sync=True: requests.append(request),
+        )
+    synthdef_residency = supriya.realtime.SynthDefResidency(
+        types.SimpleNamespace(sync=lambda: None))
+    small_synthdef = build_synthdef(name='small')
+    large_synthdef = build_synthdef(ugen_count=500, name='large')
+    assert 8192 < len(large_synthdef.compile())
+    synthdef_residency.allocate([small_synthdef, large_synthdef])
+    assert [type(x) for x in requests] == [
+        supriya.commands.SynthDefReceiveRequest,
+        supriya.commands.SynthDefLoadRequest,
+        ]
+    assert requests[1].synthdef_path == str(
+        synthdef_cache.get_file_path(large_synthdef))
@@ -1,3 +1,4 @@
+import collections
 import supriya.synthdefs
 import supriya.ugens
 
@@ -61,3 +62,198 @@ def test_SynthDefCompiler_optimization_01():
 
     assert sc_compiled_synthdef == test_compiled_synthdef
     assert py_compiled_synthdef == test_compiled_synthdef
+
+
+def test_SynthDefCompiler_optimization_02():
+    """
+    Operators on constants fold into constants.
+    """
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        frequency = supriya.ugens.BinaryOpUGen._new_single(
+            calculation_rate=supriya.synthdefs.CalculationRate.SCALAR,
+            left=220,
+            right=2,
+            special_index=supriya.synthdefs.BinaryOperator.MULTIPLICATION,
+            )
+        phase = supriya.ugens.UnaryOpUGen._new_single(
+            calculation_rate=supriya.synthdefs.CalculationRate.SCALAR,
+            source=0.5,
+            special_index=supriya.synthdefs.UnaryOperator.NEGATIVE,
+            )
+        sine = supriya.ugens.SinOsc.ar(frequency=frequency, phase=phase)
+        supriya.ugens.Out.ar(bus=0, source=sine)
+    py_synthdef = builder.build('folded')
+
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        sine = supriya.ugens.SinOsc.ar(frequency=440, phase=-0.5)
+        supriya.ugens.Out.ar(bus=0, source=sine)
+    test_synthdef = builder.build('folded')
+
+    assert py_synthdef.compile() == test_synthdef.compile()
+    # Division by zero is left to the server.
+    ugen = supriya.ugens.BinaryOpUGen._new_single(
+        calculation_rate=supriya.synthdefs.CalculationRate.SCALAR,
+        left=1,
+        right=0,
+        special_index=supriya.synthdefs.BinaryOperator.FLOAT_DIVISION,
+        )
+    assert isinstance(ugen, supriya.ugens.BinaryOpUGen)
+
+
+def test_SynthDefCompiler_optimization_03():
+    """
+    Sorting is linear and matches the list-scanning sort it replaced.
+    """
+    def sort_by_scanning(ugens):
+        sort_bundles = supriya.synthdefs.SynthDef._initialize_topological_sort(
+            ugens)
+        available_ugens = []
+        for ugen in reversed(ugens):
+            if not sort_bundles[ugen].antecedents:
+                available_ugens.append(ugen)
+        out_stack = []
+        while available_ugens:
+            ugen = available_ugens.pop()
+            for descendant in reversed(sort_bundles[ugen].descendants):
+                sort_bundles[descendant].antecedents.remove(ugen)
+                if not sort_bundles[descendant].antecedents and \
+                    descendant not in available_ugens:
+                    available_ugens.append(descendant)
+            out_stack.append(ugen)
+        return out_stack
+
+    with supriya.synthdefs.SynthDefBuilder(frequency=440) as builder:
+        source = supriya.ugens.In.ar(bus=0, channel_count=4)
+        for i in range(20):
+            chain = supriya.ugens.FFT(source=source[i % 4])
+            chain = supriya.ugens.PV_BrickWall(pv_chain=chain, wipe=0.1)
+            source = supriya.ugens.IFFT.ar(pv_chain=chain) * 0.5 + \
+                supriya.ugens.SinOsc.ar(frequency=builder['frequency'] * i)
+            source = supriya.ugens.Pan4.ar(source=source)
+        supriya.ugens.Out.ar(bus=0, source=source)
+    synthdef = builder.build()
+    ugens = list(reversed(synthdef.ugens))
+    assert supriya.synthdefs.SynthDef._sort_ugens_topologically(ugens) == \
+        sort_by_scanning(ugens)
+
+
+def test_SynthDefCompiler_optimization_04():
+    """
+    Level-two optimization merges pure ugens with the same inputs, but not
+    ugens with side effects.
+    """
+    with supriya.synthdefs.SynthDefBuilder(frequency=440) as builder:
+        sine_a = supriya.ugens.SinOsc.ar(frequency=builder['frequency'])
+        sine_b = supriya.ugens.SinOsc.ar(frequency=builder['frequency'])
+        noise_a = supriya.ugens.WhiteNoise.ar()
+        noise_b = supriya.ugens.WhiteNoise.ar()
+        supriya.ugens.DetectSilence.ar(source=sine_a, done_action=2)
+        supriya.ugens.DetectSilence.ar(source=sine_b, done_action=2)
+        supriya.ugens.Out.ar(
+            bus=0,
+            source=[sine_a * 0.5 + noise_a, sine_b * 0.5 + noise_b],
+            )
+    assert collections.Counter(
+        type(_).__name__ for _ in builder.build().ugens
+        ) == {
+        'BinaryOpUGen': 4,
+        'Control': 1,
+        'DetectSilence': 2,
+        'Out': 1,
+        'SinOsc': 2,
+        'WhiteNoise': 2,
+        }
+    assert collections.Counter(
+        type(_).__name__ for _ in builder.build(optimize=2).ugens
+        ) == {
+        'BinaryOpUGen': 3,
+        'Control': 1,
+        'DetectSilence': 2,
+        'Out': 1,
+        'SinOsc': 1,
+        'WhiteNoise': 2,
+        }
+
+
+def test_SynthDefCompiler_optimization_05():
+    """
+    Level-two optimization removes identity operators and fuses
+    multiply-adds.
+    """
+    with supriya.synthdefs.SynthDefBuilder(amplitude=0.5) as builder:
+        sine = supriya.ugens.SinOsc.ar()
+        product = supriya.ugens.BinaryOpUGen(
+            calculation_rate=supriya.synthdefs.CalculationRate.AUDIO,
+            left=sine,
+            right=1.0,
+            special_index=supriya.synthdefs.BinaryOperator.MULTIPLICATION,
+            )
+        source = product * builder['amplitude'] + supriya.ugens.Dust.kr()
+        supriya.ugens.Out.ar(bus=0, source=source)
+    py_synthdef = builder.build('fused', optimize=2)
+
+    with supriya.synthdefs.SynthDefBuilder(amplitude=0.5) as builder:
+        source = supriya.ugens.MulAdd.new(
+            source=supriya.ugens.SinOsc.ar(),
+            multiplier=builder['amplitude'],
+            addend=supriya.ugens.Dust.kr(),
+            )
+        supriya.ugens.Out.ar(bus=0, source=source)
+    test_synthdef = builder.build('fused')
+
+    assert py_synthdef.compile() == test_synthdef.compile()
+
+
+def test_SynthDefCompiler_optimization_06():
+    """
+    Building again builds the same SynthDef.
+    """
+    with supriya.synthdefs.SynthDefBuilder(frequency=440) as builder:
+        sine = supriya.ugens.SinOsc.ar(frequency=builder['frequency'])
+        supriya.ugens.Out.ar(bus=0, source=sine * 0.5 + 0.25)
+    ugens = list(builder._ugens)
+    synthdefs = [
+        builder.build(optimize=optimize)
+        for optimize in (False, True, 2, True)
+        ]
+    assert builder._ugens == ugens
+    assert synthdefs[0] == synthdefs[1] == synthdefs[3]
+    assert len(synthdefs[2].ugens) < len(synthdefs[1].ugens)
+
+
+def test_SynthDefCompiler_optimization_07():
+    """
+    Level-two optimization does not merge random operators, whose equal
+    inputs still draw independent values.
+    """
+    audio = supriya.synthdefs.CalculationRate.AUDIO
+    rand2 = supriya.synthdefs.UnaryOperator.RAND2
+    rand_range = supriya.synthdefs.BinaryOperator.RANDRANGE
+    with supriya.synthdefs.SynthDefBuilder(frequency=440) as builder:
+        sine = supriya.ugens.SinOsc.ar(frequency=builder['frequency'])
+        supriya.ugens.Out.ar(
+            bus=0,
+            source=[
+                supriya.ugens.UnaryOpUGen(
+                    calculation_rate=audio, source=sine, special_index=rand2),
+                supriya.ugens.UnaryOpUGen(
+                    calculation_rate=audio, source=sine, special_index=rand2),
+                supriya.ugens.BinaryOpUGen(
+                    calculation_rate=audio, left=sine, right=1,
+                    special_index=rand_range),
+                supriya.ugens.BinaryOpUGen(
+                    calculation_rate=audio, left=sine, right=1,
+                    special_index=rand_range),
+                ],
+            )
+    for optimize in (1, 2):
+        assert collections.Counter(
+            (type(_).__name__, _.special_index)
+            for _ in builder.build(optimize=optimize).ugens
+            ) == {
+            ('Control', 0): 1,
+            ('SinOsc', 0): 1,
+            ('UnaryOpUGen', 38): 2,
+            ('BinaryOpUGen', 47): 2,
+            ('Out', 0): 1,
+            }
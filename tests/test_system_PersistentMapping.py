@@ -0,0 +1,52 @@
+import random
+import supriya.system
+
+
+def test_01():
+    """
+    Random edits to a persistent mapping and its copies match dicts.
+    """
+    random_ = random.Random(0)
+    mappings = [supriya.system.PersistentMapping()]
+    dicts = [{}]
+    for _ in range(5000):
+        index = random_.randrange(len(mappings))
+        mapping, dict_ = mappings[index], dicts[index]
+        key = random_.randrange(200)
+        choice = random_.random()
+        if choice < 0.1:
+            mappings.append(mapping.copy())
+            dicts.append(dict_.copy())
+        elif choice < 0.4 and key in dict_:
+            del(mapping[key])
+            del(dict_[key])
+        else:
+            mapping[key] = dict_[key] = random_.random()
+    for mapping, dict_ in zip(mappings, dicts):
+        assert len(mapping) == len(dict_)
+        assert dict(mapping.items()) == dict_
+        assert mapping == dict_
+    for mapping_one, dict_one in zip(mappings, dicts):
+        for mapping_two, dict_two in zip(mappings, dicts):
+            assert (mapping_one == mapping_two) == (dict_one == dict_two)
+
+
+def test_02():
+    """
+    Copies share structure until written to.
+    """
+    mapping = supriya.system.PersistentMapping((i, i) for i in range(5000))
+    copied_mapping = mapping.copy()
+    copied_mapping[0] = 'changed'
+    shared_leaves = sum(
+        leaf_one is leaf_two
+        for branch_one, branch_two in zip(
+            mapping._branches, copied_mapping._branches)
+        for leaf_one, leaf_two in zip(branch_one, branch_two)
+        )
+    assert shared_leaves == 1023
+    assert mapping[0] == 0
+    assert copied_mapping[0] == 'changed'
+    assert mapping != copied_mapping
+    copied_mapping[0] = 0
+    assert mapping == copied_mapping
@@ -0,0 +1,48 @@
+import bisect
+import random
+import pytest
+import supriya.system
+
+
+def test_01():
+    """
+    Random edits and lookups match a plain sorted list.
+    """
+    random_ = random.Random(0)
+    sorted_list = supriya.system.SortedList()
+    items = []
+    for _ in range(20000):
+        item = random_.randrange(3000)
+        if item in items and random_.random() < 0.4:
+            sorted_list.remove(item)
+            items.remove(item)
+        elif item not in items:
+            sorted_list.add(item)
+            bisect.insort(items, item)
+    assert sorted_list == items
+    assert list(reversed(sorted_list)) == items[::-1]
+    assert 1 < len(sorted_list._blocks)
+    for item in range(-1, 3001):
+        assert (item in sorted_list) == (item in items)
+        index = bisect.bisect_left(items, item)
+        expected = items[index - 1] if index else None
+        assert sorted_list.lower(item) == expected
+        index = bisect.bisect_right(items, item)
+        expected = items[index] if index < len(items) else None
+        assert sorted_list.higher(item) == expected
+    assert list(sorted_list.irange(1000, 2000)) == [
+        item for item in items if 1000 <= item <= 2000]
+    assert sorted_list[len(items) // 2] == items[len(items) // 2]
+    assert sorted_list[-1] == items[-1]
+    assert sorted_list[1:10] == items[1:10]
+
+
+def test_02():
+    sorted_list = supriya.system.SortedList([1, 2])
+    with pytest.raises(ValueError):
+        sorted_list.remove(3)
+    with pytest.raises(ValueError):
+        sorted_list.remove(1.5)
+    assert sorted_list.lower(1) is None
+    assert sorted_list.higher(2) is None
+    assert list(sorted_list.irange(3, 4)) == []